@@ -1,6 +1,7 @@
-"""Background jobs using Celery."""
+"""Background jobs: Celery tasks and the in-process timer scheduler."""
 
 from app.backgroundjobs.celery_app import celery_app
 from app.backgroundjobs.timer_tasks import check_timers
+from app.backgroundjobs.timer_scheduler import TimerScheduler
 
-__all__ = ["celery_app", "check_timers"]
+__all__ = ["celery_app", "check_timers", "TimerScheduler"]
@@ -18,7 +18,8 @@ celery_app.conf.update(
     result_serializer="json",
     timezone="UTC",
     enable_utc=True,
-    beat_schedule={
+    # The API's timer scheduler fires timers on time; polling is only the fallback
+    beat_schedule={} if settings.TIMER_SCHEDULER_ENABLED else {
         "check-timers-every-10-seconds": {
             "task": "app.backgroundjobs.timer_tasks.check_timers",
             "schedule": 10.0,
@@ -0,0 +1,212 @@
+"""In-process scheduler that fires timers at their trigger time."""
+
+import asyncio
+import heapq
+import json
+import logging
+from datetime import datetime, timedelta
+import asyncpg
+from sqlalchemy.engine import make_url
+from app.core.config import get_settings
+from app.core.database import AsyncSessionLocal
+from app.models import TIMER_CHANNEL
+from app.services.timer import CLAIM_BATCH_SIZE, TimerService, in_shard, timer_message
+from app.utils.metrics import metrics
+from app.websockets.pubsub import publish_notifications
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Pause before retrying after the database fails, so outages don't spin the loop
+RETRY_SECONDS = 1.0
+
+
+class TimerScheduler:
+    """Fire pending timers from an in-memory heap, sleeping until the next one is due.
+
+    The heap holds timers due within `horizon`; it is reloaded from the database on
+    start and every half horizon, which also recovers anything missed. In between,
+    NOTIFY on TIMER_CHANNEL (sent by a trigger on `timers`) adds new and moved timers
+    and drops cancelled ones, waking the loop if the next timer changed.
+    """
+
+    def __init__(
+        self,
+        session_factory=AsyncSessionLocal,
+        listen_url: str | None = None,
+        horizon: timedelta | None = None,
+        shard: tuple[int, int] = (settings.TIMER_SHARD_INDEX, settings.TIMER_SHARD_COUNT),
+    ):
+        self.session_factory = session_factory
+        self.listen_url = listen_url or settings.DATABASE_LISTEN_URL or settings.DATABASE_URL
+        self.horizon = horizon or timedelta(seconds=settings.TIMER_SCHEDULER_HORIZON_SECONDS)
+        # (index, count): only timers of users with user_id % count == index are scheduled here
+        self.shard = shard
+        self._heap: list[tuple[datetime, int]] = []
+        # Timer id -> trigger time it's scheduled for; heap entries that disagree are stale
+        self._scheduled: dict[int, datetime] = {}
+        self._loaded_until = datetime.min
+        self._reload_at = datetime.min
+        self._wake = asyncio.Event()
+        self._listener: asyncpg.Connection | None = None
+        self._task: asyncio.Task | None = None
+
+    def schedule(self, timer_id: int, trigger_time: datetime):
+        """Add or move a timer; ones due after the loaded horizon wait for the next reload."""
+        if trigger_time > self._loaded_until:
+            self._scheduled.pop(timer_id, None)
+            return
+        if self._scheduled.get(timer_id) == trigger_time:
+            return
+        self._scheduled[timer_id] = trigger_time
+        heapq.heappush(self._heap, (trigger_time, timer_id))
+        if self._heap[0] == (trigger_time, timer_id):
+            self._wake.set()
+
+    def unschedule(self, timer_id: int):
+        """Forget a timer; its heap entry is discarded when it reaches the top."""
+        self._scheduled.pop(timer_id, None)
+
+    def pop_due(self, now: datetime) -> list[tuple[datetime, int]]:
+        """Remove and return the (trigger_time, id) of every scheduled timer due by `now`."""
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            trigger_time, timer_id = heapq.heappop(self._heap)
+            if self._scheduled.get(timer_id) == trigger_time:
+                del self._scheduled[timer_id]
+                due.append((trigger_time, timer_id))
+        return due
+
+    def next_due(self) -> datetime | None:
+        """Trigger time of the next scheduled timer."""
+        while self._heap and self._scheduled.get(self._heap[0][1]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+        return self._heap[0][0] if self._heap else None
+
+    async def reload(self):
+        """Schedule every pending timer due within the horizon, overdue ones included."""
+        until = datetime.utcnow() + self.horizon
+        # Raised first, so timers announced while the query runs aren't dropped
+        self._loaded_until = until
+        async with self.session_factory() as db:
+            pending = await TimerService.get_pending_schedule(db, until, in_shard(*self.shard))
+        for timer_id, trigger_time in pending:
+            self.schedule(timer_id, trigger_time)
+        self._reload_at = until - self.horizon / 2
+
+    async def fire(self, due: list[tuple[datetime, int]]):
+        """Lease and fire due timers a batch at a time, then publish their notifications together."""
+        timer_ids = [timer_id for _, timer_id in due]
+        fired = []
+        async with self.session_factory() as db:
+            for start in range(0, len(timer_ids), CLAIM_BATCH_SIZE):
+                leased = await TimerService.lease_timers(db, timer_ids[start:start + CLAIM_BATCH_SIZE])
+                await db.commit()
+                if leased:
+                    fired += await TimerService.complete_timers(db, leased)
+                    await db.commit()
+
+        now = datetime.utcnow()
+        for timer in fired:
+            metrics.observe("timer.fire_lag", (now - timer.trigger_time).total_seconds())
+        await publish_notifications([(timer.user_id, timer_message(timer)) for timer in fired])
+        metrics.increment("timer.fired", len(fired))
+        if fired:
+            logger.info(f"Fired {len(fired)} timers")
+
+    async def start(self):
+        """Start the scheduling loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop the scheduling loop and close the LISTEN connection."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._listener is not None:
+            await self._listener.close()
+            self._listener = None
+
+    async def _listen(self):
+        """Open the LISTEN connection if it isn't open."""
+        if self._listener is not None and not self._listener.is_closed():
+            return
+        url = make_url(self.listen_url).set(drivername="postgresql")
+        self._listener = await asyncpg.connect(url.render_as_string(hide_password=False))
+        await self._listener.add_listener(TIMER_CHANNEL, self._on_notify)
+        self._listener.add_termination_listener(self._on_terminate)
+
+    def _on_notify(self, connection, pid, channel, payload: str):
+        change = json.loads(payload)
+        index, count = self.shard
+        if change["user_id"] % count != index:
+            return
+        if change["pending"]:
+            self.schedule(change["id"], datetime.fromisoformat(change["trigger_time"]))
+        else:
+            self.unschedule(change["id"])
+
+    def _on_terminate(self, connection):
+        # Changes announced while disconnected are lost: reconnect and reload now
+        self._reload_at = datetime.min
+        self._wake.set()
+
+    async def _run(self):
+        while True:
+            self._wake.clear()
+            due = []
+            try:
+                now = datetime.utcnow()
+                if now >= self._reload_at:
+                    await self._listen()
+                    await self.reload()
+                due = self.pop_due(now)
+                if due:
+                    await self.fire(due)
+                    continue
+            except Exception as e:
+                logger.error(f"Timer scheduler error: {e}")
+                for trigger_time, timer_id in due:
+                    self.schedule(timer_id, trigger_time)
+                await asyncio.sleep(RETRY_SECONDS)
+                continue
+
+            wake_at = self._reload_at
+            next_due = self.next_due()
+            if next_due is not None:
+                wake_at = min(wake_at, next_due)
+            delay = (wake_at - datetime.utcnow()).total_seconds()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._wake.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+
+
+timer_scheduler: TimerScheduler | None = None
+
+
+async def start_timer_scheduler() -> TimerScheduler:
+    """Start the application-scoped timer scheduler."""
+    global timer_scheduler
+
+    if timer_scheduler is None:
+        timer_scheduler = TimerScheduler()
+        await timer_scheduler.start()
+        logger.info("Timer scheduler started")
+    return timer_scheduler
+
+
+async def stop_timer_scheduler():
+    """Stop the application-scoped timer scheduler."""
+    global timer_scheduler
+
+    if timer_scheduler is not None:
+        await timer_scheduler.stop()
+        timer_scheduler = None
+        logger.info("Timer scheduler stopped")
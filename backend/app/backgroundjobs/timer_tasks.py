@@ -1,66 +1,72 @@
 """Timer background tasks."""
 
 import logging
+from datetime import datetime
+from sqlalchemy.orm import Session
 from app.backgroundjobs.celery_app import celery_app
+from app.core.config import get_settings
 from app.core.database import get_sync_db
+from app.models import Timer
+from app.services.timer import (
+    CLAIM_BATCH_SIZE,
+    WORKER_ID,
+    complete_leased_timers,
+    in_shard,
+    lease_timers,
+    notifications_for,
+    timer_message,
+)
+from app.websockets.pubsub import publish_notifications_sync
 
 logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+def fire_due_timers(
+    db: Session,
+    now: datetime,
+    worker: str = WORKER_ID,
+    shard: tuple[int, int] = (settings.TIMER_SHARD_INDEX, settings.TIMER_SHARD_COUNT),
+    batch_size: int = CLAIM_BATCH_SIZE,
+) -> list[Timer]:
+    """Fire every timer due by `now` in this worker's (index, count) shard, a batch at a time.
+
+    A batch is leased and committed, then completed with its notifications in a second
+    transaction. Workers running concurrently fire each timer exactly once; a batch
+    left leased by a worker that died is taken over when its lease expires.
+    """
+    fired = []
+    while True:
+        query = lease_timers(worker, now, Timer.trigger_time <= now, in_shard(*shard), limit=batch_size)
+        leased = list(db.execute(query).scalars().all())
+        db.commit()
+        if leased:
+            batch = list(db.execute(complete_leased_timers(worker, leased)).scalars().all())
+            if batch:
+                db.execute(notifications_for(batch))
+            db.commit()
+            fired += batch
+        if len(leased) < batch_size:
+            return fired
 
 
 @celery_app.task
 def check_timers():
-    """Check for triggered timers and mark them as completed."""
+    """Fire triggered timers and notify their users."""
     db = next(get_sync_db())
-    
+
     try:
-        # Get triggered timers (synchronous version)
-        from sqlalchemy import select
-        from app.models import Timer, TimerStatus
-        from datetime import datetime
-        
-        query = select(Timer).where(
-            Timer.status == TimerStatus.ACTIVE,
-            Timer.trigger_time <= datetime.utcnow(),
-            Timer.is_notified == False,
-        )
-        result = db.execute(query)
-        timers = list(result.scalars().all())
-        
-        for timer in timers:
-            timer.status = TimerStatus.COMPLETED
-            timer.is_notified = True
-            timer.completed_at = datetime.utcnow()
-            
-            # Create notification
-            from app.models.notification import Notification
-            notification_msg = f"⏰ Timer finished: {timer.label}" if timer.label else "⏰ Timer finished!"
-            notification = Notification(
-                user_id=timer.user_id,
-                message=notification_msg,
-            )
-            db.add(notification)
-            db.commit()
-            
-            # Send WebSocket notification
-            from app.websockets.manager import manager
-            import asyncio
-            try:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                loop.run_until_complete(manager.send_notification(timer.user_id, notification_msg))
-                loop.close()
-            except Exception as e:
-                logger.error(f"Failed to send WebSocket notification: {e}")
-            
-            logger.info(f"Timer {timer.id} triggered for user {timer.user_id}: {notification_msg}")
-        
-        if timers:
-            logger.info(f"Processed {len(timers)} triggered timers")
-        
-        return len(timers)
-    
+        fired = fire_due_timers(db, datetime.utcnow())
     except Exception as e:
         logger.error(f"Error checking timers: {e}")
         db.rollback()
+        return 0
     finally:
         db.close()
+
+    if fired:
+        # Published for the API workers, which hold the WebSockets
+        publish_notifications_sync([(timer.user_id, timer_message(timer)) for timer in fired])
+        logger.info(f"Processed {len(fired)} triggered timers")
+
+    return len(fired)
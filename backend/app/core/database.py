@@ -1,22 +1,100 @@
 """Database connection and session management."""
 
-from sqlalchemy import create_engine
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+import time
+from uuid import uuid4
+from sqlalchemy import create_engine, exc
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool
 from app.core.config import get_settings
+from app.utils.metrics import metrics
 
 settings = get_settings()
 
+
+class PoolMetrics:
+    """Pool mixin recording, under `metrics_name`, how long checkouts take and how many time out.
+
+    Checkout time covers waiting for a free connection, opening a new one and the
+    pre-ping, so pool exhaustion shows up here rather than as unexplained latency.
+    """
+
+    metrics_name = "db.pool"
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            metrics.increment(f"{self.metrics_name}.timeout")
+            raise
+        finally:
+            metrics.observe(f"{self.metrics_name}.checkout", time.perf_counter() - start)
+
+
+class InstrumentedAsyncPool(PoolMetrics, AsyncAdaptedQueuePool):
+    """Queue pool for the async engine."""
+
+
+class InstrumentedNullPool(PoolMetrics, NullPool):
+    """Unpooled connections for the async engine, when PgBouncer does the pooling."""
+
+
+class InstrumentedSyncPool(PoolMetrics, QueuePool):
+    """Queue pool for the sync (Celery) engine."""
+
+    metrics_name = "db.sync_pool"
+
+
+def register_pool_gauges(engine):
+    """Export a queue pool's checked-out, idle and overflow connection counts as gauges.
+
+    Reads `engine.pool` each time, so the gauges follow the pool across `dispose()`.
+    """
+    engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+    name = engine.pool.metrics_name
+    metrics.gauge(f"{name}.checked_out", lambda: engine.pool.checkedout())
+    metrics.gauge(f"{name}.idle", lambda: engine.pool.checkedin())
+    metrics.gauge(f"{name}.overflow", lambda: max(0, engine.pool.overflow()))
+
+
+def asyncpg_connect_args(statement_cache_size: int, pgbouncer: bool) -> dict:
+    """asyncpg connection arguments for the statement cache size and PgBouncer mode.
+
+    PgBouncer in transaction mode hands each transaction any server connection, so
+    statements prepared on one can't be reused (or their names) on another.
+    """
+    if pgbouncer:
+        return {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+        }
+    return {"prepared_statement_cache_size": statement_cache_size}
+
+
+if settings.DB_PGBOUNCER:
+    pool_options = {"poolclass": InstrumentedNullPool}
+else:
+    pool_options = {
+        "poolclass": InstrumentedAsyncPool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
+
 # Create async engine
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.DEBUG,
     future=True,
-    pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10,
-    pool_recycle=3600,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    connect_args=asyncpg_connect_args(settings.DB_STATEMENT_CACHE_SIZE, settings.DB_PGBOUNCER),
+    **pool_options,
 )
+if not settings.DB_PGBOUNCER:
+    register_pool_gauges(engine)
 
 # Create async session factory
 AsyncSessionLocal = async_sessionmaker(
@@ -25,15 +103,18 @@ AsyncSessionLocal = async_sessionmaker(
     expire_on_commit=False,
 )
 
-# Sync engine for Celery tasks
+# Sync engine for Celery tasks (psycopg2 doesn't prepare statements, so it's PgBouncer-safe)
 sync_engine = create_engine(
     settings.DATABASE_URL.replace("+asyncpg", ""),
     echo=settings.DEBUG,
-    pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10,
-    pool_recycle=3600,
+    poolclass=InstrumentedSyncPool,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    pool_size=settings.DB_SYNC_POOL_SIZE,
+    max_overflow=settings.DB_SYNC_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
 )
+register_pool_gauges(sync_engine)
 
 # Sync session factory for Celery
 SyncSessionLocal = sessionmaker(
@@ -3,28 +3,40 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import get_settings
 from app.core.database import get_db
+from app.services.principal_cache import Principal, principal_cache
 from app.utils.auth import verify_access_token
 from app.models import User
 from sqlalchemy import select
 
 security = HTTPBearer()
+settings = get_settings()
 
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: AsyncSession = Depends(get_db)
-) -> User:
-    """Get current authenticated user from JWT token."""
-    token = credentials.credentials
-    user_id = verify_access_token(token)
-    
+def get_token_user_id(credentials: HTTPAuthorizationCredentials = Depends(security)) -> int:
+    """Get the user id from a valid access token, without checking the user."""
+    user_id = verify_access_token(credentials.credentials)
+
     if not user_id:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or expired token"
         )
-    
+
+    return user_id
+
+
+async def get_current_user(
+    user_id: int = Depends(get_token_user_id),
+    db: AsyncSession = Depends(get_db)
+) -> Principal:
+    """Get current authenticated user from JWT token."""
+    if settings.PRINCIPAL_CACHE_ENABLED:
+        principal = await principal_cache.get(user_id)
+        if principal is not None:
+            return principal
+
     query = select(User).where(User.id == user_id, User.is_active == True)
     result = await db.execute(query)
     user = result.scalar_one_or_none()
@@ -34,5 +46,24 @@ async def get_current_user(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found"
         )
-    
-    return user
+
+    principal = Principal(id=user.id, name=user.name, email=user.email, is_active=user.is_active)
+    if settings.PRINCIPAL_CACHE_ENABLED:
+        await principal_cache.set(principal)
+    return principal
+
+
+async def get_current_user_id(
+    user_id: int = Depends(get_token_user_id),
+    db: AsyncSession = Depends(get_db)
+) -> int:
+    """Get the current user's id, for routes that need nothing else about the user.
+
+    With AUTH_STATELESS the verified token is trusted as-is; otherwise the user must
+    still be active (served from the principal cache when possible).
+    """
+    if settings.AUTH_STATELESS:
+        return user_id
+
+    principal = await get_current_user(user_id, db)
+    return principal.id
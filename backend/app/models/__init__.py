@@ -6,7 +6,7 @@ from app.models.reminder import Reminder, ReminderStatus
 from app.models.email_log import EmailLog, EmailStatus
 from app.models.task import Task, TaskPriority, TaskStatus
 from app.models.user import User, RefreshToken
-from app.models.timer import Timer, TimerType, TimerStatus
+from app.models.timer import PENDING_TIMER, TIMER_CHANNEL, Timer, TimerType, TimerStatus
 from app.models.notification import Notification
 
 __all__ = [
@@ -24,5 +24,7 @@ __all__ = [
     "Timer",
     "TimerType",
     "TimerStatus",
+    "PENDING_TIMER",
+    "TIMER_CHANNEL",
     "Notification",
 ]
@@ -1,10 +1,16 @@
 """Calendar event models."""
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Computed, Integer, String, DateTime, Text, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import TSRANGE
+from sqlalchemy.orm import deferred, relationship
 from app.core.database import Base
 
+TIME_RANGE = (
+    "tsrange(start_time, greatest(start_time, end_time), "
+    "CASE WHEN end_time > start_time THEN '[)' ELSE '[]' END)"
+)
+
 
 class CalendarEvent(Base):
     """Calendar event model."""
@@ -12,12 +18,23 @@ class CalendarEvent(Base):
     __tablename__ = "calendar_events"
     
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     title = Column(String(255), nullable=False)
     start_time = Column(DateTime, nullable=False)
     end_time = Column(DateTime, nullable=False)
     description = Column(Text, nullable=True)
     attendees = Column(Text, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
+    # [start_time, end_time), maintained by the database for overlap queries; a zero-length
+    # (or inverted) event is the instant [start_time, start_time] rather than an empty range
+    time_range = deferred(Column(
+        TSRANGE,
+        Computed(TIME_RANGE, persisted=True),
+    ))
     
     user = relationship("User", back_populates="calendar_events")
+
+    __table_args__ = (
+        Index("ix_calendar_events_user_id_start_time_end_time", "user_id", "start_time", "end_time"),
+        Index("ix_calendar_events_time_range", "time_range", postgresql_using="gist"),
+    )
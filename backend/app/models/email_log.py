@@ -1,7 +1,7 @@
 """Email log models."""
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, DateTime, Enum, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, Enum, ForeignKey, Index
 import enum
 from app.core.database import Base
 
@@ -18,9 +18,11 @@ class EmailLog(Base):
     __tablename__ = "email_logs"
     
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
     recipient = Column(String(255), nullable=False)
     subject = Column(String(500), nullable=False)
     body = Column(Text, nullable=False)
     status = Column(Enum(EmailStatus), nullable=False)
     sent_at = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (Index("ix_email_logs_user_id_sent_at_id", "user_id", "sent_at", "id"),)
@@ -1,10 +1,14 @@
 """Note models."""
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, Text, DateTime, String, ForeignKey
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Computed, Integer, Text, DateTime, String, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import ARRAY, TSVECTOR
+from sqlalchemy.orm import deferred, relationship
 from app.core.database import Base
 
+# Text search configuration for note content; queries must use the same one to hit the index
+SEARCH_CONFIG = "english"
+
 
 class Note(Base):
     """Note model."""
@@ -12,10 +16,30 @@ class Note(Base):
     __tablename__ = "notes"
     
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     content = Column(Text, nullable=False)
     tags = Column(String(500), nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # Maintained by the database from content and tags; not loaded unless asked for
+    search_vector = deferred(Column(
+        TSVECTOR,
+        Computed(
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', content), 'A') || "
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(tags, '')), 'B')",
+            persisted=True,
+        ),
+    ))
+    # Lower-cased, trimmed tags from the comma-separated `tags` string
+    tag_array = deferred(Column(
+        ARRAY(Text),
+        Computed(r"regexp_split_to_array(lower(btrim(tags, ' ,')), '\s*,\s*')", persisted=True),
+    ))
     
     user = relationship("User", back_populates="notes")
+
+    __table_args__ = (
+        Index("ix_notes_user_id_created_at_id", "user_id", "created_at", "id"),
+        Index("ix_notes_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_notes_tag_array", "tag_array", postgresql_using="gin"),
+    )
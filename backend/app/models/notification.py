@@ -12,6 +12,8 @@ class Notification(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    # The timer this notifies about; unique, so a timer is never notified twice
+    timer_id = Column(Integer, ForeignKey("timers.id", ondelete="SET NULL"), nullable=True, unique=True)
     message = Column(String, nullable=False)
     is_read = Column(Boolean, default=False, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
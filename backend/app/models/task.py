@@ -1,7 +1,7 @@
 """Task models."""
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, Enum, Boolean, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Enum, Boolean, ForeignKey, Index
 from sqlalchemy.orm import relationship
 import enum
 from app.core.database import Base
@@ -27,7 +27,7 @@ class Task(Base):
     __tablename__ = "tasks"
     
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     title = Column(String(500), nullable=False)
     description = Column(String(2000), nullable=True)
     priority = Column(Enum(TaskPriority), default=TaskPriority.MEDIUM)
@@ -37,3 +37,8 @@ class Task(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     
     user = relationship("User", back_populates="tasks")
+
+    __table_args__ = (
+        Index("ix_tasks_user_id_created_at_id", "user_id", "created_at", "id"),
+        Index("ix_tasks_user_id_status_created_at_id", "user_id", "status", "created_at", "id"),
+    )
@@ -2,7 +2,7 @@
 
 import enum
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, Enum, ForeignKey, Boolean
+from sqlalchemy import DDL, Column, Integer, String, DateTime, Enum, ForeignKey, Boolean, Index, and_, event, false, literal_column
 from sqlalchemy.orm import relationship
 from app.core.database import Base
 
@@ -25,7 +25,7 @@ class Timer(Base):
     __tablename__ = "timers"
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     type = Column(Enum(TimerType), nullable=False)
     duration_seconds = Column(Integer, nullable=True)  # For timers
     trigger_time = Column(DateTime, nullable=False)
@@ -34,5 +34,44 @@ class Timer(Base):
     is_notified = Column(Boolean, default=False, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     completed_at = Column(DateTime, nullable=True)
+    # Worker processing the timer, and until when; another worker may take over after that
+    leased_by = Column(String, nullable=True)
+    lease_expires_at = Column(DateTime, nullable=True)
 
     user = relationship("User", back_populates="timers")
+
+    __table_args__ = (Index("ix_timers_user_id_trigger_time_id", "user_id", "trigger_time", "id"),)
+
+
+# Timers still waiting to fire. Values are literal so queries match the partial index
+# predicate even under generic prepared-statement plans.
+PENDING_TIMER = and_(Timer.status == literal_column("'ACTIVE'"), Timer.is_notified == false())
+
+Index("ix_timers_pending_trigger_time", Timer.trigger_time, postgresql_where=PENDING_TIMER)
+
+# Channel on which every new, moved, fired or cancelled timer is announced to schedulers,
+# as {"id", "user_id", "trigger_time", "pending"}
+TIMER_CHANNEL = "timer_changes"
+
+NOTIFY_TIMER_CHANGE = DDL(f"""
+CREATE OR REPLACE FUNCTION notify_timer_change() RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_notify('{TIMER_CHANNEL}', json_build_object(
+        'id', NEW.id,
+        'user_id', NEW.user_id,
+        'trigger_time', NEW.trigger_time,
+        'pending', NEW.status = 'ACTIVE' AND NOT NEW.is_notified
+    )::text);
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql
+""")
+
+TIMER_CHANGE_TRIGGER = DDL("""
+CREATE TRIGGER timers_notify_change
+AFTER INSERT OR UPDATE OF trigger_time, status, is_notified ON timers
+FOR EACH ROW EXECUTE FUNCTION notify_timer_change()
+""")
+
+event.listen(Timer.__table__, "after_create", NOTIFY_TIMER_CHANGE)
+event.listen(Timer.__table__, "after_create", TIMER_CHANGE_TRIGGER)
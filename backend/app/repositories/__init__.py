@@ -0,0 +1,6 @@
+"""Data access helpers shared by the services."""
+
+from app.repositories.base import Repository
+from app.repositories.owned import OwnedRepository
+
+__all__ = ["Repository", "OwnedRepository"]
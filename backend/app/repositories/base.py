@@ -0,0 +1,26 @@
+"""Single-statement inserts."""
+
+from typing import Any, Generic, TypeVar
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+ModelT = TypeVar("ModelT")
+
+
+class Repository(Generic[ModelT]):
+    """Insert rows of a model in one round-trip."""
+
+    def __init__(self, model: type[ModelT]):
+        self.model = model
+
+    async def create(self, db: AsyncSession, values: dict[str, Any]) -> ModelT:
+        """Insert a row with `INSERT ... RETURNING`, so generated columns come back without a refresh."""
+        stmt = insert(self.model).values(**values).returning(self.model)
+        result = await db.execute(stmt)
+        return result.scalar_one()
+
+    async def create_many(self, db: AsyncSession, rows: list[dict[str, Any]]) -> list[ModelT]:
+        """Insert rows with one multi-row `INSERT ... RETURNING`, returned in input order."""
+        stmt = insert(self.model).returning(self.model, sort_by_parameter_order=True)
+        result = await db.execute(stmt, rows)
+        return list(result.scalars())
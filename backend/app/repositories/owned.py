@@ -0,0 +1,123 @@
+"""Owner-scoped, single-statement mutations."""
+
+from typing import Any
+from sqlalchemy import column, delete, func, select, update, values
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.repositories.base import ModelT, Repository
+
+
+class OwnedRepository(Repository[ModelT]):
+    """Mutate rows of a model with `id` and `user_id` columns, scoped to their owner.
+
+    Each mutation is one `UPDATE ... RETURNING` or `DELETE ... RETURNING` round-trip,
+    instead of loading the row, changing it in Python, flushing and refreshing it.
+    """
+
+    def _owned(self, record_id: int, user_id: int) -> tuple:
+        return (self.model.id == record_id, self.model.user_id == user_id)
+
+    async def update(
+        self,
+        db: AsyncSession,
+        record_id: int,
+        user_id: int,
+        values: dict[str, Any],
+        *criteria,
+    ) -> ModelT | None:
+        """Update a user's row if it matches `criteria`, returning the updated row or None."""
+        stmt = (
+            update(self.model)
+            .where(*self._owned(record_id, user_id), *criteria)
+            .values(**values)
+            .returning(self.model)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        result = await db.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def delete(self, db: AsyncSession, record_id: int, user_id: int, *criteria) -> bool:
+        """Delete a user's row if it matches `criteria`, returning whether one was deleted."""
+        stmt = (
+            delete(self.model)
+            .where(*self._owned(record_id, user_id), *criteria)
+            .returning(self.model.id)
+            .execution_options(synchronize_session=False)
+        )
+        result = await db.execute(stmt)
+        return result.scalar_one_or_none() is not None
+
+    async def update_many(self, db: AsyncSession, user_id: int, items: list[dict[str, Any]]) -> dict[int, ModelT]:
+        """Update many of a user's rows, returning the updated rows by id.
+
+        Each item holds an `id` and the fields to set; items for the same id are merged,
+        later fields winning. Items setting the same fields share one
+        `UPDATE ... FROM (VALUES ...) RETURNING` statement.
+        """
+        merged: dict[int, dict[str, Any]] = {}
+        for item in items:
+            merged.setdefault(item["id"], {}).update(item)
+
+        groups: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+        for item in merged.values():
+            fields = tuple(sorted(name for name in item if name != "id"))
+            groups.setdefault(fields, []).append(item)
+
+        table = self.model.__table__
+        updated: dict[int, ModelT] = {}
+        for fields, rows in groups.items():
+            ids = [row["id"] for row in rows]
+            if not fields:
+                stmt = select(self.model).where(self.model.id.in_(ids), self.model.user_id == user_id)
+            else:
+                names = ("id", *fields)
+                batch = values(*(column(name, table.c[name].type) for name in names), name="batch").data(
+                    [tuple(row[name] for name in names) for row in rows]
+                )
+                stmt = (
+                    update(self.model)
+                    .where(self.model.id == batch.c.id, self.model.user_id == user_id)
+                    .values({name: batch.c[name] for name in fields})
+                    .returning(self.model)
+                    .execution_options(synchronize_session=False, populate_existing=True)
+                )
+            result = await db.execute(stmt)
+            for row in result.scalars():
+                updated[row.id] = row
+        return updated
+
+    async def delete_many(self, db: AsyncSession, user_id: int, record_ids: list[int]) -> set[int]:
+        """Delete many of a user's rows in one statement, returning the ids that were deleted."""
+        stmt = (
+            delete(self.model)
+            .where(self.model.id.in_(record_ids), self.model.user_id == user_id)
+            .returning(self.model.id)
+            .execution_options(synchronize_session=False)
+        )
+        result = await db.execute(stmt)
+        return set(result.scalars())
+
+    async def match(
+        self,
+        db: AsyncSession,
+        user_id: int,
+        text_column,
+        reference: str,
+        *criteria,
+        limit: int = 5,
+    ) -> list[tuple[ModelT, float]]:
+        """Find a user's rows whose `text_column` contains words like `reference`, best first.
+
+        Uses pg_trgm word similarity: `%>` keeps rows where word_similarity(reference, column)
+        reaches pg_trgm.word_similarity_threshold (0.6 by default). It can use the column's
+        trigram index, which migrations create (it needs the extension) rather than the
+        models; for a user with few rows the planner filters their rows instead.
+        """
+        score = func.word_similarity(reference, text_column)
+        stmt = (
+            select(self.model, score)
+            .where(self.model.user_id == user_id, text_column.op("%>")(reference), *criteria)
+            .order_by(score.desc(), self.model.id.desc())
+            .limit(limit)
+        )
+        result = await db.execute(stmt)
+        return [(row, similarity) for row, similarity in result.all()]
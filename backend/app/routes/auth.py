@@ -4,9 +4,9 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel, EmailStr
 from app.core.database import get_db
-from app.core.deps import get_current_user
+from app.core.deps import get_current_user, get_current_user_id
 from app.services.auth import AuthService
-from app.models import User
+from app.services.principal_cache import Principal, principal_cache
 
 router = APIRouter(prefix="/auth", tags=["Auth"])
 
@@ -90,7 +90,7 @@ async def login(
 
 
 @router.get("/me", response_model=UserResponse)
-async def get_me(current_user: User = Depends(get_current_user)):
+async def get_me(current_user: Principal = Depends(get_current_user)):
     """Get current user info."""
     return UserResponse(
         id=current_user.id,
@@ -130,9 +130,11 @@ async def refresh_token(
 async def logout(
     request: RefreshRequest,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    user_id: int = Depends(get_current_user_id)
 ):
     """Logout user by revoking refresh token."""
     await AuthService.revoke_refresh_token(db, request.refresh_token)
     await db.commit()
+    await principal_cache.invalidate(user_id)
     return {"message": "Logged out successfully"}
+
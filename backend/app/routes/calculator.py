@@ -1,7 +1,7 @@
 """Calculator routes."""
 
 from fastapi import APIRouter, HTTPException, Depends
-from app.core.deps import get_current_user
+from app.core.deps import get_current_user_id
 from app.services.calculator import CalculatorService
 from app.schemas import SuccessResponse
 from app.schemas.calculator import (
@@ -10,7 +10,6 @@ from app.schemas.calculator import (
     ConvertCurrencyRequest,
     ConvertCurrencyResponse,
 )
-from app.models.user import User
 
 router = APIRouter(prefix="/calculator", tags=["Calculator"])
 
@@ -18,7 +17,7 @@ router = APIRouter(prefix="/calculator", tags=["Calculator"])
 @router.post("/compute", response_model=SuccessResponse[CalculateResponse])
 async def compute(
     calculate_request: CalculateRequest,
-    current_user: User = Depends(get_current_user),
+    user_id: int = Depends(get_current_user_id),
 ):
     """Perform mathematical calculation."""
     try:
@@ -35,7 +34,7 @@ async def compute(
 @router.post("/convert", response_model=SuccessResponse[ConvertCurrencyResponse])
 async def convert_currency(
     convert_request: ConvertCurrencyRequest,
-    current_user: User = Depends(get_current_user),
+    user_id: int = Depends(get_current_user_id),
 ):
     """Convert currency."""
     try:
@@ -1,32 +1,39 @@
 """Calendar and reminder routes."""
 
-from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException
+from datetime import datetime, timedelta
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.database import get_db
-from app.core.deps import get_current_user
+from app.core.deps import get_current_user_id
 from app.services.calendar import CalendarService
 from app.schemas import (
+    BatchDeleteRequest,
+    BatchItemResult,
+    BatchRequest,
+    CalendarEventBatchUpdate,
     CalendarEventCreate,
     CalendarEventResponse,
+    FreeBusyResponse,
     ReminderCreate,
     ReminderResponse,
     SuccessResponse,
 )
 from app.models import ReminderStatus
-from app.models.user import User
 
 router = APIRouter(prefix="/calendar", tags=["Calendar"])
 
+# Longest window a free/busy query may cover
+MAX_FREE_BUSY_WINDOW = timedelta(days=92)
+
 
 @router.post("/events", response_model=SuccessResponse[CalendarEventResponse])
 async def create_event(
     event_data: CalendarEventCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    user_id: int = Depends(get_current_user_id),
 ):
     """Create a new calendar event."""
-    event = await CalendarService.add_event(db, event_data, current_user.id)
+    event = await CalendarService.add_event(db, event_data, user_id)
     return SuccessResponse(data=event, message="Event created successfully")
 
 
@@ -35,21 +42,91 @@ async def get_events(
     start_date: datetime | None = None,
     end_date: datetime | None = None,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    user_id: int = Depends(get_current_user_id),
 ):
     """Get calendar events with optional date filtering."""
-    events = await CalendarService.get_events(db, current_user.id, start_date, end_date)
+    events = await CalendarService.get_events(db, user_id, start_date, end_date)
     return SuccessResponse(data=events)
 
 
+@router.get("/free-busy", response_model=SuccessResponse[FreeBusyResponse])
+async def get_free_busy(
+    start: datetime,
+    end: datetime,
+    granularity_minutes: int = Query(15, ge=1, le=1440, description="Slot size busy time is rounded to"),
+    db: AsyncSession = Depends(get_db),
+    user_id: int = Depends(get_current_user_id),
+):
+    """Get merged busy intervals and the free slots between them for [start, end)."""
+    if end <= start:
+        raise HTTPException(status_code=400, detail="end must be after start")
+    if end - start > MAX_FREE_BUSY_WINDOW:
+        raise HTTPException(status_code=400, detail=f"Window must be at most {MAX_FREE_BUSY_WINDOW.days} days")
+    busy, free = await CalendarService.free_busy(db, user_id, start, end, timedelta(minutes=granularity_minutes))
+    return SuccessResponse(data=FreeBusyResponse(
+        start=start,
+        end=end,
+        granularity_minutes=granularity_minutes,
+        busy=[{"start": s, "end": e} for s, e in busy],
+        free=[{"start": s, "end": e} for s, e in free],
+    ))
+
+
+@router.post("/events/batch", response_model=SuccessResponse[list[BatchItemResult[CalendarEventResponse]]])
+async def add_events_batch(
+    batch: BatchRequest[CalendarEventCreate],
+    db: AsyncSession = Depends(get_db),
+    user_id: int = Depends(get_current_user_id),
+):
+    """Create many events at once."""
+    rows = await CalendarService.add_events(db, batch.items, user_id)
+    results = [BatchItemResult(id=row.id, success=True, data=row) for row in rows]
+    return SuccessResponse(data=results, message=f"{len(rows)} events created")
+
+
+@router.put("/events/batch", response_model=SuccessResponse[list[BatchItemResult[CalendarEventResponse]]])
+async def update_events_batch(
+    batch: BatchRequest[CalendarEventBatchUpdate],
+    db: AsyncSession = Depends(get_db),
+    user_id: int = Depends(get_current_user_id),
+):
+    """Update many events at once, reporting each item's outcome."""
+    rows = await CalendarService.update_events(db, batch.items, user_id)
+    results = [
+        BatchItemResult(id=item.id, success=True, data=row)
+        if row
+        else BatchItemResult(id=item.id, success=False, error="Event not found")
+        for item, row in zip(batch.items, rows)
+    ]
+    updated = sum(result.success for result in results)
+    return SuccessResponse(data=results, message=f"{updated} of {len(results)} events updated")
+
+
+@router.delete("/events/batch", response_model=SuccessResponse[list[BatchItemResult[dict]]])
+async def delete_events_batch(
+    batch: BatchDeleteRequest,
+    db: AsyncSession = Depends(get_db),
+    user_id: int = Depends(get_current_user_id),
+):
+    """Delete many events at once, reporting each id's outcome."""
+    deleted = await CalendarService.delete_events(db, batch.ids, user_id)
+    results = [
+        BatchItemResult(id=event_id, success=True)
+        if event_id in deleted
+        else BatchItemResult(id=event_id, success=False, error="Event not found")
+        for event_id in batch.ids
+    ]
+    return SuccessResponse(data=results, message=f"{len(deleted)} of {len(set(batch.ids))} events deleted")
+
+
 @router.delete("/events/{event_id}", response_model=SuccessResponse[dict])
 async def delete_event(
     event_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    user_id: int = Depends(get_current_user_id),
 ):
     """Delete a calendar event."""
-    deleted = await CalendarService.delete_event(db, event_id, current_user.id)
+    deleted = await CalendarService.delete_event(db, event_id, user_id)
     if not deleted:
         raise HTTPException(status_code=404, detail="Event not found")
     return SuccessResponse(data={"id": event_id}, message="Event deleted successfully")
@@ -59,10 +136,10 @@ async def delete_event(
 async def create_reminder(
     reminder_data: ReminderCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    user_id: int = Depends(get_current_user_id),
 ):
     """Create a new reminder."""
-    reminder = await CalendarService.add_reminder(db, reminder_data, current_user.id)
+    reminder = await CalendarService.add_reminder(db, reminder_data, user_id)
     return SuccessResponse(data=reminder, message="Reminder created successfully")
 
 
@@ -70,8 +147,8 @@ async def create_reminder(
 async def get_reminders(
     status: ReminderStatus | None = None,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    user_id: int = Depends(get_current_user_id),
 ):
     """Get reminders with optional status filtering."""
-    reminders = await CalendarService.get_reminders(db, current_user.id, status)
+    reminders = await CalendarService.get_reminders(db, user_id, status)
     return SuccessResponse(data=reminders)
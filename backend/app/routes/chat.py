@@ -1,29 +1,30 @@
 """Chat routes."""
 
+import json
+import time
+from typing import AsyncIterator
 from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.database import get_db
 from app.core.config import get_settings
-from app.core.deps import get_current_user
+from app.core.deps import get_current_user_id
 from app.services.groq import GroqService
 from app.services.workersai import WorkersAIService
-from app.models.user import User
 
 settings = get_settings()
 from app.services.tool_executor import ToolExecutor
+from app.services.response_renderer import ResponseRenderer
+from app.services.llm_cache import tool_call_cache
+from app.services.intent_router import IntentRouter
+from app.utils.metrics import metrics
 from app.schemas import ChatRequest, ChatResponse
 
 router = APIRouter(prefix="/chat", tags=["Chat"])
 
 
-@router.post("", response_model=ChatResponse)
-async def chat(
-    chat_request: ChatRequest,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-):
-    """Process chat message and execute tools if needed."""
-    
+def build_message(chat_request: ChatRequest) -> str:
+    """Apply the template instruction, if any, to the user's message."""
     # Template instructions mapping
     template_instructions = {
         "search_web": f"Search the web for: {chat_request.message}",
@@ -33,43 +34,226 @@ async def chat(
         "calculate": f"Calculate: {chat_request.message}",
         "convert_currency": f"Convert currency: {chat_request.message}",
     }
-    
+
     # Use template instruction if provided, otherwise use original message
-    message = template_instructions.get(chat_request.template, chat_request.message) if chat_request.template else chat_request.message
-    
-    # Get LLM response with tool call
+    return template_instructions.get(chat_request.template, chat_request.message) if chat_request.template else chat_request.message
+
+
+async def process_message(message: str, tool_result: dict | None = None) -> dict:
+    """Send a message to the configured LLM provider."""
     if settings.LLM_PROVIDER == "workersai":
-        llm_result = await WorkersAIService.process_message(message)
-    else:
-        llm_result = GroqService.process_message(message)
-    
-    # If LLM wants to use a tool, execute it
+        return await WorkersAIService.process_message(message, tool_result)
+    return await GroqService.process_message(message, tool_result)
+
+
+async def extract_tool_call(message: str) -> dict:
+    """Extract the tool call for a message, serving repeated phrasings from the cache."""
+    if not settings.LLM_CACHE_ENABLED:
+        return await process_message(message)
+
+    cached = await tool_call_cache.get(settings.LLM_PROVIDER, message)
+    if cached is not None:
+        return cached
+
+    llm_result = await process_message(message)
+    await tool_call_cache.set(settings.LLM_PROVIDER, message, llm_result)
+    return llm_result
+
+
+async def resolve_tool_call(message: str) -> dict:
+    """Resolve a message to a tool call, via the local intent router when it is confident."""
+    start = time.perf_counter()
+    if settings.INTENT_ROUTER_ENABLED:
+        fast_result = IntentRouter.match(message)
+        if fast_result is not None:
+            metrics.increment("intent_router.hit")
+            metrics.observe("chat.extract.fast_path", time.perf_counter() - start)
+            return fast_result
+        metrics.increment("intent_router.miss")
+
+    llm_result = await extract_tool_call(message)
+    metrics.observe("chat.extract.llm", time.perf_counter() - start)
+    return llm_result
+
+
+def stream_response(message: str, tool_result: dict) -> AsyncIterator[str]:
+    """Stream the natural response for a tool result from the configured LLM provider."""
+    if settings.LLM_PROVIDER == "workersai":
+        return WorkersAIService.stream_response(message, tool_result)
+    return GroqService.stream_response(message, tool_result)
+
+
+def tool_calls_of(llm_result: dict) -> list[dict]:
+    """Get every tool call from an extraction result (results without `tool_calls` carry one call)."""
+    if llm_result.get("tool_calls"):
+        return llm_result["tool_calls"]
     if llm_result.get("tool_name"):
-        tool_name = llm_result["tool_name"]
-        parameters = llm_result["parameters"]
-        
+        return [{"tool_name": llm_result["tool_name"], "parameters": llm_result.get("parameters")}]
+    return []
+
+
+def combine_results(tool_calls: list[dict], results: list[dict]) -> dict:
+    """Combine the results of a batch of tool calls into one tool result."""
+    return {
+        "success": all(result["success"] for result in results),
+        "data": {"results": [{"tool_name": call["tool_name"], **result} for call, result in zip(tool_calls, results)]},
+    }
+
+
+def render_batch(tool_calls: list[dict], results: list[dict]) -> str | None:
+    """Render a batch from templates, or return None if any result needs LLM phrasing."""
+    lines = []
+    for call, result in zip(tool_calls, results):
+        if not result["success"]:
+            lines.append(f"Sorry, I couldn't complete {call['tool_name']}: {result.get('error')}")
+            continue
+        if not ResponseRenderer.should_render(call["tool_name"]):
+            return None
+        line = ResponseRenderer.render(call["tool_name"], call.get("parameters"), result)
+        if line is None:
+            return None
+        lines.append(line)
+    return "\n".join(lines)
+
+
+async def phrase_response(message: str, tool_name: str, parameters: dict | None, tool_result: dict) -> str:
+    """Phrase a successful tool result, from a template when possible, otherwise with the LLM."""
+    if ResponseRenderer.should_render(tool_name):
+        response = ResponseRenderer.render(tool_name, parameters, tool_result)
+        if response is not None:
+            return response
+    llm_response = await process_message(message, tool_result)
+    return llm_response["response"]
+
+
+def sse_event(event: str, data: dict) -> str:
+    """Format a server-sent event."""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+@router.post("", response_model=ChatResponse)
+async def chat(
+    chat_request: ChatRequest,
+    db: AsyncSession = Depends(get_db),
+    user_id: int = Depends(get_current_user_id),
+):
+    """Process chat message and execute tools if needed."""
+    message = build_message(chat_request)
+
+    # Get tool call from the intent router or the LLM
+    llm_result = await resolve_tool_call(message)
+
+    tool_calls = tool_calls_of(llm_result)
+
+    # If LLM wants to use several tools, run them together and answer once
+    if len(tool_calls) > 1:
+        results = await ToolExecutor.execute_many(db, tool_calls, user_id)
+        tool_result = combine_results(tool_calls, results)
+        response = render_batch(tool_calls, results)
+        if response is None:
+            llm_response = await process_message(message, tool_result)
+            response = llm_response["response"]
+
+        return ChatResponse(
+            response=response,
+            tool_used=", ".join(call["tool_name"] for call in tool_calls),
+            tool_result=tool_result,
+            tool_calls=[{**call, "result": result} for call, result in zip(tool_calls, results)],
+            prompt_tokens=llm_result.get("prompt_tokens"),
+        )
+
+    # If LLM wants to use a tool, execute it
+    if tool_calls:
+        tool_name = tool_calls[0]["tool_name"]
+        parameters = tool_calls[0]["parameters"]
+
         # Execute the tool
-        tool_result = await ToolExecutor.execute(db, tool_name, parameters, current_user.id)
-        
-        # Generate natural response using LLM
+        tool_result = await ToolExecutor.execute(db, tool_name, parameters, user_id)
+
+        # Generate natural response from a template or the LLM
         if tool_result["success"]:
-            if settings.LLM_PROVIDER == "workersai":
-                llm_response = await WorkersAIService.process_message(message, tool_result)
-            else:
-                llm_response = GroqService.process_message(message, tool_result)
-            response = llm_response["response"]
+            response = await phrase_response(message, tool_name, parameters, tool_result)
         else:
             response = f"Sorry, I couldn't complete that: {tool_result.get('error')}"
-        
+
         return ChatResponse(
             response=response,
             tool_used=tool_name,
             tool_result=tool_result,
+            prompt_tokens=llm_result.get("prompt_tokens"),
         )
-    
+
     # No tool needed, just return LLM response
     return ChatResponse(
         response=llm_result.get("response", "I'm not sure how to help with that."),
         tool_used=None,
         tool_result=None,
+        prompt_tokens=llm_result.get("prompt_tokens"),
+    )
+
+
+@router.post("/stream")
+async def chat_stream(
+    chat_request: ChatRequest,
+    db: AsyncSession = Depends(get_db),
+    user_id: int = Depends(get_current_user_id),
+):
+    """Process chat message and stream the tool call, tool result and response as server-sent events.
+
+    Events: `tool_call`, `tool_result`, `token` (repeated), `done` (with `prompt_tokens`), or `error`.
+    """
+    message = build_message(chat_request)
+
+    async def events() -> AsyncIterator[str]:
+        try:
+            llm_result = await resolve_tool_call(message)
+            tool_calls = tool_calls_of(llm_result)
+
+            if not tool_calls:
+                response = llm_result.get("response", "I'm not sure how to help with that.")
+                yield sse_event("token", {"text": response})
+                yield sse_event("done", {"tool_used": None, "prompt_tokens": llm_result.get("prompt_tokens")})
+                return
+
+            for call in tool_calls:
+                yield sse_event("tool_call", {"tool_name": call["tool_name"], "parameters": call.get("parameters")})
+
+            if len(tool_calls) > 1:
+                results = await ToolExecutor.execute_many(db, tool_calls, user_id)
+            else:
+                results = [await ToolExecutor.execute(db, tool_calls[0]["tool_name"], tool_calls[0]["parameters"], user_id)]
+            await db.commit()
+            for call, result in zip(tool_calls, results):
+                yield sse_event("tool_result", {"tool_name": call["tool_name"], **result})
+
+            if len(tool_calls) > 1:
+                tool_result = combine_results(tool_calls, results)
+                response = render_batch(tool_calls, results)
+            elif results[0]["success"]:
+                tool_result = results[0]
+                response = None
+                if ResponseRenderer.should_render(tool_calls[0]["tool_name"]):
+                    response = ResponseRenderer.render(tool_calls[0]["tool_name"], tool_calls[0]["parameters"], tool_result)
+            else:
+                tool_result = results[0]
+                response = f"Sorry, I couldn't complete that: {tool_result.get('error')}"
+
+            if response is not None:
+                yield sse_event("token", {"text": response})
+            else:
+                async for token in stream_response(message, tool_result):
+                    yield sse_event("token", {"text": token})
+
+            yield sse_event("done", {
+                "tool_used": ", ".join(call["tool_name"] for call in tool_calls),
+                "prompt_tokens": llm_result.get("prompt_tokens"),
+            })
+        except Exception as e:
+            await db.rollback()
+            yield sse_event("error", {"error": str(e)})
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
@@ -1,12 +1,12 @@
 """Email routes."""
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.database import get_db
-from app.core.deps import get_current_user
-from app.services.email import EmailService
+from app.core.deps import get_current_user_id
+from app.services.email import EmailService, email_log_order
 from app.schemas import EmailSend, EmailLogResponse, EmailDraftRequest, EmailDraftResponse, SuccessResponse
-from app.models.user import User
+from app.utils.pagination import InvalidCursorError
 
 router = APIRouter(prefix="/email", tags=["Email"])
 
@@ -15,10 +15,10 @@ router = APIRouter(prefix="/email", tags=["Email"])
 async def send_email(
     email_data: EmailSend,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    user_id: int = Depends(get_current_user_id),
 ):
     """Send an email."""
-    email_log = await EmailService.send_email(db, email_data, current_user.id)
+    email_log = await EmailService.send_email(db, email_data, user_id)
     message = "Email sent successfully" if email_log.status == "sent" else "Email failed to send"
     return SuccessResponse(data=email_log, message=message)
 
@@ -26,7 +26,7 @@ async def send_email(
 @router.post("/draft", response_model=SuccessResponse[EmailDraftResponse])
 async def draft_email(
     draft_request: EmailDraftRequest,
-    current_user: User = Depends(get_current_user),
+    user_id: int = Depends(get_current_user_id),
 ):
     """Generate email draft."""
     draft = EmailService.draft_email(draft_request.context, draft_request.tone)
@@ -37,9 +37,16 @@ async def draft_email(
 async def get_email_logs(
     skip: int = 0,
     limit: int = 100,
+    cursor: str | None = None,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    user_id: int = Depends(get_current_user_id),
 ):
-    """Get email logs."""
-    logs = await EmailService.get_email_logs(db, current_user.id, skip, limit)
-    return SuccessResponse(data=logs)
+    """Get email logs.
+
+    Pass the previous page's `next_cursor` as `cursor` to page by keyset; `skip` still works.
+    """
+    try:
+        logs = await EmailService.get_email_logs(db, user_id, skip, limit, cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return SuccessResponse(data=logs, next_cursor=email_log_order.next_cursor(logs, limit))
@@ -2,6 +2,7 @@
 
 from fastapi import APIRouter
 from app.core.config import get_settings
+from app.utils.metrics import metrics
 
 router = APIRouter(tags=["Health"])
 settings = get_settings()
@@ -17,3 +18,9 @@ async def root():
 async def health_check():
     """Health check endpoint."""
     return {"status": "ok", "version": settings.APP_VERSION}
+
+
+@router.get("/health/metrics")
+async def health_metrics():
+    """In-process counters and timings for this worker."""
+    return metrics.snapshot()
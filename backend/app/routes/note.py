@@ -3,10 +3,19 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.database import get_db
-from app.core.deps import get_current_user
-from app.services.note import NoteService
-from app.schemas import NoteCreate, NoteUpdate, NoteResponse, SuccessResponse
-from app.models.user import User
+from app.core.deps import get_current_user_id
+from app.services.note import NoteService, note_order
+from app.schemas import (
+    BatchDeleteRequest,
+    BatchItemResult,
+    BatchRequest,
+    NoteBatchUpdate,
+    NoteCreate,
+    NoteResponse,
+    NoteUpdate,
+    SuccessResponse,
+)
+from app.utils.pagination import InvalidCursorError
 
 router = APIRouter(prefix="/notes", tags=["Notes"])
 
@@ -15,10 +24,10 @@ router = APIRouter(prefix="/notes", tags=["Notes"])
 async def create_note(
     note_data: NoteCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    user_id: int = Depends(get_current_user_id),
 ):
     """Create a new note."""
-    note = await NoteService.create_note(db, note_data, current_user.id)
+    note = await NoteService.create_note(db, note_data, user_id)
     return SuccessResponse(data=note, message="Note created successfully")
 
 
@@ -26,12 +35,66 @@ async def create_note(
 async def get_notes(
     skip: int = 0,
     limit: int = 100,
+    cursor: str | None = None,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    user_id: int = Depends(get_current_user_id),
 ):
-    """Get all notes with pagination."""
-    notes = await NoteService.get_notes(db, current_user.id, skip, limit)
-    return SuccessResponse(data=notes)
+    """Get all notes with pagination.
+
+    Pass the previous page's `next_cursor` as `cursor` to page by keyset; `skip` still works.
+    """
+    try:
+        notes = await NoteService.get_notes(db, user_id, skip, limit, cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return SuccessResponse(data=notes, next_cursor=note_order.next_cursor(notes, limit))
+
+
+@router.post("/batch", response_model=SuccessResponse[list[BatchItemResult[NoteResponse]]])
+async def create_notes_batch(
+    batch: BatchRequest[NoteCreate],
+    db: AsyncSession = Depends(get_db),
+    user_id: int = Depends(get_current_user_id),
+):
+    """Create many notes at once."""
+    rows = await NoteService.create_notes(db, batch.items, user_id)
+    results = [BatchItemResult(id=row.id, success=True, data=row) for row in rows]
+    return SuccessResponse(data=results, message=f"{len(rows)} notes created")
+
+
+@router.put("/batch", response_model=SuccessResponse[list[BatchItemResult[NoteResponse]]])
+async def update_notes_batch(
+    batch: BatchRequest[NoteBatchUpdate],
+    db: AsyncSession = Depends(get_db),
+    user_id: int = Depends(get_current_user_id),
+):
+    """Update many notes at once, reporting each item's outcome."""
+    rows = await NoteService.update_notes(db, batch.items, user_id)
+    results = [
+        BatchItemResult(id=item.id, success=True, data=row)
+        if row
+        else BatchItemResult(id=item.id, success=False, error="Note not found")
+        for item, row in zip(batch.items, rows)
+    ]
+    updated = sum(result.success for result in results)
+    return SuccessResponse(data=results, message=f"{updated} of {len(results)} notes updated")
+
+
+@router.delete("/batch", response_model=SuccessResponse[list[BatchItemResult[dict]]])
+async def delete_notes_batch(
+    batch: BatchDeleteRequest,
+    db: AsyncSession = Depends(get_db),
+    user_id: int = Depends(get_current_user_id),
+):
+    """Delete many notes at once, reporting each id's outcome."""
+    deleted = await NoteService.delete_notes(db, batch.ids, user_id)
+    results = [
+        BatchItemResult(id=note_id, success=True)
+        if note_id in deleted
+        else BatchItemResult(id=note_id, success=False, error="Note not found")
+        for note_id in batch.ids
+    ]
+    return SuccessResponse(data=results, message=f"{len(deleted)} of {len(set(batch.ids))} notes deleted")
 
 
 @router.get("/search", response_model=SuccessResponse[list[NoteResponse]])
@@ -39,10 +102,10 @@ async def search_notes(
     q: str = Query(None, description="Search query"),
     tags: str = Query(None, description="Comma-separated tags"),
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    user_id: int = Depends(get_current_user_id),
 ):
     """Search notes by content or tags."""
-    notes = await NoteService.search_notes(db, current_user.id, q, tags)
+    notes = await NoteService.search_notes(db, user_id, q, tags)
     return SuccessResponse(data=notes)
 
 
@@ -50,10 +113,10 @@ async def search_notes(
 async def get_note(
     note_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    user_id: int = Depends(get_current_user_id),
 ):
     """Get a specific note."""
-    note = await NoteService.get_note(db, note_id, current_user.id)
+    note = await NoteService.get_note(db, note_id, user_id)
     if not note:
         raise HTTPException(status_code=404, detail="Note not found")
     return SuccessResponse(data=note)
@@ -64,10 +127,10 @@ async def update_note(
     note_id: int,
     note_data: NoteUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    user_id: int = Depends(get_current_user_id),
 ):
     """Update a note."""
-    note = await NoteService.update_note(db, note_id, note_data, current_user.id)
+    note = await NoteService.update_note(db, note_id, note_data, user_id)
     if not note:
         raise HTTPException(status_code=404, detail="Note not found")
     return SuccessResponse(data=note, message="Note updated successfully")
@@ -77,10 +140,10 @@ async def update_note(
 async def delete_note(
     note_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    user_id: int = Depends(get_current_user_id),
 ):
     """Delete a note."""
-    deleted = await NoteService.delete_note(db, note_id, current_user.id)
+    deleted = await NoteService.delete_note(db, note_id, user_id)
     if not deleted:
         raise HTTPException(status_code=404, detail="Note not found")
     return SuccessResponse(data={"id": note_id}, message="Note deleted successfully")
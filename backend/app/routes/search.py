@@ -1,7 +1,7 @@
 """Search routes."""
 
 from fastapi import APIRouter, Depends
-from app.core.deps import get_current_user
+from app.core.deps import get_current_user_id
 from app.services.search import SearchService
 from app.schemas import SuccessResponse
 from app.schemas.search import (
@@ -10,7 +10,6 @@ from app.schemas.search import (
     SummarizeRequest,
     SummarizeResponse,
 )
-from app.models.user import User
 
 router = APIRouter(prefix="/search", tags=["Search"])
 
@@ -18,7 +17,7 @@ router = APIRouter(prefix="/search", tags=["Search"])
 @router.post("", response_model=SuccessResponse[SearchResponse])
 async def search_web(
     search_request: SearchRequest,
-    current_user: User = Depends(get_current_user),
+    user_id: int = Depends(get_current_user_id),
 ):
     """Search the web."""
     results = await SearchService.search_web(
@@ -32,7 +31,7 @@ async def search_web(
 @router.post("/summarize", response_model=SuccessResponse[SummarizeResponse])
 async def search_and_summarize(
     summarize_request: SummarizeRequest,
-    current_user: User = Depends(get_current_user),
+    user_id: int = Depends(get_current_user_id),
 ):
     """Search the web and summarize results."""
     results = await SearchService.search_web(
@@ -3,11 +3,20 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.database import get_db
-from app.core.deps import get_current_user
-from app.services.task import TaskService
-from app.schemas import TaskCreate, TaskUpdate, TaskResponse, SuccessResponse
+from app.core.deps import get_current_user_id
+from app.services.task import TaskService, task_order
+from app.schemas import (
+    BatchDeleteRequest,
+    BatchItemResult,
+    BatchRequest,
+    SuccessResponse,
+    TaskBatchUpdate,
+    TaskCreate,
+    TaskResponse,
+    TaskUpdate,
+)
 from app.models import TaskStatus
-from app.models.user import User
+from app.utils.pagination import InvalidCursorError
 
 router = APIRouter(prefix="/tasks", tags=["Tasks"])
 
@@ -16,10 +25,10 @@ router = APIRouter(prefix="/tasks", tags=["Tasks"])
 async def create_task(
     task_data: TaskCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    user_id: int = Depends(get_current_user_id),
 ):
     """Create a new task."""
-    task = await TaskService.create_task(db, task_data, current_user.id)
+    task = await TaskService.create_task(db, task_data, user_id)
     return SuccessResponse(data=task, message="Task created successfully")
 
 
@@ -28,22 +37,76 @@ async def get_tasks(
     status: TaskStatus | None = None,
     skip: int = 0,
     limit: int = 100,
+    cursor: str | None = None,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    user_id: int = Depends(get_current_user_id),
 ):
-    """Get tasks with optional status filtering."""
-    tasks = await TaskService.get_tasks(db, current_user.id, status, skip, limit)
-    return SuccessResponse(data=tasks)
+    """Get tasks with optional status filtering.
+
+    Pass the previous page's `next_cursor` as `cursor` to page by keyset; `skip` still works.
+    """
+    try:
+        tasks = await TaskService.get_tasks(db, user_id, status, skip, limit, cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return SuccessResponse(data=tasks, next_cursor=task_order.next_cursor(tasks, limit))
+
+
+@router.post("/batch", response_model=SuccessResponse[list[BatchItemResult[TaskResponse]]])
+async def create_tasks_batch(
+    batch: BatchRequest[TaskCreate],
+    db: AsyncSession = Depends(get_db),
+    user_id: int = Depends(get_current_user_id),
+):
+    """Create many tasks at once."""
+    rows = await TaskService.create_tasks(db, batch.items, user_id)
+    results = [BatchItemResult(id=row.id, success=True, data=row) for row in rows]
+    return SuccessResponse(data=results, message=f"{len(rows)} tasks created")
+
+
+@router.put("/batch", response_model=SuccessResponse[list[BatchItemResult[TaskResponse]]])
+async def update_tasks_batch(
+    batch: BatchRequest[TaskBatchUpdate],
+    db: AsyncSession = Depends(get_db),
+    user_id: int = Depends(get_current_user_id),
+):
+    """Update many tasks at once, reporting each item's outcome."""
+    rows = await TaskService.update_tasks(db, batch.items, user_id)
+    results = [
+        BatchItemResult(id=item.id, success=True, data=row)
+        if row
+        else BatchItemResult(id=item.id, success=False, error="Task not found")
+        for item, row in zip(batch.items, rows)
+    ]
+    updated = sum(result.success for result in results)
+    return SuccessResponse(data=results, message=f"{updated} of {len(results)} tasks updated")
+
+
+@router.delete("/batch", response_model=SuccessResponse[list[BatchItemResult[dict]]])
+async def delete_tasks_batch(
+    batch: BatchDeleteRequest,
+    db: AsyncSession = Depends(get_db),
+    user_id: int = Depends(get_current_user_id),
+):
+    """Delete many tasks at once, reporting each id's outcome."""
+    deleted = await TaskService.delete_tasks(db, batch.ids, user_id)
+    results = [
+        BatchItemResult(id=task_id, success=True)
+        if task_id in deleted
+        else BatchItemResult(id=task_id, success=False, error="Task not found")
+        for task_id in batch.ids
+    ]
+    return SuccessResponse(data=results, message=f"{len(deleted)} of {len(set(batch.ids))} tasks deleted")
 
 
 @router.get("/{task_id}", response_model=SuccessResponse[TaskResponse])
 async def get_task(
     task_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    user_id: int = Depends(get_current_user_id),
 ):
     """Get a specific task."""
-    task = await TaskService.get_task(db, task_id, current_user.id)
+    task = await TaskService.get_task(db, task_id, user_id)
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
     return SuccessResponse(data=task)
@@ -54,10 +117,10 @@ async def update_task(
     task_id: int,
     task_data: TaskUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    user_id: int = Depends(get_current_user_id),
 ):
     """Update a task."""
-    task = await TaskService.update_task(db, task_id, task_data, current_user.id)
+    task = await TaskService.update_task(db, task_id, task_data, user_id)
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
     return SuccessResponse(data=task, message="Task updated successfully")
@@ -67,10 +130,10 @@ async def update_task(
 async def complete_task(
     task_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    user_id: int = Depends(get_current_user_id),
 ):
     """Mark a task as completed."""
-    task = await TaskService.complete_task(db, task_id, current_user.id)
+    task = await TaskService.complete_task(db, task_id, user_id)
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
     return SuccessResponse(data=task, message="Task completed successfully")
@@ -80,10 +143,10 @@ async def complete_task(
 async def delete_task(
     task_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    user_id: int = Depends(get_current_user_id),
 ):
     """Delete a task."""
-    deleted = await TaskService.delete_task(db, task_id, current_user.id)
+    deleted = await TaskService.delete_task(db, task_id, user_id)
     if not deleted:
         raise HTTPException(status_code=404, detail="Task not found")
     return SuccessResponse(data={"id": task_id}, message="Task deleted successfully")
@@ -4,10 +4,11 @@ from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.database import get_db
-from app.core.deps import get_current_user
-from app.services.timer import TimerService
+from app.core.deps import get_current_user_id
+from app.services.timer import TimerService, timer_order
 from app.schemas import TimerResponse, SuccessResponse
-from app.models import TimerStatus, User
+from app.models import TimerStatus
+from app.utils.pagination import InvalidCursorError
 from pydantic import BaseModel, Field
 
 
@@ -30,11 +31,11 @@ router = APIRouter(prefix="/timers", tags=["Timers"])
 async def set_timer(
     request: SetTimerRequest,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    user_id: int = Depends(get_current_user_id),
 ):
     """Set a timer."""
     timer = await TimerService.create_timer(
-        db, request.duration_seconds, current_user.id, request.label
+        db, request.duration_seconds, user_id, request.label
     )
     return SuccessResponse(data=timer, message="Timer set successfully")
 
@@ -43,11 +44,11 @@ async def set_timer(
 async def set_alarm(
     request: SetAlarmRequest,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    user_id: int = Depends(get_current_user_id),
 ):
     """Set an alarm."""
     timer = await TimerService.create_alarm(
-        db, request.trigger_time, current_user.id, request.label
+        db, request.trigger_time, user_id, request.label
     )
     return SuccessResponse(data=timer, message="Alarm set successfully")
 
@@ -57,22 +58,29 @@ async def get_timers(
     status: TimerStatus | None = None,
     skip: int = 0,
     limit: int = 100,
+    cursor: str | None = None,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    user_id: int = Depends(get_current_user_id),
 ):
-    """Get timers with optional status filtering."""
-    timers = await TimerService.get_timers(db, current_user.id, status, skip, limit)
-    return SuccessResponse(data=timers)
+    """Get timers with optional status filtering.
+
+    Pass the previous page's `next_cursor` as `cursor` to page by keyset; `skip` still works.
+    """
+    try:
+        timers = await TimerService.get_timers(db, user_id, status, skip, limit, cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return SuccessResponse(data=timers, next_cursor=timer_order.next_cursor(timers, limit))
 
 
 @router.get("/{timer_id}", response_model=SuccessResponse[TimerResponse])
 async def get_timer(
     timer_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    user_id: int = Depends(get_current_user_id),
 ):
     """Get a specific timer."""
-    timer = await TimerService.get_timer(db, timer_id, current_user.id)
+    timer = await TimerService.get_timer(db, timer_id, user_id)
     if not timer:
         raise HTTPException(status_code=404, detail="Timer not found")
     return SuccessResponse(data=timer)
@@ -82,10 +90,10 @@ async def get_timer(
 async def cancel_timer(
     timer_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    user_id: int = Depends(get_current_user_id),
 ):
     """Cancel a timer."""
-    timer = await TimerService.cancel_timer(db, timer_id, current_user.id)
+    timer = await TimerService.cancel_timer(db, timer_id, user_id)
     if not timer:
         raise HTTPException(status_code=404, detail="Timer not found")
     return SuccessResponse(data=timer, message="Timer cancelled successfully")
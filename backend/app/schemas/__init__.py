@@ -1,7 +1,14 @@
 """Pydantic schemas for request/response validation."""
 
-from app.schemas.calendar import CalendarEventCreate, CalendarEventResponse
-from app.schemas.note import NoteCreate, NoteUpdate, NoteResponse
+from app.schemas.calendar import (
+    CalendarEventCreate,
+    CalendarEventUpdate,
+    CalendarEventBatchUpdate,
+    CalendarEventResponse,
+    FreeBusyResponse,
+    TimeInterval,
+)
+from app.schemas.note import NoteCreate, NoteUpdate, NoteBatchUpdate, NoteResponse
 from app.schemas.reminder import ReminderCreate, ReminderResponse
 from app.schemas.email import EmailSend, EmailLogResponse
 from app.schemas.email_draft import EmailDraftRequest, EmailDraftResponse
@@ -18,16 +25,22 @@ from app.schemas.calculator import (
     ConvertCurrencyRequest,
     ConvertCurrencyResponse,
 )
-from app.schemas.task import TaskCreate, TaskUpdate, TaskResponse
+from app.schemas.task import TaskCreate, TaskUpdate, TaskBatchUpdate, TaskResponse
 from app.schemas.timer import TimerCreate, TimerResponse
 from app.schemas.chat import ChatRequest, ChatResponse
 from app.schemas.response import SuccessResponse, ErrorResponse
+from app.schemas.batch import BatchRequest, BatchDeleteRequest, BatchItemResult
 
 __all__ = [
     "CalendarEventCreate",
+    "CalendarEventUpdate",
+    "CalendarEventBatchUpdate",
     "CalendarEventResponse",
+    "FreeBusyResponse",
+    "TimeInterval",
     "NoteCreate",
     "NoteUpdate",
+    "NoteBatchUpdate",
     "NoteResponse",
     "ReminderCreate",
     "ReminderResponse",
@@ -46,6 +59,7 @@ __all__ = [
     "ConvertCurrencyResponse",
     "TaskCreate",
     "TaskUpdate",
+    "TaskBatchUpdate",
     "TaskResponse",
     "TimerCreate",
     "TimerResponse",
@@ -53,4 +67,7 @@ __all__ = [
     "ChatResponse",
     "SuccessResponse",
     "ErrorResponse",
+    "BatchRequest",
+    "BatchDeleteRequest",
+    "BatchItemResult",
 ]
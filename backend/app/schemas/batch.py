@@ -0,0 +1,26 @@
+"""Batch request and result schemas."""
+
+from typing import Generic, TypeVar
+from pydantic import BaseModel, Field
+
+T = TypeVar("T")
+
+MAX_BATCH_SIZE = 500
+
+
+class BatchRequest(BaseModel, Generic[T]):
+    """Schema for a batch of items to create or update."""
+    items: list[T] = Field(min_length=1, max_length=MAX_BATCH_SIZE)
+
+
+class BatchDeleteRequest(BaseModel):
+    """Schema for a batch of ids to delete."""
+    ids: list[int] = Field(min_length=1, max_length=MAX_BATCH_SIZE)
+
+
+class BatchItemResult(BaseModel, Generic[T]):
+    """Outcome of one item in a batch, in request order."""
+    id: int | None = None
+    success: bool
+    data: T | None = None
+    error: str | None = None
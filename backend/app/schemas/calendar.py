@@ -13,6 +13,20 @@ class CalendarEventCreate(BaseModel):
     attendees: str | None = None
 
 
+class CalendarEventUpdate(BaseModel):
+    """Schema for updating calendar event."""
+    title: str | None = None
+    start_time: datetime | None = None
+    end_time: datetime | None = None
+    description: str | None = None
+    attendees: str | None = None
+
+
+class CalendarEventBatchUpdate(CalendarEventUpdate):
+    """Schema for updating one calendar event in a batch."""
+    id: int
+
+
 class CalendarEventResponse(BaseModel):
     """Schema for calendar event response."""
     id: int
@@ -25,3 +39,18 @@ class CalendarEventResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class TimeInterval(BaseModel):
+    """Schema for a half-open [start, end) time interval."""
+    start: datetime
+    end: datetime
+
+
+class FreeBusyResponse(BaseModel):
+    """Schema for free/busy response."""
+    start: datetime
+    end: datetime
+    granularity_minutes: int
+    busy: list[TimeInterval]
+    free: list[TimeInterval]
@@ -14,3 +14,5 @@ class ChatResponse(BaseModel):
     response: str
     tool_used: str | None = None
     tool_result: dict | None = None
+    tool_calls: list[dict] | None = None  # Set when several tools ran in one turn
+    prompt_tokens: int | None = None  # Estimated extraction prompt tokens, when the LLM was called
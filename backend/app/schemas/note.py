@@ -16,6 +16,11 @@ class NoteUpdate(BaseModel):
     tags: str | None = None
 
 
+class NoteBatchUpdate(NoteUpdate):
+    """Schema for updating one note in a batch."""
+    id: int
+
+
 class NoteResponse(BaseModel):
     """Schema for note response."""
     id: int
@@ -11,6 +11,7 @@ class SuccessResponse(BaseModel, Generic[T]):
     success: bool = True
     data: T
     message: str | None = None
+    next_cursor: str | None = None
 
 
 class ErrorResponse(BaseModel):
@@ -23,6 +23,11 @@ class TaskUpdate(BaseModel):
     status: Optional[TaskStatus] = None
 
 
+class TaskBatchUpdate(TaskUpdate):
+    """Schema for updating one task in a batch."""
+    id: int
+
+
 class TaskResponse(BaseModel):
     """Schema for task response."""
     id: int
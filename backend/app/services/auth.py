@@ -3,8 +3,11 @@
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.models import User, RefreshToken
+from app.repositories import Repository
 from app.utils.auth import hash_password, verify_password, create_access_token, create_refresh_token
 
+users = Repository(User)
+
 
 class AuthService:
     """Service for authentication operations."""
@@ -13,11 +16,7 @@ class AuthService:
     async def create_user(db: AsyncSession, name: str, email: str, password: str) -> User:
         """Create a new user."""
         password_hash = hash_password(password)
-        user = User(name=name, email=email, password_hash=password_hash)
-        db.add(user)
-        await db.flush()
-        await db.refresh(user)
-        return user
+        return await users.create(db, {"name": name, "email": email, "password_hash": password_hash})
 
     @staticmethod
     async def get_user_by_email(db: AsyncSession, email: str) -> User | None:
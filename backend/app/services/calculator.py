@@ -1,7 +1,7 @@
 """Calculator service for computations and conversions."""
 
-import httpx
 from app.core.config import get_settings
+from app.utils.http_client import get_http_client
 
 settings = get_settings()
 
@@ -32,17 +32,17 @@ class CalculatorService:
         """Convert currency using ExchangeRate API."""
         url = f"https://v6.exchangerate-api.com/v6/{settings.EXCHANGERATE_API_KEY}/pair/{from_currency}/{to_currency}/{amount}"
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url)
-            data = response.json()
-            
-            if data.get("result") != "success":
-                raise ValueError("Currency conversion failed")
-            
-            return {
-                "amount": amount,
-                "from_currency": from_currency,
-                "to_currency": to_currency,
-                "converted_amount": data["conversion_result"],
-                "rate": data["conversion_rate"],
-            }
+        client = get_http_client()
+        response = await client.get(url)
+        data = response.json()
+        
+        if data.get("result") != "success":
+            raise ValueError("Currency conversion failed")
+        
+        return {
+            "amount": amount,
+            "from_currency": from_currency,
+            "to_currency": to_currency,
+            "converted_amount": data["conversion_result"],
+            "rate": data["conversion_rate"],
+        }
@@ -1,10 +1,22 @@
 """Calendar service for managing events and reminders."""
 
-from datetime import datetime
-from sqlalchemy import select
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import DateTime, func, literal, select
+from sqlalchemy.dialects.postgresql import TSRANGE
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.models import CalendarEvent, Reminder, ReminderStatus
-from app.schemas import CalendarEventCreate, ReminderCreate
+from app.repositories import OwnedRepository, Repository
+from app.schemas import CalendarEventBatchUpdate, CalendarEventCreate, ReminderCreate
+from app.utils.intervals import gaps, merge_busy
+
+events = OwnedRepository(CalendarEvent)
+reminders = Repository(Reminder)
+
+
+def window(start: datetime | None, end: datetime | None):
+    """A [start, end) tsrange expression, or [start, start] for an instant; a missing bound is unbounded."""
+    bounds = "[]" if start is not None and start == end else "[)"
+    return func.tsrange(literal(start, DateTime), literal(end, DateTime), bounds, type_=TSRANGE)
 
 
 class CalendarService:
@@ -13,11 +25,12 @@ class CalendarService:
     @staticmethod
     async def add_event(db: AsyncSession, event_data: CalendarEventCreate, user_id: int) -> CalendarEvent:
         """Create a new calendar event."""
-        event = CalendarEvent(**event_data.model_dump(), user_id=user_id)
-        db.add(event)
-        await db.flush()
-        await db.refresh(event)
-        return event
+        return await events.create(db, {**event_data.model_dump(), "user_id": user_id})
+
+    @staticmethod
+    async def add_events(db: AsyncSession, items: list[CalendarEventCreate], user_id: int) -> list[CalendarEvent]:
+        """Create many calendar events in one statement, in request order."""
+        return await events.create_many(db, [{**item.model_dump(), "user_id": user_id} for item in items])
 
     @staticmethod
     async def get_events(
@@ -26,39 +39,67 @@ class CalendarService:
         start_date: datetime | None = None,
         end_date: datetime | None = None,
     ) -> list[CalendarEvent]:
-        """Get calendar events with optional date filtering."""
+        """Get calendar events overlapping [start_date, end_date), either bound optional."""
+        if start_date and end_date and start_date > end_date:
+            return []
+
         query = select(CalendarEvent).where(CalendarEvent.user_id == user_id)
-        
-        if start_date:
-            query = query.where(CalendarEvent.start_time >= start_date)
-        if end_date:
-            query = query.where(CalendarEvent.end_time <= end_date)
-        
+
+        if start_date or end_date:
+            query = query.where(CalendarEvent.time_range.overlaps(window(start_date, end_date)))
+
         query = query.order_by(CalendarEvent.start_time)
         result = await db.execute(query)
         return list(result.scalars().all())
 
+    @staticmethod
+    async def free_busy(
+        db: AsyncSession,
+        user_id: int,
+        start: datetime,
+        end: datetime,
+        granularity: timedelta,
+    ) -> tuple[list[tuple[datetime, datetime]], list[tuple[datetime, datetime]]]:
+        """Return the (busy, free) intervals of [start, end) on a grid of `granularity` steps.
+
+        Busy time is rounded outward to the grid, so free slots are always whole steps.
+        """
+        # Event times are stored as naive UTC
+        start, end = (
+            moment.astimezone(timezone.utc).replace(tzinfo=None) if moment.tzinfo else moment
+            for moment in (start, end)
+        )
+        query = (
+            select(CalendarEvent.start_time, CalendarEvent.end_time)
+            .where(CalendarEvent.user_id == user_id, CalendarEvent.time_range.overlaps(window(start, end)))
+            .order_by(CalendarEvent.start_time)
+        )
+        result = await db.execute(query)
+        busy = merge_busy(result.tuples(), start, end, granularity)
+        return busy, gaps(busy, start, end)
+
     @staticmethod
     async def delete_event(db: AsyncSession, event_id: int, user_id: int) -> bool:
         """Delete a calendar event."""
-        query = select(CalendarEvent).where(CalendarEvent.id == event_id, CalendarEvent.user_id == user_id)
-        result = await db.execute(query)
-        event = result.scalar_one_or_none()
-        
-        if not event:
-            return False
-        
-        await db.delete(event)
-        return True
+        return await events.delete(db, event_id, user_id)
+
+    @staticmethod
+    async def update_events(
+        db: AsyncSession, items: list[CalendarEventBatchUpdate], user_id: int
+    ) -> list[CalendarEvent | None]:
+        """Update many calendar events, returning each item's event, or None if it wasn't found."""
+        updated = await events.update_many(db, user_id, [item.model_dump(exclude_unset=True) for item in items])
+        return [updated.get(item.id) for item in items]
+
+    @staticmethod
+    async def delete_events(db: AsyncSession, event_ids: list[int], user_id: int) -> set[int]:
+        """Delete many calendar events in one statement, returning the ids that were deleted."""
+        return await events.delete_many(db, user_id, event_ids)
 
     @staticmethod
     async def add_reminder(db: AsyncSession, reminder_data: ReminderCreate) -> Reminder:
         """Create a new reminder."""
-        reminder = Reminder(**reminder_data.model_dump())
-        db.add(reminder)
-        await db.flush()
-        await db.refresh(reminder)
-        return reminder
+        return await reminders.create(db, reminder_data.model_dump())
 
     @staticmethod
     async def get_reminders(db: AsyncSession, status: ReminderStatus | None = None) -> list[Reminder]:
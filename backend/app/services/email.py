@@ -4,11 +4,16 @@ import resend
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.config import get_settings
 from app.models import EmailLog, EmailStatus
+from app.repositories import Repository
 from app.schemas import EmailSend
+from app.utils.pagination import Keyset
 
 settings = get_settings()
 resend.api_key = settings.RESEND_API_KEY
 
+email_logs = Repository(EmailLog)
+email_log_order = Keyset(EmailLog.sent_at, EmailLog.id, descending=True)
+
 
 class EmailService:
     """Service for email operations."""
@@ -27,23 +32,22 @@ class EmailService:
         except Exception:
             status = EmailStatus.FAILED
         
-        email_log = EmailLog(
-            user_id=user_id,
-            recipient=email_data.recipient,
-            subject=email_data.subject,
-            body=email_data.body,
-            status=status,
-        )
-        db.add(email_log)
-        await db.flush()
-        await db.refresh(email_log)
-        return email_log
+        return await email_logs.create(db, {
+            "user_id": user_id,
+            "recipient": email_data.recipient,
+            "subject": email_data.subject,
+            "body": email_data.body,
+            "status": status,
+        })
 
     @staticmethod
-    async def get_email_logs(db: AsyncSession, user_id: int, skip: int = 0, limit: int = 100) -> list[EmailLog]:
-        """Get email logs with pagination."""
+    async def get_email_logs(
+        db: AsyncSession, user_id: int, skip: int = 0, limit: int = 100, cursor: str | None = None
+    ) -> list[EmailLog]:
+        """Get email logs with pagination, newest first, after an optional cursor."""
         from sqlalchemy import select
-        query = select(EmailLog).where(EmailLog.user_id == user_id).order_by(EmailLog.sent_at.desc()).offset(skip).limit(limit)
+        query = email_log_order.apply(select(EmailLog).where(EmailLog.user_id == user_id), cursor)
+        query = query.offset(skip).limit(limit)
         result = await db.execute(query)
         return list(result.scalars().all())
 
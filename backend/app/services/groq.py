@@ -1,26 +1,27 @@
 """Groq service for natural language processing."""
 
 import json
-from groq import Groq
+from typing import AsyncIterator
+from groq import AsyncGroq
 from app.core.config import get_settings
-from app.utils.prompts import SYSTEM_PROMPT, RESPONSE_PROMPT
-from app.utils.tools import TOOLS
+from app.services.prompt_builder import PromptBuilder
+from app.utils.prompts import RESPONSE_PROMPT
 
 settings = get_settings()
-client = Groq(api_key=settings.GROQ_API_KEY)
+client = AsyncGroq(api_key=settings.GROQ_API_KEY, base_url=settings.GROQ_BASE_URL)
 
 
 class GroqService:
     """Service for Groq LLM operations."""
 
     @staticmethod
-    def process_message(user_message: str, tool_result: dict | None = None) -> dict:
+    async def process_message(user_message: str, tool_result: dict | None = None) -> dict:
         """Process user message, extract tool calls, and generate response if tool executed."""
         
         # If tool result provided, generate response
         if tool_result:
             result_summary = json.dumps(tool_result.get("data", {}), indent=2)
-            response = client.chat.completions.create(
+            response = await client.chat.completions.create(
                 model="llama-3.3-70b-versatile",
                 messages=[
                     {"role": "system", "content": RESPONSE_PROMPT},
@@ -32,13 +33,14 @@ class GroqService:
             return {"response": response.choices[0].message.content}
         
         # Extract tool call from user message
-        response = client.chat.completions.create(
+        prompt = PromptBuilder.build(user_message)
+        response = await client.chat.completions.create(
             model="llama-3.3-70b-versatile",
             messages=[
-                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "system", "content": prompt["system_prompt"]},
                 {"role": "user", "content": user_message},
             ],
-            tools=TOOLS,
+            tools=prompt["tools"],
             tool_choice="auto",
             temperature=0.3,
             max_tokens=500,
@@ -47,10 +49,34 @@ class GroqService:
         message = response.choices[0].message
 
         if message.tool_calls:
-            tool_call = message.tool_calls[0]
+            calls = [
+                {"tool_name": tool_call.function.name, "parameters": json.loads(tool_call.function.arguments)}
+                for tool_call in message.tool_calls
+            ]
             return {
-                "tool_name": tool_call.function.name,
-                "parameters": json.loads(tool_call.function.arguments),
+                "tool_name": calls[0]["tool_name"],
+                "parameters": calls[0]["parameters"],
+                "tool_calls": calls,
+                "prompt_tokens": prompt["prompt_tokens"],
             }
 
-        return {"tool_name": None, "response": message.content}
+        return {"tool_name": None, "response": message.content, "prompt_tokens": prompt["prompt_tokens"]}
+
+    @staticmethod
+    async def stream_response(user_message: str, tool_result: dict) -> AsyncIterator[str]:
+        """Stream the natural-language response for a tool result, token by token."""
+        result_summary = json.dumps(tool_result.get("data", {}), indent=2)
+        stream = await client.chat.completions.create(
+            model="llama-3.3-70b-versatile",
+            messages=[
+                {"role": "system", "content": RESPONSE_PROMPT},
+                {"role": "user", "content": f"User asked: {user_message}\n\nResult: {result_summary}\n\nGenerate a natural response:"},
+            ],
+            temperature=0.9,
+            max_tokens=200,
+            stream=True,
+        )
+        async for chunk in stream:
+            token = chunk.choices[0].delta.content
+            if token:
+                yield token
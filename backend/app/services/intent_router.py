@@ -0,0 +1,72 @@
+"""Rule-based intent matching for unambiguous commands, bypassing the LLM."""
+
+import re
+
+# Arithmetic expression: digits, operators, parentheses and spaces, with at least one operator
+EXPRESSION = r"(?P<expression>[\d\s.()]*\d[\d\s.()]*(?:[-+*/%][\d\s.()]+)+)"
+
+DURATION_UNITS = {
+    "s": 1, "sec": 1, "secs": 1, "second": 1, "seconds": 1,
+    "m": 60, "min": 60, "mins": 60, "minute": 60, "minutes": 60,
+    "h": 3600, "hr": 3600, "hrs": 3600, "hour": 3600, "hours": 3600,
+}
+DURATION = r"(?P<duration>(?:\d+\s*(?:seconds?|secs?|minutes?|mins?|hours?|hrs?|[smh])\b\s*(?:and\s+)?)+)"
+DURATION_PART = re.compile(r"(\d+)\s*(seconds?|secs?|minutes?|mins?|hours?|hrs?|[smh])\b")
+
+LIST_VERB = r"(?:show|list|get|view|display|what are|what's|whats)\s+(?:me\s+)?(?:all\s+)?(?:of\s+)?"
+
+RULES: list[tuple[str, re.Pattern]] = [
+    ("calculate", re.compile(rf"^(?:(?:calculate|compute|evaluate|what is|what's|whats):?\s*)?{EXPRESSION}\s*=?$")),
+    ("set_timer", re.compile(rf"^(?:(?:set|start)\s+(?:a\s+)?timer\s+for|timer\s+for|remind\s+me\s+in):?\s*{DURATION}$")),
+    ("list_tasks", re.compile(rf"^(?:{LIST_VERB})?my\s+(?:(?P<status>pending|completed)\s+)?(?:tasks|todos|to-dos|todo list|to-do list)$")),
+    ("list_notes", re.compile(rf"^(?:{LIST_VERB})?my\s+notes$")),
+    ("list_timers", re.compile(rf"^(?:{LIST_VERB})?my\s+(?:timers|alarms|timers and alarms)$")),
+    ("list_events", re.compile(rf"^(?:(?:{LIST_VERB})?my\s+(?:events|calendar|calendar events)|what's on my calendar|whats on my calendar)$")),
+    ("complete_task", re.compile(r"^(?:complete|finish|mark)\s+task\s+#?(?P<task_id>\d+)(?:\s+as\s+(?:done|complete|completed|finished))?$")),
+    ("delete_task", re.compile(r"^(?:delete|remove)\s+task\s+#?(?P<task_id>\d+)$")),
+    ("delete_note", re.compile(r"^(?:delete|remove)\s+note\s+#?(?P<note_id>\d+)$")),
+    ("delete_event", re.compile(r"^(?:delete|remove|cancel)\s+event\s+#?(?P<event_id>\d+)$")),
+    ("cancel_timer", re.compile(r"^(?:cancel|stop|delete)\s+(?:timer|alarm)\s+#?(?P<timer_id>\d+)$")),
+    ("convert_currency", re.compile(r"^convert(?:\s+currency)?:?\s+(?P<amount>\d+(?:\.\d+)?)\s*(?P<from_currency>[a-z]{3})\s+(?:to|in|into)\s+(?P<to_currency>[a-z]{3})$")),
+]
+
+
+def _parse_duration(text: str) -> int:
+    """Convert e.g. '1 hour and 30 minutes' to seconds."""
+    return sum(int(amount) * DURATION_UNITS[unit] for amount, unit in DURATION_PART.findall(text))
+
+
+def _parameters(tool_name: str, groups: dict) -> dict:
+    """Convert regex groups into tool parameters."""
+    if tool_name == "calculate":
+        return {"expression": " ".join(groups["expression"].split())}
+    if tool_name == "set_timer":
+        return {"duration_seconds": _parse_duration(groups["duration"])}
+    if tool_name == "list_tasks":
+        return {"status": groups["status"]} if groups.get("status") else {}
+    if tool_name == "convert_currency":
+        return {
+            "amount": float(groups["amount"]),
+            "from_currency": groups["from_currency"].upper(),
+            "to_currency": groups["to_currency"].upper(),
+        }
+    return {name: int(value) for name, value in groups.items() if value is not None}
+
+
+class IntentRouter:
+    """Match unambiguous commands to tool calls without an LLM round-trip."""
+
+    @staticmethod
+    def match(message: str) -> dict | None:
+        """Return a tool call for a confidently matched message, or None to fall back to the LLM."""
+        text = " ".join(message.lower().split()).rstrip(" .!?")
+
+        for tool_name, pattern in RULES:
+            found = pattern.match(text)
+            if found:
+                parameters = _parameters(tool_name, found.groupdict())
+                if tool_name == "set_timer" and parameters["duration_seconds"] <= 0:
+                    return None
+                return {"tool_name": tool_name, "parameters": parameters}
+
+        return None
@@ -0,0 +1,96 @@
+"""Cache for LLM tool-call extraction results."""
+
+import hashlib
+import json
+import re
+from app.core.config import get_settings
+from app.utils.metrics import metrics
+from app.utils.prompts import SYSTEM_PROMPT, build_compact_prompt
+from app.utils.tools import TOOLS
+from app.utils.ttl_cache import TTLCache
+
+settings = get_settings()
+
+# Changes whenever the system prompt, tool schemas or prompt settings change, so stale
+# extractions are never served
+PROMPT_VERSION = hashlib.sha256(
+    (
+        SYSTEM_PROMPT
+        + build_compact_prompt()
+        + json.dumps(TOOLS, sort_keys=True)
+        + f"{settings.PROMPT_VARIANT}:{settings.PROMPT_TOOL_SUBSET}:{settings.PROMPT_TOKEN_BUDGET}"
+    ).encode()
+).hexdigest()[:16]
+
+# Phrasings whose extraction depends on the current date/time (relative dates and
+# offsets, clock times)
+TIME_SENSITIVE = re.compile(
+    r"\b("
+    r"today|tonight|tomorrow|yesterday|now|ago|later|soon|weekend|noon|midnight|"
+    r"morning|afternoon|evening|"
+    r"next|last|this\s+(week|month|year)|"
+    r"(due\s+)?in\s+(a|an|a\s+few|a\s+couple(\s+of)?|half\s+an?|\d+|one|two|three|four|five|six|seven|eight|nine|ten|"
+    r"eleven|twelve|fifteen|twenty|thirty|forty|fifty|sixty)\s+(minute|min|hour|hr|day|week|fortnight|month|year)s?|"
+    r"mon(day)?|tue(s|sday)?|wed(nesday)?|thu(rs|rsday)?|fri(day)?|sat(urday)?|sun(day)?|"
+    r"jan(uary)?|feb(ruary)?|mar(ch)?|apr(il)?|may|june?|july?|aug(ust)?|sep(t|tember)?|oct(ober)?|nov(ember)?|dec(ember)?|"
+    r"\d{1,2}(:\d{2})?\s*(am|pm)|\d{1,2}:\d{2}|at\s+\d{1,2}"
+    r")\b",
+    re.IGNORECASE,
+)
+
+# An absolute date the LLM resolved from the message, which goes stale however it was phrased
+ISO_DATE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+def normalize_message(message: str) -> str:
+    """Normalize message text for cache keys (case, whitespace, trailing punctuation)."""
+    return " ".join(message.lower().split()).rstrip(" .!?")
+
+
+class ToolCallCache:
+    """Two-tier cache (in-process LRU, optional Redis) for tool-call extraction."""
+
+    def __init__(self, max_size: int, ttl_seconds: int, redis_url: str = ""):
+        self._tiers = TTLCache("llm_cache", max_size, ttl_seconds, redis_url)
+
+    def key(self, provider: str, message: str) -> str:
+        """Build the cache key for a message."""
+        digest = hashlib.sha256(normalize_message(message).encode()).hexdigest()
+        return f"llm:extract:{provider}:{PROMPT_VERSION}:{digest}"
+
+    @staticmethod
+    def is_cacheable(message: str) -> bool:
+        """Check whether a message's extraction is safe to reuse."""
+        return not TIME_SENSITIVE.search(message)
+
+    async def get(self, provider: str, message: str) -> dict | None:
+        """Get a cached extraction result."""
+        if not self.is_cacheable(message):
+            metrics.increment("llm_cache.bypass")
+            return None
+
+        value = await self._tiers.get(self.key(provider, message))
+        return json.loads(value) if value is not None else None
+
+    async def set(self, provider: str, message: str, result: dict):
+        """Cache an extraction result."""
+        if not self.is_cacheable(message):
+            return
+
+        # Cache hits spend no prompt tokens
+        value = json.dumps({name: item for name, item in result.items() if name != "prompt_tokens"})
+        if ISO_DATE.search(value):
+            metrics.increment("llm_cache.bypass")
+            return
+        await self._tiers.set(self.key(provider, message), value)
+
+    def clear(self):
+        """Clear the in-process tier."""
+        self._tiers.clear()
+
+
+tool_call_cache = ToolCallCache(
+    max_size=settings.LLM_CACHE_MAX_SIZE,
+    ttl_seconds=settings.LLM_CACHE_TTL_SECONDS,
+    redis_url=settings.LLM_CACHE_REDIS_URL,
+)
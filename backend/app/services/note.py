@@ -1,9 +1,21 @@
 """Note service for managing notes."""
 
-from sqlalchemy import select, or_
+import re
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.models import Note
-from app.schemas import NoteCreate, NoteUpdate
+from app.models.note import SEARCH_CONFIG
+from app.repositories import OwnedRepository
+from app.schemas import NoteBatchUpdate, NoteCreate, NoteUpdate
+from app.utils.pagination import Keyset
+
+notes = OwnedRepository(Note)
+note_order = Keyset(Note.created_at, Note.id, descending=True)
+
+
+def prefix_tsquery(query: str) -> str:
+    """Build a tsquery matching every word of `query` as a prefix, e.g. "pyth tip" -> "pyth:* & tip:*"."""
+    return " & ".join(f"{word}:*" for word in re.findall(r"\w+", query.lower()))
 
 
 class NoteService:
@@ -12,16 +24,19 @@ class NoteService:
     @staticmethod
     async def create_note(db: AsyncSession, note_data: NoteCreate, user_id: int) -> Note:
         """Create a new note."""
-        note = Note(**note_data.model_dump(), user_id=user_id)
-        db.add(note)
-        await db.flush()
-        await db.refresh(note)
-        return note
+        return await notes.create(db, {**note_data.model_dump(), "user_id": user_id})
+
+    @staticmethod
+    async def create_notes(db: AsyncSession, items: list[NoteCreate], user_id: int) -> list[Note]:
+        """Create many notes in one statement, in request order."""
+        return await notes.create_many(db, [{**item.model_dump(), "user_id": user_id} for item in items])
 
     @staticmethod
-    async def get_notes(db: AsyncSession, user_id: int, skip: int = 0, limit: int = 100) -> list[Note]:
-        """Get all notes with pagination."""
-        query = select(Note).where(Note.user_id == user_id).order_by(Note.created_at.desc()).offset(skip).limit(limit)
+    async def get_notes(
+        db: AsyncSession, user_id: int, skip: int = 0, limit: int = 100, cursor: str | None = None
+    ) -> list[Note]:
+        """Get all notes with pagination, newest first, after an optional cursor."""
+        query = note_order.apply(select(Note).where(Note.user_id == user_id), cursor).offset(skip).limit(limit)
         result = await db.execute(query)
         return list(result.scalars().all())
 
@@ -34,48 +49,50 @@ class NoteService:
 
     @staticmethod
     async def search_notes(db: AsyncSession, user_id: int, query: str, tags: str | None = None) -> list[Note]:
-        """Search notes by content or tags."""
+        """Search notes by content or tags, best matches first.
+
+        Words match by prefix ("pyth" finds "Python"); tags match exactly, ignoring case.
+        """
         stmt = select(Note).where(Note.user_id == user_id)
-        
+        order_by = [Note.created_at.desc(), Note.id.desc()]
+
         if query:
-            stmt = stmt.where(Note.content.ilike(f"%{query}%"))
-        
+            terms = prefix_tsquery(query)
+            if not terms:
+                # Nothing searchable (e.g. only punctuation), so nothing can match
+                return []
+            ts_query = func.to_tsquery(SEARCH_CONFIG, terms)
+            stmt = stmt.where(Note.search_vector.op("@@")(ts_query))
+            order_by.insert(0, func.ts_rank(Note.search_vector, ts_query).desc())
+
         if tags:
-            tag_list = [t.strip() for t in tags.split(",")]
-            tag_filters = [Note.tags.ilike(f"%{tag}%") for tag in tag_list]
-            stmt = stmt.where(or_(*tag_filters))
-        
-        stmt = stmt.order_by(Note.created_at.desc())
-        result = await db.execute(stmt)
+            tag_list = [tag.strip().lower() for tag in tags.split(",") if tag.strip()]
+            if tag_list:
+                stmt = stmt.where(Note.tag_array.overlap(tag_list))
+
+        result = await db.execute(stmt.order_by(*order_by))
         return list(result.scalars().all())
 
     @staticmethod
     async def update_note(db: AsyncSession, note_id: int, note_data: NoteUpdate, user_id: int) -> Note | None:
         """Update a note."""
-        query = select(Note).where(Note.id == note_id, Note.user_id == user_id)
-        result = await db.execute(query)
-        note = result.scalar_one_or_none()
-        
-        if not note:
-            return None
-        
         update_data = note_data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(note, field, value)
-        
-        await db.flush()
-        await db.refresh(note)
-        return note
+        if not update_data:
+            return await NoteService.get_note(db, note_id, user_id)
+        return await notes.update(db, note_id, user_id, update_data)
+
+    @staticmethod
+    async def update_notes(db: AsyncSession, items: list[NoteBatchUpdate], user_id: int) -> list[Note | None]:
+        """Update many notes, returning each item's note, or None if it wasn't found."""
+        updated = await notes.update_many(db, user_id, [item.model_dump(exclude_unset=True) for item in items])
+        return [updated.get(item.id) for item in items]
 
     @staticmethod
     async def delete_note(db: AsyncSession, note_id: int, user_id: int) -> bool:
         """Delete a note."""
-        query = select(Note).where(Note.id == note_id, Note.user_id == user_id)
-        result = await db.execute(query)
-        note = result.scalar_one_or_none()
-        
-        if not note:
-            return False
-        
-        await db.delete(note)
-        return True
+        return await notes.delete(db, note_id, user_id)
+
+    @staticmethod
+    async def delete_notes(db: AsyncSession, note_ids: list[int], user_id: int) -> set[int]:
+        """Delete many notes in one statement, returning the ids that were deleted."""
+        return await notes.delete_many(db, user_id, note_ids)
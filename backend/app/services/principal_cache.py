@@ -0,0 +1,57 @@
+"""Cache of verified, active users for request authentication."""
+
+from pydantic import BaseModel
+from app.core.config import get_settings
+from app.utils.metrics import metrics
+from app.utils.ttl_cache import TTLCache
+
+settings = get_settings()
+
+
+class Principal(BaseModel):
+    """The authenticated user, as needed by routes."""
+    id: int
+    name: str
+    email: str
+    is_active: bool
+
+
+class PrincipalCache:
+    """Two-tier cache (in-process LRU, optional Redis) of active users, keyed by user id.
+
+    Entries live for a short TTL. Invalidation clears this process and the Redis tier;
+    other processes' in-process entries expire within the TTL.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: int, redis_url: str = ""):
+        self._tiers = TTLCache("principal_cache", max_size, ttl_seconds, redis_url)
+
+    @staticmethod
+    def key(user_id: int) -> str:
+        """Build the cache key for a user."""
+        return f"auth:principal:{user_id}"
+
+    async def get(self, user_id: int) -> Principal | None:
+        """Get a cached principal."""
+        value = await self._tiers.get(self.key(user_id))
+        return Principal.model_validate_json(value) if value is not None else None
+
+    async def set(self, principal: Principal):
+        """Cache an active user."""
+        await self._tiers.set(self.key(principal.id), principal.model_dump_json())
+
+    async def invalidate(self, user_id: int):
+        """Drop a user, e.g. on logout; call only once the change is committed."""
+        await self._tiers.delete(self.key(user_id))
+        metrics.increment("principal_cache.invalidated")
+
+    def clear(self):
+        """Clear the in-process tier."""
+        self._tiers.clear()
+
+
+principal_cache = PrincipalCache(
+    max_size=settings.PRINCIPAL_CACHE_MAX_SIZE,
+    ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+    redis_url=settings.PRINCIPAL_CACHE_REDIS_URL,
+)
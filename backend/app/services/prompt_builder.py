@@ -0,0 +1,108 @@
+"""Token-budget-aware extraction prompt builder."""
+
+import json
+import math
+import re
+from functools import lru_cache
+from app.core.config import get_settings
+from app.utils.metrics import metrics
+from app.utils.prompts import build_compact_prompt, build_system_prompt
+from app.utils.tools import TOOL_SPECS, TOOLS, build_compact_tools
+
+settings = get_settings()
+
+PROMPT_VARIANTS = ("full", "compact")
+
+# Cheap keyword classifier: a message gets the tools of every category it mentions
+CATEGORY_KEYWORDS = {
+    "Task Management": re.compile(r"\b(tasks?|todos?|to-?dos?|to do|chores?)\b"),
+    "Calendar Management": re.compile(r"\b(calendar|events?|meetings?|schedule|appointments?|agenda|book)\b"),
+    "Note Management": re.compile(r"\b(notes?|jot|write down|memo)\b"),
+    "Communication": re.compile(r"\b(e-?mails?|mail|send)\b|@"),
+    "Timer & Alarm Management": re.compile(
+        r"\b(timers?|alarms?|remind|countdown|wake)\b|\b\d+\s*(seconds?|secs?|minutes?|mins?|hours?|hrs?)\b"
+    ),
+    "Utilities": re.compile(
+        r"\b(search|find|look up|google|calculate|compute|convert|exchange|currency|tip|percent|how much|"
+        r"what is|what's|who|why|how|dollars?|euros?|pounds?|naira|yen|usd|eur|gbp|ngn|jpy|cad|aud)\b"
+        r"|\d\s*[-+*/%^]\s*\d|[%$€£]"
+    ),
+}
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of text (about 4 characters per token for English and JSON)."""
+    return math.ceil(len(text) / 4)
+
+
+def select_tools(message: str) -> tuple[str, ...]:
+    """Choose the tools relevant to a message, or all tools when no category matches."""
+    text = message.lower()
+    categories = {category for category, pattern in CATEGORY_KEYWORDS.items() if pattern.search(text)}
+    if not categories:
+        return tuple(spec["name"] for spec in TOOL_SPECS)
+    return tuple(spec["name"] for spec in TOOL_SPECS if spec["category"] in categories)
+
+
+@lru_cache(maxsize=256)
+def render_prompt(variant: str, tool_names: tuple[str, ...]) -> dict:
+    """Render (once per variant and tool subset) the system prompt and tool schemas."""
+    specs = [spec for spec in TOOL_SPECS if spec["name"] in tool_names]
+    if variant == "compact":
+        system_prompt = build_compact_prompt(specs)
+        tools = build_compact_tools(specs)
+    elif len(specs) == len(TOOL_SPECS):
+        system_prompt = build_system_prompt()
+        tools = TOOLS
+    else:
+        system_prompt = build_system_prompt(specs)
+        tools = [tool for tool in TOOLS if tool["function"]["name"] in tool_names]
+    return {
+        "variant": variant,
+        "tool_names": tool_names,
+        "system_prompt": system_prompt,
+        "tools": tools,
+        "base_tokens": estimate_tokens(system_prompt) + estimate_tokens(json.dumps(tools)),
+    }
+
+
+class PromptBuilder:
+    """Build the extraction prompt for a message within the configured token budget."""
+
+    @staticmethod
+    def build(
+        message: str,
+        variant: str | None = None,
+        tool_subset: bool | None = None,
+        token_budget: int | None = None,
+    ) -> dict:
+        """Build the prompt for a message.
+
+        Starts from the configured variant and tool subset; if that exceeds the token
+        budget, falls back to the compact variant and then to the compact variant with
+        only the relevant tools. Returns the cheapest option if nothing fits.
+        """
+        variant = variant or settings.PROMPT_VARIANT
+        if variant not in PROMPT_VARIANTS:
+            raise ValueError(f"Unknown prompt variant: {variant}")
+        tool_subset = settings.PROMPT_TOOL_SUBSET if tool_subset is None else tool_subset
+        token_budget = settings.PROMPT_TOKEN_BUDGET if token_budget is None else token_budget
+
+        all_tools = tuple(spec["name"] for spec in TOOL_SPECS)
+        relevant_tools = select_tools(message) if tool_subset or token_budget else all_tools
+        options = [(variant, relevant_tools if tool_subset else all_tools)]
+        if token_budget:
+            options += [("compact", options[0][1]), ("compact", relevant_tools)]
+
+        message_tokens = estimate_tokens(message)
+        for option_variant, tool_names in options:
+            prompt = render_prompt(option_variant, tool_names)
+            prompt_tokens = prompt["base_tokens"] + message_tokens
+            if not token_budget or prompt_tokens <= token_budget:
+                break
+        else:
+            metrics.increment("llm.prompt.over_budget")
+
+        metrics.increment(f"llm.prompt.{prompt['variant']}")
+        metrics.increment("llm.prompt_tokens", prompt_tokens)
+        return {**prompt, "prompt_tokens": prompt_tokens}
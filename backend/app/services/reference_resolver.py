@@ -0,0 +1,86 @@
+"""Resolve items referenced by name ("buy groceries") instead of ID, for tool calls."""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models import CalendarEvent, Note, Task
+from app.services.calendar import events
+from app.services.note import notes
+from app.services.task import tasks
+from app.utils.metrics import metrics
+
+# The best match must beat the runner-up by this much to be used without asking
+AMBIGUITY_MARGIN = 0.15
+
+# Kind -> how to find that kind of item by name: the column matched, and the tool
+# parameters carrying the ID and the name
+REFERENCE_KINDS = {
+    "task": {"repository": tasks, "column": Task.title, "id_parameter": "task_id", "parameter": "title"},
+    "event": {"repository": events, "column": CalendarEvent.title, "id_parameter": "event_id", "parameter": "title"},
+    "note": {"repository": notes, "column": Note.content, "id_parameter": "note_id", "parameter": "content"},
+}
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.lower().split())
+
+
+def choose(reference: str, matches: list[tuple[object, str, float]]) -> object | None:
+    """Pick the row a reference clearly means, or None if there is no clear winner.
+
+    A unique exact (case- and spacing-insensitive) match wins; otherwise the best match
+    must lead the runner-up by AMBIGUITY_MARGIN.
+    """
+    if not matches:
+        return None
+    exact = [row for row, text, _ in matches if _normalize(text) == _normalize(reference)]
+    if len(exact) == 1:
+        return exact[0]
+    if len(matches) == 1 or matches[0][2] - matches[1][2] >= AMBIGUITY_MARGIN:
+        return matches[0][0]
+    return None
+
+
+class ReferenceResolver:
+    """Turn a tool call's ID-or-name arguments into an ID."""
+
+    @staticmethod
+    async def resolve(
+        db: AsyncSession,
+        kind: str,
+        arguments: dict,
+        user_id: int,
+        *criteria,
+    ) -> tuple[int | None, dict | None]:
+        """Return (id, None), or (None, error result) if the name matches no single item.
+
+        An explicit ID always wins. `criteria` narrow the candidates, e.g. to pending tasks.
+        """
+        spec = REFERENCE_KINDS[kind]
+        record_id = arguments.get(spec["id_parameter"])
+        if record_id is not None:
+            return record_id, None
+
+        reference = (arguments.get(spec["parameter"]) or "").strip()
+        if not reference:
+            error = f"Missing required parameter: {spec['id_parameter']} or {spec['parameter']}"
+            return None, {"success": False, "error": error}
+
+        column = spec["column"]
+        found = await spec["repository"].match(db, user_id, column, reference, *criteria)
+        matches = [(row, getattr(row, column.key), score) for row, score in found]
+        row = choose(reference, matches)
+        if row is not None:
+            metrics.increment(f"reference.{kind}.resolved")
+            return row.id, None
+
+        if not matches:
+            metrics.increment(f"reference.{kind}.missing")
+            return None, {"success": False, "error": f"No {kind} matches '{reference}'"}
+
+        metrics.increment(f"reference.{kind}.ambiguous")
+        candidates = [{"id": row.id, spec["parameter"]: text[:50]} for row, text, _ in matches]
+        listed = ", ".join(f"#{row.id} '{text[:50]}'" for row, text, _ in matches)
+        return None, {
+            "success": False,
+            "error": f"Several {kind}s match '{reference}': {listed}. Which one?",
+            "data": {"candidates": candidates},
+        }
@@ -0,0 +1,77 @@
+"""Template-based responses for tool results that don't need LLM phrasing."""
+
+from typing import Callable
+from app.core.config import get_settings
+
+settings = get_settings()
+
+
+def _format_number(value: float) -> str:
+    """Format a number without a trailing .0 for whole values."""
+    return str(int(value)) if float(value).is_integer() else f"{value:g}"
+
+
+def _format_duration(seconds: int) -> str:
+    """Format a duration in seconds as e.g. '1 hour 5 minutes'."""
+    parts = []
+    for unit, size in (("hour", 3600), ("minute", 60), ("second", 1)):
+        count, seconds = divmod(seconds, size)
+        if count:
+            parts.append(f"{count} {unit}{'s' if count != 1 else ''}")
+    return " ".join(parts) or "0 seconds"
+
+
+def _render_set_timer(parameters: dict, data: dict) -> str:
+    label = parameters.get("label")
+    duration = _format_duration(int(data["duration_seconds"]))
+    return f"Timer set for {duration}" + (f" ({label})." if label else ".")
+
+
+def _render_set_alarm(parameters: dict, data: dict) -> str:
+    label = parameters.get("label")
+    return f"Alarm set for {data['trigger_time']}" + (f" ({label})." if label else ".")
+
+
+def _render_send_email(parameters: dict, data: dict) -> str:
+    if data.get("status") == "sent":
+        return f"Your email to {parameters.get('recipient')} has been sent."
+    return f"I couldn't send your email to {parameters.get('recipient')}. Want to try again?"
+
+
+# Tool name -> renderer taking the tool parameters and the result data
+RESPONSE_TEMPLATES: dict[str, Callable[[dict, dict], str]] = {
+    "create_task": lambda parameters, data: f"I've added '{data['title']}' to your todo list!",
+    "complete_task": lambda parameters, data: f"Marked '{data['title']}' as completed! Great job!",
+    "delete_task": lambda parameters, data: f"Done! Task {data['id']} has been deleted.",
+    "create_event": lambda parameters, data: f"I've added '{data['title']}' to your calendar.",
+    "delete_event": lambda parameters, data: f"Done! Event {data['id']} has been removed from your calendar.",
+    "create_note": lambda parameters, data: f"Saved your note: '{data['content']}'",
+    "delete_note": lambda parameters, data: f"Done! Note {data['id']} has been deleted.",
+    "send_email": _render_send_email,
+    "calculate": lambda parameters, data: f"The result is {_format_number(data['result'])}",
+    "convert_currency": lambda parameters, data: (
+        f"{_format_number(data['amount'])} {data['from_currency']} is "
+        f"{_format_number(round(data['converted_amount'], 2))} {data['to_currency']} "
+        f"(rate {data['rate']})."
+    ),
+    "set_timer": _render_set_timer,
+    "set_alarm": _render_set_alarm,
+    "cancel_timer": lambda parameters, data: f"Done! Timer {parameters.get('timer_id')} has been cancelled.",
+}
+
+
+class ResponseRenderer:
+    """Render tool results locally, skipping the LLM phrasing round-trip."""
+
+    @staticmethod
+    def should_render(tool_name: str) -> bool:
+        """Check whether a tool's response is rendered from a template."""
+        return tool_name in settings.TEMPLATE_RESPONSE_TOOLS and tool_name in RESPONSE_TEMPLATES
+
+    @staticmethod
+    def render(tool_name: str, parameters: dict | None, tool_result: dict) -> str | None:
+        """Render a successful tool result, or return None to fall back to the LLM."""
+        try:
+            return RESPONSE_TEMPLATES[tool_name](parameters or {}, tool_result.get("data", {}))
+        except (KeyError, TypeError, ValueError):
+            return None
@@ -1,7 +1,7 @@
 """Search service for web search."""
 
-import httpx
 from bs4 import BeautifulSoup
+from app.utils.http_client import get_http_client
 
 
 class SearchService:
@@ -16,24 +16,24 @@ class SearchService:
             "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
         }
         
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, data=params, headers=headers, follow_redirects=True)
-            soup = BeautifulSoup(response.text, "html.parser")
-            
-            results = []
-            for result in soup.select(".result")[:max_results]:
-                title_elem = result.select_one(".result__title")
-                snippet_elem = result.select_one(".result__snippet")
-                url_elem = result.select_one(".result__url")
-                
-                if title_elem and snippet_elem and url_elem:
-                    results.append({
-                        "title": title_elem.get_text(strip=True),
-                        "snippet": snippet_elem.get_text(strip=True),
-                        "url": url_elem.get("href", ""),
-                    })
+        client = get_http_client()
+        response = await client.post(url, data=params, headers=headers, follow_redirects=True)
+        soup = BeautifulSoup(response.text, "html.parser")
+        
+        results = []
+        for result in soup.select(".result")[:max_results]:
+            title_elem = result.select_one(".result__title")
+            snippet_elem = result.select_one(".result__snippet")
+            url_elem = result.select_one(".result__url")
             
-            return results
+            if title_elem and snippet_elem and url_elem:
+                results.append({
+                    "title": title_elem.get_text(strip=True),
+                    "snippet": snippet_elem.get_text(strip=True),
+                    "url": url_elem.get("href", ""),
+                })
+        
+        return results
 
     @staticmethod
     def summarize_results(query: str, results: list[dict]) -> dict:
@@ -4,7 +4,12 @@ from datetime import datetime
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.models import Task, TaskStatus
-from app.schemas import TaskCreate, TaskUpdate
+from app.repositories import OwnedRepository
+from app.schemas import TaskBatchUpdate, TaskCreate, TaskUpdate
+from app.utils.pagination import Keyset
+
+tasks = OwnedRepository(Task)
+task_order = Keyset(Task.created_at, Task.id, descending=True)
 
 
 class TaskService:
@@ -13,11 +18,12 @@ class TaskService:
     @staticmethod
     async def create_task(db: AsyncSession, task_data: TaskCreate, user_id: int) -> Task:
         """Create a new task."""
-        task = Task(**task_data.model_dump(), user_id=user_id)
-        db.add(task)
-        await db.flush()
-        await db.refresh(task)
-        return task
+        return await tasks.create(db, {**task_data.model_dump(), "user_id": user_id})
+
+    @staticmethod
+    async def create_tasks(db: AsyncSession, items: list[TaskCreate], user_id: int) -> list[Task]:
+        """Create many tasks in one statement, in request order."""
+        return await tasks.create_many(db, [{**item.model_dump(), "user_id": user_id} for item in items])
 
     @staticmethod
     async def get_tasks(
@@ -26,14 +32,15 @@ class TaskService:
         status: TaskStatus | None = None,
         skip: int = 0,
         limit: int = 100,
+        cursor: str | None = None,
     ) -> list[Task]:
-        """Get tasks with optional status filtering."""
+        """Get tasks with optional status filtering, newest first, after an optional cursor."""
         query = select(Task).where(Task.user_id == user_id)
         
         if status:
             query = query.where(Task.status == status)
         
-        query = query.order_by(Task.created_at.desc()).offset(skip).limit(limit)
+        query = task_order.apply(query, cursor).offset(skip).limit(limit)
         result = await db.execute(query)
         return list(result.scalars().all())
 
@@ -47,47 +54,30 @@ class TaskService:
     @staticmethod
     async def update_task(db: AsyncSession, task_id: int, task_data: TaskUpdate, user_id: int) -> Task | None:
         """Update a task."""
-        query = select(Task).where(Task.id == task_id, Task.user_id == user_id)
-        result = await db.execute(query)
-        task = result.scalar_one_or_none()
-        
-        if not task:
-            return None
-        
         update_data = task_data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(task, field, value)
-        
-        await db.flush()
-        await db.refresh(task)
-        return task
+        if not update_data:
+            return await TaskService.get_task(db, task_id, user_id)
+        return await tasks.update(db, task_id, user_id, update_data)
+
+    @staticmethod
+    async def update_tasks(db: AsyncSession, items: list[TaskBatchUpdate], user_id: int) -> list[Task | None]:
+        """Update many tasks, returning each item's task, or None if it wasn't found."""
+        updated = await tasks.update_many(db, user_id, [item.model_dump(exclude_unset=True) for item in items])
+        return [updated.get(item.id) for item in items]
 
     @staticmethod
     async def complete_task(db: AsyncSession, task_id: int, user_id: int) -> Task | None:
         """Mark a task as completed."""
-        query = select(Task).where(Task.id == task_id, Task.user_id == user_id)
-        result = await db.execute(query)
-        task = result.scalar_one_or_none()
-        
-        if not task:
-            return None
-        
-        task.status = TaskStatus.COMPLETED
-        task.completed_at = datetime.utcnow()
-        
-        await db.flush()
-        await db.refresh(task)
-        return task
+        return await tasks.update(
+            db, task_id, user_id, {"status": TaskStatus.COMPLETED, "completed_at": datetime.utcnow()}
+        )
 
     @staticmethod
     async def delete_task(db: AsyncSession, task_id: int, user_id: int) -> bool:
         """Delete a task."""
-        query = select(Task).where(Task.id == task_id, Task.user_id == user_id)
-        result = await db.execute(query)
-        task = result.scalar_one_or_none()
-        
-        if not task:
-            return False
-        
-        await db.delete(task)
-        return True
+        return await tasks.delete(db, task_id, user_id)
+
+    @staticmethod
+    async def delete_tasks(db: AsyncSession, task_ids: list[int], user_id: int) -> set[int]:
+        """Delete many tasks in one statement, returning the ids that were deleted."""
+        return await tasks.delete_many(db, user_id, task_ids)
@@ -1,10 +1,80 @@
 """Timer service."""
 
+import os
+import socket
 from datetime import datetime, timedelta
-from sqlalchemy import select
+from sqlalchemy import Insert, Update, or_, select, true, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.models import Timer, TimerType, TimerStatus
+from app.core.config import get_settings
+from app.models import PENDING_TIMER, Notification, Timer, TimerType, TimerStatus
+from app.repositories import OwnedRepository
 from app.schemas.timer import TimerCreate
+from app.utils.pagination import Keyset
+
+settings = get_settings()
+
+timers = OwnedRepository(Timer)
+timer_order = Keyset(Timer.trigger_time, Timer.id)
+
+
+# Most timers leased, and notifications inserted, per statement
+CLAIM_BATCH_SIZE = 1000
+
+# Identifies this process's leases
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"
+
+
+def timer_message(timer: Timer) -> str:
+    """Notification text for a timer that went off."""
+    return f"⏰ Timer finished: {timer.label}" if timer.label else "⏰ Timer finished!"
+
+
+def in_shard(index: int, count: int):
+    """Criterion for the timers of users in shard `index` of `count`."""
+    return true() if count == 1 else Timer.user_id % count == index
+
+
+def lease_timers(worker: str, now: datetime, *criteria, limit: int = CLAIM_BATCH_SIZE) -> Update:
+    """UPDATE leasing to `worker` up to `limit` pending timers matching `criteria`, soonest first.
+
+    Timers leased to another worker are skipped until the lease expires, and rows
+    another transaction has locked are skipped rather than waited for, so concurrent
+    workers split due timers between them. Returns the leased ids.
+    """
+    claimable = (
+        select(Timer.id)
+        .where(PENDING_TIMER, or_(Timer.lease_expires_at.is_(None), Timer.lease_expires_at <= now), *criteria)
+        .order_by(Timer.trigger_time)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    return (
+        update(Timer)
+        .where(Timer.id.in_(claimable.scalar_subquery()))
+        .values(leased_by=worker, lease_expires_at=now + timedelta(seconds=settings.TIMER_LEASE_SECONDS))
+        .returning(Timer.id)
+    )
+
+
+def complete_leased_timers(worker: str, timer_ids: list[int]) -> Update:
+    """UPDATE completing the given timers still pending and leased to `worker`, returning them."""
+    return (
+        update(Timer)
+        .where(Timer.id.in_(timer_ids), Timer.leased_by == worker, PENDING_TIMER)
+        .values(status=TimerStatus.COMPLETED, is_notified=True, completed_at=datetime.utcnow())
+        .returning(Timer)
+        .execution_options(synchronize_session=False, populate_existing=True)
+    )
+
+
+def notifications_for(fired: list[Timer]) -> Insert:
+    """One multi-row INSERT of the notifications for fired timers, skipping any already made."""
+    return (
+        insert(Notification)
+        .values([{"user_id": timer.user_id, "timer_id": timer.id, "message": timer_message(timer)} for timer in fired])
+        .on_conflict_do_nothing(index_elements=[Notification.timer_id])
+    )
 
 
 class TimerService:
@@ -20,18 +90,14 @@ class TimerService:
         """Create a timer that triggers after specified duration."""
         trigger_time = datetime.utcnow() + timedelta(seconds=duration_seconds)
         
-        timer = Timer(
-            user_id=user_id,
-            type=TimerType.TIMER,
-            duration_seconds=duration_seconds,
-            trigger_time=trigger_time,
-            label=label,
-            status=TimerStatus.ACTIVE,
-        )
-        db.add(timer)
-        await db.flush()
-        await db.refresh(timer)
-        return timer
+        return await timers.create(db, {
+            "user_id": user_id,
+            "type": TimerType.TIMER,
+            "duration_seconds": duration_seconds,
+            "trigger_time": trigger_time,
+            "label": label,
+            "status": TimerStatus.ACTIVE,
+        })
 
     @staticmethod
     async def create_alarm(
@@ -41,17 +107,13 @@ class TimerService:
         label: str | None = None,
     ) -> Timer:
         """Create an alarm that triggers at specific time."""
-        timer = Timer(
-            user_id=user_id,
-            type=TimerType.ALARM,
-            trigger_time=trigger_time,
-            label=label,
-            status=TimerStatus.ACTIVE,
-        )
-        db.add(timer)
-        await db.flush()
-        await db.refresh(timer)
-        return timer
+        return await timers.create(db, {
+            "user_id": user_id,
+            "type": TimerType.ALARM,
+            "trigger_time": trigger_time,
+            "label": label,
+            "status": TimerStatus.ACTIVE,
+        })
 
     @staticmethod
     async def get_timers(
@@ -60,14 +122,15 @@ class TimerService:
         status: TimerStatus | None = None,
         skip: int = 0,
         limit: int = 100,
+        cursor: str | None = None,
     ) -> list[Timer]:
-        """Get timers with optional status filtering."""
+        """Get timers with optional status filtering, soonest first, after an optional cursor."""
         query = select(Timer).where(Timer.user_id == user_id)
         
         if status:
             query = query.where(Timer.status == status)
         
-        query = query.order_by(Timer.trigger_time.asc()).offset(skip).limit(limit)
+        query = timer_order.apply(query, cursor).offset(skip).limit(limit)
         result = await db.execute(query)
         return list(result.scalars().all())
 
@@ -81,38 +144,40 @@ class TimerService:
     @staticmethod
     async def cancel_timer(db: AsyncSession, timer_id: int, user_id: int) -> Timer | None:
         """Cancel a timer."""
-        timer = await TimerService.get_timer(db, timer_id, user_id)
-        if timer and timer.status == TimerStatus.ACTIVE:
-            timer.status = TimerStatus.CANCELLED
-            timer.completed_at = datetime.utcnow()
-            await db.flush()
-            await db.refresh(timer)
+        timer = await timers.update(
+            db,
+            timer_id,
+            user_id,
+            {"status": TimerStatus.CANCELLED, "completed_at": datetime.utcnow()},
+            Timer.status == TimerStatus.ACTIVE,
+        )
+        if timer is None:
+            # Missing, or no longer active: return it unchanged, as before
+            return await TimerService.get_timer(db, timer_id, user_id)
         return timer
 
     @staticmethod
-    async def get_triggered_timers(db: AsyncSession) -> list[Timer]:
-        """Get all active timers that should trigger now."""
-        now = datetime.utcnow()
-        query = select(Timer).where(
-            Timer.status == TimerStatus.ACTIVE,
-            Timer.trigger_time <= now,
-            Timer.is_notified == False,
-        )
+    async def get_pending_schedule(db: AsyncSession, until: datetime, *criteria) -> list[tuple[int, datetime]]:
+        """Get (id, trigger_time) of every pending timer due by `until`, overdue ones included."""
+        query = select(Timer.id, Timer.trigger_time).where(PENDING_TIMER, Timer.trigger_time <= until, *criteria)
         result = await db.execute(query)
+        return list(result.tuples())
+
+    @staticmethod
+    async def lease_timers(db: AsyncSession, timer_ids: list[int], worker: str = WORKER_ID) -> list[int]:
+        """Lease the given pending timers not leased elsewhere; commit before firing them."""
+        result = await db.execute(lease_timers(worker, datetime.utcnow(), Timer.id.in_(timer_ids), limit=len(timer_ids)))
         return list(result.scalars().all())
 
     @staticmethod
-    async def mark_timer_completed(db: AsyncSession, timer_id: int) -> Timer | None:
-        """Mark timer as completed and notified."""
-        query = select(Timer).where(Timer.id == timer_id)
-        result = await db.execute(query)
-        timer = result.scalar_one_or_none()
-        
-        if timer:
-            timer.status = TimerStatus.COMPLETED
-            timer.is_notified = True
-            timer.completed_at = datetime.utcnow()
-            await db.flush()
-            await db.refresh(timer)
-        
-        return timer
+    async def complete_timers(db: AsyncSession, timer_ids: list[int], worker: str = WORKER_ID) -> list[Timer]:
+        """Complete timers leased to `worker` and add their notifications.
+
+        Timers cancelled, or taken over after the lease expired, are skipped. At most
+        CLAIM_BATCH_SIZE ids per call.
+        """
+        result = await db.execute(complete_leased_timers(worker, timer_ids))
+        fired = list(result.scalars().all())
+        if fired:
+            await db.execute(notifications_for(fired))
+        return fired
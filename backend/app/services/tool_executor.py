@@ -1,6 +1,9 @@
 """Tool executor for calling actual service functions."""
 
+import asyncio
+import logging
 from datetime import datetime
+from typing import Awaitable, Callable
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.services.task import TaskService
 from app.services.calendar import CalendarService
@@ -9,141 +12,245 @@ from app.services.email import EmailService
 from app.services.search import SearchService
 from app.services.calculator import CalculatorService
 from app.services.timer import TimerService
+from app.services.reference_resolver import ReferenceResolver
+from app.models import Task, TaskStatus
 from app.schemas import (
     TaskCreate,
     CalendarEventCreate,
     NoteCreate,
     EmailSend,
 )
+from app.utils.metrics import metrics
+from app.utils.tool_validation import ToolArgumentError, compile_validator
+from app.utils.tools import TOOL_SPECS_BY_NAME
+
+logger = logging.getLogger(__name__)
+
+# Tools that never touch the database, so they can run concurrently with anything
+NON_DB_TOOLS = {"search_web", "calculate", "convert_currency"}
+
+ToolHandler = Callable[[AsyncSession, dict, int], Awaitable[dict]]
+
+# Tool name -> handler; handlers receive arguments already validated against the tool's schema
+TOOL_HANDLERS: dict[str, ToolHandler] = {}
+
+
+def handles(tool_name: str):
+    """Register a handler for a tool."""
+    def register(handler: ToolHandler) -> ToolHandler:
+        TOOL_HANDLERS[tool_name] = handler
+        return handler
+    return register
+
+
+# Task tools
+@handles("create_task")
+async def create_task(db: AsyncSession, arguments: dict, user_id: int) -> dict:
+    task = await TaskService.create_task(db, TaskCreate(**arguments), user_id)
+    return {"success": True, "data": {"id": task.id, "title": task.title}}
+
+
+@handles("list_tasks")
+async def list_tasks(db: AsyncSession, arguments: dict, user_id: int) -> dict:
+    tasks = await TaskService.get_tasks(db, user_id, status=arguments.get("status"))
+    return {"success": True, "data": {"tasks": [{"id": t.id, "title": t.title, "status": t.status.value} for t in tasks]}}
+
+
+@handles("complete_task")
+async def complete_task(db: AsyncSession, arguments: dict, user_id: int) -> dict:
+    task_id, error = await ReferenceResolver.resolve(db, "task", arguments, user_id, Task.status == TaskStatus.PENDING)
+    if error:
+        return error
+    task = await TaskService.complete_task(db, task_id, user_id)
+    if not task:
+        return {"success": False, "error": "Task not found"}
+    return {"success": True, "data": {"id": task.id, "title": task.title, "status": task.status.value}}
+
+
+@handles("delete_task")
+async def delete_task(db: AsyncSession, arguments: dict, user_id: int) -> dict:
+    task_id, error = await ReferenceResolver.resolve(db, "task", arguments, user_id)
+    if error:
+        return error
+    if not await TaskService.delete_task(db, task_id, user_id):
+        return {"success": False, "error": "Task not found"}
+    return {"success": True, "data": {"id": task_id, "message": "Task deleted"}}
+
+
+# Calendar tools
+@handles("create_event")
+async def create_event(db: AsyncSession, arguments: dict, user_id: int) -> dict:
+    event = await CalendarService.add_event(db, CalendarEventCreate(**arguments), user_id)
+    return {"success": True, "data": {"id": event.id, "title": event.title}}
+
+
+@handles("list_events")
+async def list_events(db: AsyncSession, arguments: dict, user_id: int) -> dict:
+    start_date, end_date = (
+        datetime.fromisoformat(arguments[key]) if arguments.get(key) else None for key in ("start_date", "end_date")
+    )
+    events = await CalendarService.get_events(db, user_id, start_date=start_date, end_date=end_date)
+    return {"success": True, "data": {"events": [{"id": e.id, "title": e.title, "start_time": str(e.start_time)} for e in events]}}
+
+
+@handles("delete_event")
+async def delete_event(db: AsyncSession, arguments: dict, user_id: int) -> dict:
+    event_id, error = await ReferenceResolver.resolve(db, "event", arguments, user_id)
+    if error:
+        return error
+    if not await CalendarService.delete_event(db, event_id, user_id):
+        return {"success": False, "error": "Event not found"}
+    return {"success": True, "data": {"id": event_id, "message": "Event deleted"}}
+
+
+# Note tools
+@handles("create_note")
+async def create_note(db: AsyncSession, arguments: dict, user_id: int) -> dict:
+    note = await NoteService.create_note(db, NoteCreate(**arguments), user_id)
+    return {"success": True, "data": {"id": note.id, "content": note.content[:50]}}
+
+
+@handles("list_notes")
+async def list_notes(db: AsyncSession, arguments: dict, user_id: int) -> dict:
+    notes = await NoteService.get_notes(db, user_id)
+    return {"success": True, "data": {"notes": [{"id": n.id, "content": n.content[:50]} for n in notes]}}
+
+
+@handles("search_notes")
+async def search_notes(db: AsyncSession, arguments: dict, user_id: int) -> dict:
+    notes = await NoteService.search_notes(db, user_id, query=arguments["query"], tags=arguments.get("tags"))
+    return {"success": True, "data": {"notes": [{"id": n.id, "content": n.content[:50]} for n in notes]}}
+
+
+@handles("delete_note")
+async def delete_note(db: AsyncSession, arguments: dict, user_id: int) -> dict:
+    note_id, error = await ReferenceResolver.resolve(db, "note", arguments, user_id)
+    if error:
+        return error
+    if not await NoteService.delete_note(db, note_id, user_id):
+        return {"success": False, "error": "Note not found"}
+    return {"success": True, "data": {"id": note_id, "message": "Note deleted"}}
+
+
+# Email tool
+@handles("send_email")
+async def send_email(db: AsyncSession, arguments: dict, user_id: int) -> dict:
+    email_log = await EmailService.send_email(db, EmailSend(**arguments), user_id)
+    return {"success": True, "data": {"status": email_log.status}}
+
+
+# Search tool
+@handles("search_web")
+async def search_web(db: AsyncSession, arguments: dict, user_id: int) -> dict:
+    results = await SearchService.search_web(arguments["query"], arguments.get("max_results", 5))
+    return {"success": True, "data": {"results": results[:3]}}
+
+
+# Calculator tools
+@handles("calculate")
+async def calculate(db: AsyncSession, arguments: dict, user_id: int) -> dict:
+    return {"success": True, "data": {"result": CalculatorService.calculate(arguments["expression"])}}
+
+
+@handles("convert_currency")
+async def convert_currency(db: AsyncSession, arguments: dict, user_id: int) -> dict:
+    result = await CalculatorService.convert_currency(
+        arguments["amount"], arguments["from_currency"], arguments["to_currency"]
+    )
+    return {"success": True, "data": result}
+
+
+# Timer tools
+@handles("set_timer")
+async def set_timer(db: AsyncSession, arguments: dict, user_id: int) -> dict:
+    timer = await TimerService.create_timer(db, arguments["duration_seconds"], user_id, arguments.get("label"))
+    return {"success": True, "data": {"id": timer.id, "duration_seconds": timer.duration_seconds, "trigger_time": str(timer.trigger_time)}}
+
+
+@handles("set_alarm")
+async def set_alarm(db: AsyncSession, arguments: dict, user_id: int) -> dict:
+    trigger_time = datetime.fromisoformat(arguments["trigger_time"])
+    timer = await TimerService.create_alarm(db, trigger_time, user_id, arguments.get("label"))
+    return {"success": True, "data": {"id": timer.id, "trigger_time": str(timer.trigger_time)}}
+
+
+@handles("list_timers")
+async def list_timers(db: AsyncSession, arguments: dict, user_id: int) -> dict:
+    timers = await TimerService.get_timers(db, user_id)
+    return {"success": True, "data": {"timers": [{"id": t.id, "type": t.type.value, "trigger_time": str(t.trigger_time), "status": t.status.value} for t in timers]}}
+
+
+@handles("cancel_timer")
+async def cancel_timer(db: AsyncSession, arguments: dict, user_id: int) -> dict:
+    if not await TimerService.cancel_timer(db, arguments["timer_id"], user_id):
+        return {"success": False, "error": "Timer not found"}
+    return {"success": True, "data": {"message": "Timer cancelled"}}
+
+
+# Every tool offered to the LLM needs a handler, and every handler a tool definition
+if TOOL_HANDLERS.keys() != TOOL_SPECS_BY_NAME.keys():
+    raise RuntimeError(
+        f"Tool registry mismatch: {sorted(TOOL_HANDLERS.keys() ^ TOOL_SPECS_BY_NAME.keys())}"
+    )
+
+VALIDATORS = {name: compile_validator(spec["parameters"]) for name, spec in TOOL_SPECS_BY_NAME.items()}
 
 
 class ToolExecutor:
     """Execute tools by calling actual services."""
 
+    @staticmethod
+    async def execute_many(db: AsyncSession, tool_calls: list[dict], user_id: int) -> list[dict]:
+        """Execute several tool calls, returning results in call order.
+
+        Tools that don't use the database run concurrently. Database tools share the
+        request's session, which can't run statements concurrently, so they run one at a
+        time in call order: writes are serialized and reads see the same transaction.
+        Each runs in its own savepoint, so a call that fails is rolled back alone; any
+        call's exception becomes its error result rather than failing the batch.
+        """
+        results: list[dict | None] = [None] * len(tool_calls)
+
+        async def run(index: int):
+            call = tool_calls[index]
+            try:
+                results[index] = await ToolExecutor.execute(db, call["tool_name"], call.get("parameters"), user_id)
+            except Exception as e:
+                logger.warning(f"Tool {call['tool_name']} failed in batch: {e!r}")
+                results[index] = {"success": False, "error": str(e)}
+
+        async def run_db_calls(indexes: list[int]):
+            for index in indexes:
+                async with db.begin_nested() as savepoint:
+                    await run(index)
+                    if results[index] is not None and not results[index]["success"]:
+                        await savepoint.rollback()
+
+        db_indexes = [i for i, call in enumerate(tool_calls) if call["tool_name"] not in NON_DB_TOOLS]
+        other_indexes = [i for i, call in enumerate(tool_calls) if call["tool_name"] in NON_DB_TOOLS]
+        await asyncio.gather(run_db_calls(db_indexes), *(run(i) for i in other_indexes))
+        return results
+
     @staticmethod
     async def execute(db: AsyncSession, tool_name: str, parameters: dict | None, user_id: int) -> dict:
         """Execute a tool with given parameters."""
-        
-        if parameters is None:
-            parameters = {}
-        
-        # Task tools
-        if tool_name == "create_task":
-            task_data = TaskCreate(**parameters)
-            task = await TaskService.create_task(db, task_data, user_id)
-            return {"success": True, "data": {"id": task.id, "title": task.title}}
-        
-        elif tool_name == "list_tasks":
-            status = parameters.get("status")
-            tasks = await TaskService.get_tasks(db, user_id, status=status)
-            return {"success": True, "data": {"tasks": [{"id": t.id, "title": t.title, "status": t.status.value} for t in tasks]}}
-        
-        elif tool_name == "complete_task":
-            task_id = int(parameters.get("task_id"))
-            task = await TaskService.complete_task(db, task_id, user_id)
-            if not task:
-                return {"success": False, "error": "Task not found"}
-            return {"success": True, "data": {"id": task.id, "title": task.title, "status": task.status.value}}
-        
-        elif tool_name == "delete_task":
-            task_id = int(parameters.get("task_id"))
-            deleted = await TaskService.delete_task(db, task_id, user_id)
-            if not deleted:
-                return {"success": False, "error": "Task not found"}
-            return {"success": True, "data": {"message": "Task deleted"}}
-
-        # Calendar tools
-        elif tool_name == "create_event":
-            event_data = CalendarEventCreate(**parameters)
-            event = await CalendarService.add_event(db, event_data, user_id)
-            return {"success": True, "data": {"id": event.id, "title": event.title}}
-        
-        elif tool_name == "list_events":
-            start_date = parameters.get("start_date")
-            end_date = parameters.get("end_date")
-            events = await CalendarService.get_events(db, user_id, start_date=start_date, end_date=end_date)
-            return {"success": True, "data": {"events": [{"id": e.id, "title": e.title, "start_time": str(e.start_time)} for e in events]}}
-        
-        elif tool_name == "delete_event":
-            event_id = int(parameters.get("event_id"))
-            deleted = await CalendarService.delete_event(db, event_id, user_id)
-            if not deleted:
-                return {"success": False, "error": "Event not found"}
-            return {"success": True, "data": {"message": "Event deleted"}}
-
-        # Note tools
-        elif tool_name == "create_note":
-            note_data = NoteCreate(**parameters)
-            note = await NoteService.create_note(db, note_data, user_id)
-            return {"success": True, "data": {"id": note.id, "content": note.content[:50]}}
-        
-        elif tool_name == "list_notes":
-            notes = await NoteService.get_notes(db, user_id)
-            return {"success": True, "data": {"notes": [{"id": n.id, "content": n.content[:50]} for n in notes]}}
-        
-        elif tool_name == "search_notes":
-            query = parameters.get("query")
-            tags = parameters.get("tags")
-            notes = await NoteService.search_notes(db, user_id, query=query, tags=tags)
-            return {"success": True, "data": {"notes": [{"id": n.id, "content": n.content[:50]} for n in notes]}}
-        
-        elif tool_name == "delete_note":
-            note_id = int(parameters.get("note_id"))
-            deleted = await NoteService.delete_note(db, note_id, user_id)
-            if not deleted:
-                return {"success": False, "error": "Note not found"}
-            return {"success": True, "data": {"message": "Note deleted"}}
-
-        # Email tool
-        elif tool_name == "send_email":
-            email_data = EmailSend(**parameters)
-            email_log = await EmailService.send_email(db, email_data, user_id)
-            return {"success": True, "data": {"status": email_log.status}}
-
-        # Search tool
-        elif tool_name == "search_web":
-            query = parameters.get("query")
-            max_results = int(parameters.get("max_results", 5))
-            results = await SearchService.search_web(query, max_results)
-            return {"success": True, "data": {"results": results[:3]}}
-
-        # Calculator tool
-        elif tool_name == "calculate":
-            expression = parameters.get("expression")
-            result = CalculatorService.calculate(expression)
-            return {"success": True, "data": {"result": result}}
-        
-        # Currency conversion tool
-        elif tool_name == "convert_currency":
-            amount = parameters.get("amount")
-            from_currency = parameters.get("from_currency")
-            to_currency = parameters.get("to_currency")
-            result = await CalculatorService.convert_currency(amount, from_currency, to_currency)
-            return {"success": True, "data": result}
-
-        # Timer tools
-        elif tool_name == "set_timer":
-            duration_seconds = int(parameters.get("duration_seconds"))
-            label = parameters.get("label")
-            timer = await TimerService.create_timer(db, duration_seconds, user_id, label)
-            return {"success": True, "data": {"id": timer.id, "duration_seconds": timer.duration_seconds, "trigger_time": str(timer.trigger_time)}}
-        
-        elif tool_name == "set_alarm":
-            trigger_time = datetime.fromisoformat(parameters.get("trigger_time"))
-            label = parameters.get("label")
-            timer = await TimerService.create_alarm(db, trigger_time, user_id, label)
-            return {"success": True, "data": {"id": timer.id, "trigger_time": str(timer.trigger_time)}}
-        
-        elif tool_name == "list_timers":
-            timers = await TimerService.get_timers(db, user_id)
-            return {"success": True, "data": {"timers": [{"id": t.id, "type": t.type.value, "trigger_time": str(t.trigger_time), "status": t.status.value} for t in timers]}}
-        
-        elif tool_name == "cancel_timer":
-            timer_id = int(parameters.get("timer_id"))
-            timer = await TimerService.cancel_timer(db, timer_id, user_id)
-            if not timer:
-                return {"success": False, "error": "Timer not found"}
-            return {"success": True, "data": {"message": "Timer cancelled"}}
-
-        else:
+        handler = TOOL_HANDLERS.get(tool_name)
+        if handler is None:
+            metrics.increment("tool.unknown")
             return {"success": False, "error": f"Unknown tool: {tool_name}"}
+
+        try:
+            arguments = VALIDATORS[tool_name](parameters)
+        except ToolArgumentError as e:
+            metrics.increment(f"tool.{tool_name}.invalid")
+            return {"success": False, "error": str(e)}
+
+        try:
+            with metrics.timer(f"tool.{tool_name}"):
+                result = await handler(db, arguments, user_id)
+        except Exception:
+            metrics.increment(f"tool.{tool_name}.error")
+            raise
+        if not result["success"]:
+            metrics.increment(f"tool.{tool_name}.error")
+        return result
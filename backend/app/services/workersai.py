@@ -1,13 +1,66 @@
 """Cloudflare Workers AI service for natural language processing."""
 
 import json
-import httpx
+from functools import lru_cache
+from typing import AsyncIterator
 from app.core.config import get_settings
-from app.utils.prompts import SYSTEM_PROMPT, RESPONSE_PROMPT
-from app.utils.tools import TOOLS
+from app.services.prompt_builder import PromptBuilder, render_prompt
+from app.utils.http_client import get_http_client
+from app.utils.prompts import RESPONSE_PROMPT
+from app.utils.request_template import PLACEHOLDER, RequestTemplate
 
 settings = get_settings()
 
+WORKERSAI_URL = f"https://api.cloudflare.com/client/v4/accounts/{settings.CLOUDFLARE_ACCOUNT_ID}/ai/run/@cf/meta/llama-3.3-70b-instruct-fp8-fast"
+
+HEADERS = {
+    "Authorization": f"Bearer {settings.CLOUDFLARE_API_TOKEN}",
+    "Content-Type": "application/json",
+}
+
+
+# Request bodies are serialized once (extraction bodies once per prompt variant and tool
+# subset); only the user message is spliced in per request
+@lru_cache(maxsize=256)
+def extract_request(variant: str, tool_names: tuple[str, ...]) -> RequestTemplate:
+    """Get the pre-serialized extraction request for a prompt variant and tool subset."""
+    prompt = render_prompt(variant, tool_names)
+    return RequestTemplate({
+        "messages": [
+            {"role": "system", "content": prompt["system_prompt"]},
+            {"role": "user", "content": PLACEHOLDER},
+        ],
+        "tools": prompt["tools"],
+        "temperature": 0.3,
+        "max_tokens": 500,
+    })
+
+
+RESPONSE_REQUEST = RequestTemplate({
+    "messages": [
+        {"role": "system", "content": RESPONSE_PROMPT},
+        {"role": "user", "content": PLACEHOLDER},
+    ],
+    "temperature": 0.9,
+    "max_tokens": 200,
+})
+
+RESPONSE_STREAM_REQUEST = RequestTemplate({
+    "messages": [
+        {"role": "system", "content": RESPONSE_PROMPT},
+        {"role": "user", "content": PLACEHOLDER},
+    ],
+    "temperature": 0.9,
+    "max_tokens": 200,
+    "stream": True,
+})
+
+
+def response_message(user_message: str, tool_result: dict) -> str:
+    """Build the user turn asking the LLM to phrase a tool result."""
+    result_summary = json.dumps(tool_result.get("data", {}), indent=2)
+    return f"User asked: {user_message}\n\nResult: {result_summary}\n\nGenerate a natural response:"
+
 
 class WorkersAIService:
     """Service for Cloudflare Workers AI LLM operations."""
@@ -18,71 +71,63 @@ class WorkersAIService:
         
         # If tool result provided, generate response
         if tool_result:
-            result_summary = json.dumps(tool_result.get("data", {}), indent=2)
-            
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"https://api.cloudflare.com/client/v4/accounts/{settings.CLOUDFLARE_ACCOUNT_ID}/ai/run/@cf/meta/llama-3.3-70b-instruct-fp8-fast",
-                    headers={
-                        "Authorization": f"Bearer {settings.CLOUDFLARE_API_TOKEN}",
-                        "Content-Type": "application/json",
-                    },
-                    json={
-                        "messages": [
-                            {"role": "system", "content": RESPONSE_PROMPT},
-                            {"role": "user", "content": f"User asked: {user_message}\n\nResult: {result_summary}\n\nGenerate a natural response:"},
-                        ],
-                        "temperature": 0.9,
-                        "max_tokens": 200,
-                    },
-                    timeout=30.0,
-                )
-                data = response.json()
-                return {"response": data["result"]["response"]}
-        
-        # Extract tool call from user message
-        # Convert tools to OpenAI format for Workers AI
-        tools_formatted = []
-        for tool in TOOLS:
-            tools_formatted.append({
-                "type": "function",
-                "function": {
-                    "name": tool["function"]["name"],
-                    "description": tool["function"]["description"],
-                    "parameters": tool["function"]["parameters"],
-                }
-            })
-        
-        async with httpx.AsyncClient() as client:
+            client = get_http_client()
             response = await client.post(
-                f"https://api.cloudflare.com/client/v4/accounts/{settings.CLOUDFLARE_ACCOUNT_ID}/ai/run/@cf/meta/llama-3.3-70b-instruct-fp8-fast",
-                headers={
-                    "Authorization": f"Bearer {settings.CLOUDFLARE_API_TOKEN}",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "messages": [
-                        {"role": "system", "content": SYSTEM_PROMPT},
-                        {"role": "user", "content": user_message},
-                    ],
-                    "tools": tools_formatted,
-                    "temperature": 0.3,
-                    "max_tokens": 500,
-                },
+                WORKERSAI_URL,
+                headers=HEADERS,
+                content=RESPONSE_REQUEST.render(response_message(user_message, tool_result)),
                 timeout=30.0,
             )
             data = response.json()
-            
-            # Parse response
-            result = data.get("result", {})
-            response_text = result.get("response", "")
-            tool_calls = result.get("tool_calls", [])
-            
-            if tool_calls and len(tool_calls) > 0:
-                tool_call = tool_calls[0]
-                return {
-                    "tool_name": tool_call.get("name"),
-                    "parameters": tool_call.get("arguments", {}),
-                }
-            
-            return {"tool_name": None, "response": response_text}
+            return {"response": data["result"]["response"]}
+        
+        # Extract tool call from user message
+        prompt = PromptBuilder.build(user_message)
+        client = get_http_client()
+        response = await client.post(
+            WORKERSAI_URL,
+            headers=HEADERS,
+            content=extract_request(prompt["variant"], prompt["tool_names"]).render(user_message),
+            timeout=30.0,
+        )
+        data = response.json()
+        
+        # Parse response
+        result = data.get("result", {})
+        response_text = result.get("response", "")
+        tool_calls = result.get("tool_calls", [])
+        
+        if tool_calls and len(tool_calls) > 0:
+            calls = [
+                {"tool_name": tool_call.get("name"), "parameters": tool_call.get("arguments", {})}
+                for tool_call in tool_calls
+            ]
+            return {
+                "tool_name": calls[0]["tool_name"],
+                "parameters": calls[0]["parameters"],
+                "tool_calls": calls,
+                "prompt_tokens": prompt["prompt_tokens"],
+            }
+        
+        return {"tool_name": None, "response": response_text, "prompt_tokens": prompt["prompt_tokens"]}
+
+    @staticmethod
+    async def stream_response(user_message: str, tool_result: dict) -> AsyncIterator[str]:
+        """Stream the natural-language response for a tool result, token by token."""
+        client = get_http_client()
+        async with client.stream(
+            "POST",
+            WORKERSAI_URL,
+            headers=HEADERS,
+            content=RESPONSE_STREAM_REQUEST.render(response_message(user_message, tool_result)),
+            timeout=30.0,
+        ) as response:
+            async for line in response.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                payload = line[len("data:"):].strip()
+                if payload == "[DONE]":
+                    break
+                token = json.loads(payload).get("response")
+                if token:
+                    yield token
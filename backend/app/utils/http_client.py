@@ -0,0 +1,61 @@
+"""Shared outbound HTTP client."""
+
+import logging
+import httpx
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+http_client: httpx.AsyncClient | None = None
+
+
+def _http2_available() -> bool:
+    """Whether the optional h2 package that httpx needs for HTTP/2 is installed."""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _build_client() -> httpx.AsyncClient:
+    """Build a pooled client from settings."""
+    http2 = settings.HTTP2_ENABLED
+    if http2 and not _http2_available():
+        logger.warning("HTTP2_ENABLED is set but h2 is not installed; falling back to HTTP/1.1")
+        http2 = False
+    return httpx.AsyncClient(
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=settings.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY,
+        ),
+        timeout=settings.HTTP_TIMEOUT,
+    )
+
+
+def start_http_client() -> httpx.AsyncClient:
+    """Create the application-scoped HTTP client."""
+    global http_client
+
+    if http_client is None or http_client.is_closed:
+        http_client = _build_client()
+        logger.info("Shared HTTP client started")
+    return http_client
+
+
+async def stop_http_client():
+    """Close the application-scoped HTTP client and its pooled connections."""
+    global http_client
+
+    if http_client is not None:
+        await http_client.aclose()
+        http_client = None
+        logger.info("Shared HTTP client closed")
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client, creating it if the lifespan hasn't run (e.g. in tests)."""
+    return start_http_client()
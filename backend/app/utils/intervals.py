@@ -0,0 +1,53 @@
+"""Time interval arithmetic for free/busy computation."""
+
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+
+Interval = tuple[datetime, datetime]
+
+
+def snap(moment: datetime, origin: datetime, granularity: timedelta, up: bool = False) -> datetime:
+    """Round a moment down (or up) to the grid of `granularity` steps from `origin`."""
+    steps, remainder = divmod(moment - origin, granularity)
+    if up and remainder:
+        steps += 1
+    return origin + steps * granularity
+
+
+def merge_busy(
+    intervals: Iterable[Interval],
+    start: datetime,
+    end: datetime,
+    granularity: timedelta,
+) -> list[Interval]:
+    """Clip, snap outward to the grid and merge intervals sorted by start, in one pass.
+
+    Touching or overlapping intervals merge. A zero-length interval takes the slot it
+    falls in; anything left empty by clipping is dropped.
+    """
+    busy: list[Interval] = []
+    for interval_start, interval_end in intervals:
+        slot_start = snap(interval_start, start, granularity)
+        slot_end = max(snap(interval_end, start, granularity, up=True), slot_start + granularity)
+        interval_start, interval_end = max(slot_start, start), min(slot_end, end)
+        if interval_end <= interval_start:
+            continue
+        if busy and interval_start <= busy[-1][1]:
+            if interval_end > busy[-1][1]:
+                busy[-1] = (busy[-1][0], interval_end)
+        else:
+            busy.append((interval_start, interval_end))
+    return busy
+
+
+def gaps(busy: list[Interval], start: datetime, end: datetime) -> list[Interval]:
+    """The parts of [start, end) not covered by sorted, disjoint busy intervals."""
+    free: list[Interval] = []
+    cursor = start
+    for busy_start, busy_end in busy:
+        if busy_start > cursor:
+            free.append((cursor, busy_start))
+        cursor = max(cursor, busy_end)
+    if cursor < end:
+        free.append((cursor, end))
+    return free
@@ -0,0 +1,96 @@
+"""In-process counters and timings for operational metrics."""
+
+import threading
+from collections import deque
+from collections.abc import Callable
+from contextlib import contextmanager
+import time
+
+# Recent samples kept per timing for percentile estimates
+SAMPLE_SIZE = 1024
+
+
+class Metrics:
+    """Thread-safe registry of named counters, timings and gauges."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: dict[str, int] = {}
+        self._timings: dict[str, dict] = {}
+        self._gauges: dict[str, Callable[[], float]] = {}
+
+    def increment(self, name: str, value: int = 1):
+        """Increment a counter."""
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def observe(self, name: str, seconds: float):
+        """Record a timing sample in seconds."""
+        with self._lock:
+            timing = self._timings.get(name)
+            if timing is None:
+                timing = {"count": 0, "total": 0.0, "max": 0.0, "samples": deque(maxlen=SAMPLE_SIZE)}
+                self._timings[name] = timing
+            timing["count"] += 1
+            timing["total"] += seconds
+            timing["max"] = max(timing["max"], seconds)
+            timing["samples"].append(seconds)
+
+    def gauge(self, name: str, read: Callable[[], float]):
+        """Register a gauge, a current value read each time a snapshot is taken."""
+        with self._lock:
+            self._gauges[name] = read
+
+    @contextmanager
+    def timer(self, name: str):
+        """Time the enclosed block."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+
+    def counter(self, name: str) -> int:
+        """Get a counter's current value."""
+        with self._lock:
+            return self._counters.get(name, 0)
+
+    def snapshot(self) -> dict:
+        """Get all counters, timing summaries (milliseconds) and gauge readings."""
+        with self._lock:
+            gauges = dict(self._gauges)
+            timings = {}
+            for name, timing in self._timings.items():
+                samples = sorted(timing["samples"])
+                timings[name] = {
+                    "count": timing["count"],
+                    "avg_ms": round(timing["total"] / timing["count"] * 1000, 3),
+                    "max_ms": round(timing["max"] * 1000, 3),
+                    "p50_ms": round(_percentile(samples, 0.50) * 1000, 3),
+                    "p95_ms": round(_percentile(samples, 0.95) * 1000, 3),
+                    "p99_ms": round(_percentile(samples, 0.99) * 1000, 3),
+                }
+            counters = dict(self._counters)
+        # Gauges are read outside the lock, as they may take locks of their own
+        return {
+            "counters": counters,
+            "timings": timings,
+            "gauges": {name: read() for name, read in gauges.items()},
+        }
+
+    def reset(self):
+        """Clear all counters and timings; gauges stay registered."""
+        with self._lock:
+            self._counters.clear()
+            self._timings.clear()
+
+
+def _percentile(samples: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of sorted samples."""
+    if not samples:
+        return 0.0
+    index = min(len(samples) - 1, max(0, int(round(fraction * len(samples) + 0.5)) - 1))
+    return samples[index]
+
+
+metrics = Metrics()
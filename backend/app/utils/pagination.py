@@ -0,0 +1,67 @@
+"""Keyset (cursor) pagination for list queries."""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from sqlalchemy import DateTime, Select, tuple_
+
+
+class InvalidCursorError(ValueError):
+    """Raised for a cursor that wasn't issued for this list."""
+
+
+class Keyset:
+    """Sort order on (column, id) that pages by comparing rows instead of OFFSET.
+
+    A cursor is the opaque, URL-safe encoding of the last row's sort key; the next page
+    starts strictly after it, so cost doesn't grow with depth and rows inserted meanwhile
+    don't shift pages. Needs an index on (user_id, column, id) to stay a range scan.
+    """
+
+    def __init__(self, column, id_column, descending: bool = False):
+        self.column = column
+        self.id_column = id_column
+        self.descending = descending
+
+    def order_by(self) -> tuple:
+        """Order clauses, with the id as tie-breaker."""
+        if self.descending:
+            return (self.column.desc(), self.id_column.desc())
+        return (self.column.asc(), self.id_column.asc())
+
+    def apply(self, query: Select, cursor: str | None = None) -> Select:
+        """Order a query and, given a cursor, start it after the cursor's row."""
+        query = query.order_by(*self.order_by())
+        if cursor:
+            key = tuple_(self.column, self.id_column)
+            after = tuple_(*self.decode(cursor))
+            query = query.where(key < after if self.descending else key > after)
+        return query
+
+    def cursor(self, row) -> str:
+        """Encode a row's sort key as a cursor."""
+        value = getattr(row, self.column.key)
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        payload = json.dumps([value, getattr(row, self.id_column.key)], separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    def next_cursor(self, rows: list, limit: int) -> str | None:
+        """Cursor for the page after `rows`, or None if this was the last page."""
+        if not rows or len(rows) < limit:
+            return None
+        return self.cursor(rows[-1])
+
+    def decode(self, cursor: str) -> tuple:
+        """Decode a cursor into the sort key it was issued for."""
+        try:
+            payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            value, record_id = json.loads(payload)
+            if isinstance(self.column.type, DateTime):
+                value = datetime.fromisoformat(value)
+            if not isinstance(record_id, int):
+                raise TypeError("id must be an integer")
+        except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+            raise InvalidCursorError("Invalid cursor") from e
+        return value, record_id
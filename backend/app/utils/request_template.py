@@ -0,0 +1,27 @@
+"""Pre-serialized JSON request bodies for LLM provider calls."""
+
+import json
+
+# Stand-in for the per-request value; control characters never appear in a prompt template
+PLACEHOLDER = "\x00message\x00"
+
+
+def _dumps(value) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+class RequestTemplate:
+    """JSON body serialized once, with a single string field filled in per request."""
+
+    def __init__(self, body: dict):
+        serialized = _dumps(body)
+        marker = _dumps(PLACEHOLDER)
+        if serialized.count(marker) != 1:
+            raise ValueError("Request template must contain exactly one PLACEHOLDER")
+        prefix, suffix = serialized.split(marker)
+        self._prefix = prefix.encode()
+        self._suffix = suffix.encode()
+
+    def render(self, value: str) -> bytes:
+        """Build the request body with `value` in place of the placeholder."""
+        return self._prefix + _dumps(value).encode() + self._suffix
@@ -0,0 +1,96 @@
+"""Argument validators compiled from tool JSON schemas."""
+
+from typing import Any, Callable
+
+
+class ToolArgumentError(ValueError):
+    """Raised when tool call arguments don't match the tool's schema."""
+
+
+def _to_integer(name: str, value: Any) -> int:
+    if isinstance(value, bool):
+        raise ToolArgumentError(f"{name} must be an integer")
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, str):
+        try:
+            return int(value.strip())
+        except ValueError:
+            pass
+    raise ToolArgumentError(f"{name} must be an integer")
+
+
+def _to_number(name: str, value: Any) -> float:
+    if isinstance(value, bool):
+        raise ToolArgumentError(f"{name} must be a number")
+    if isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str):
+        try:
+            return float(value.strip())
+        except ValueError:
+            pass
+    raise ToolArgumentError(f"{name} must be a number")
+
+
+def _to_string(name: str, value: Any) -> str:
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value)
+    raise ToolArgumentError(f"{name} must be a string")
+
+
+CONVERTERS = {
+    "integer": _to_integer,
+    "number": _to_number,
+    "string": _to_string,
+}
+
+
+def _compile_property(name: str, schema: dict) -> Callable[[Any], Any]:
+    """Build the converter for a single property."""
+    convert = CONVERTERS[schema.get("type", "string")]
+    choices = schema.get("enum")
+    if not choices:
+        return lambda value: convert(name, value)
+
+    lookup = {str(choice).lower(): choice for choice in choices}
+    message = f"{name} must be one of: {', '.join(map(str, choices))}"
+
+    def convert_enum(value: Any) -> Any:
+        choice = lookup.get(str(convert(name, value)).lower())
+        if choice is None:
+            raise ToolArgumentError(message)
+        return choice
+
+    return convert_enum
+
+
+def compile_validator(schema: dict) -> Callable[[dict | None], dict]:
+    """Compile an object schema into a function that validates and coerces arguments.
+
+    Unknown arguments and nulls are dropped, LLM-typical string numbers are coerced,
+    and missing required arguments raise ToolArgumentError.
+    """
+    properties = {
+        name: _compile_property(name, prop)
+        for name, prop in schema.get("properties", {}).items()
+    }
+    required = tuple(schema.get("required", []))
+
+    def validate(arguments: dict | None) -> dict:
+        arguments = arguments or {}
+        cleaned = {
+            name: convert(arguments[name])
+            for name, convert in properties.items()
+            if arguments.get(name) is not None
+        }
+        missing = [name for name in required if name not in cleaned]
+        if missing:
+            raise ToolArgumentError(f"Missing required parameter: {', '.join(missing)}")
+        return cleaned
+
+    return validate
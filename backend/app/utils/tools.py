@@ -1,301 +1,449 @@
-"""Tool definitions for LLM function calling."""
+"""Tool definitions for LLM function calling.
 
-TOOLS = [
+TOOL_SPECS is the single registry of tools: it generates the `TOOLS` schemas sent to
+the LLM, the tool section of `SYSTEM_PROMPT`, and the argument validators used by
+`ToolExecutor`, so the three can't drift apart.
+"""
+
+TOOL_CATEGORIES = [
+    "Task Management",
+    "Calendar Management",
+    "Note Management",
+    "Communication",
+    "Timer & Alarm Management",
+    "Utilities",
+]
+
+TOOL_SPECS = [
     # Task tools
     {
-        "type": "function",
-        "function": {
-            "name": "create_task",
-            "description": "Create a new task or todo item",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "title": {"type": "string", "description": "Short task title (2-10 words)"},
-                    "description": {"type": "string", "description": "Optional detailed description"},
-                    "priority": {"type": "string", "enum": ["low", "medium", "high"], "description": "Task priority (default: medium)"},
-                    "due_date": {"type": "string", "description": "Due date in ISO format (YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS)"},
-                },
-                "required": ["title"],
+        "name": "create_task",
+        "category": "Task Management",
+        "description": "Create a new task or todo item",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "title": {"type": "string", "description": "Short task title (2-10 words)"},
+                "description": {"type": "string", "description": "Optional detailed description"},
+                "priority": {"type": "string", "enum": ["low", "medium", "high"], "description": "Task priority (default: medium)"},
+                "due_date": {"type": "string", "description": "Due date in ISO format (YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS)"},
             },
+            "required": ["title"],
         },
+        "examples": [
+            ("Add buy groceries to my todo", 'create_task(title="buy groceries")'),
+        ],
     },
     {
-        "type": "function",
-        "function": {
-            "name": "list_tasks",
-            "description": "List all tasks or filter by status",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "status": {"type": "string", "enum": ["pending", "in_progress", "completed"]},
-                },
-                "required": [],
+        "name": "list_tasks",
+        "category": "Task Management",
+        "description": "List all tasks or filter by status",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "status": {"type": "string", "enum": ["pending", "completed", "cancelled"]},
             },
+            "required": [],
         },
+        "examples": [
+            ("Show my pending tasks", 'list_tasks(status="pending")'),
+            ("What are my tasks?", "list_tasks()"),
+        ],
     },
     {
-        "type": "function",
-        "function": {
-            "name": "complete_task",
-            "description": "Mark a task as completed. Requires task ID - if user provides task name, use list_tasks first to get the ID.",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "task_id": {"type": "integer", "description": "Task ID (must be integer)"},
-                },
-                "required": ["task_id"],
+        "name": "complete_task",
+        "category": "Task Management",
+        "description": "Mark a task as completed, by ID or by title. Given only a name, pass it as title; don't list tasks first.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "task_id": {"type": "integer", "description": "Task ID (must be integer), if the user gives one"},
+                "title": {"type": "string", "description": "Task title or the words the user used for it, if no ID"},
             },
+            "required": [],
         },
+        "examples": [
+            ("Mark task 1 as completed", "complete_task(task_id=1)"),
+            ("Complete buy groceries", 'complete_task(title="buy groceries")'),
+        ],
     },
     {
-        "type": "function",
-        "function": {
-            "name": "delete_task",
-            "description": "Delete a task by ID",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "task_id": {"type": "integer", "description": "Task ID"},
-                },
-                "required": ["task_id"],
+        "name": "delete_task",
+        "category": "Task Management",
+        "description": "Delete a task by ID or by title",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "task_id": {"type": "integer", "description": "Task ID, if the user gives one"},
+                "title": {"type": "string", "description": "Task title or the words the user used for it, if no ID"},
             },
+            "required": [],
         },
+        "examples": [
+            ("Delete task 2", "delete_task(task_id=2)"),
+            ("Remove the call mom task", 'delete_task(title="call mom")'),
+        ],
     },
     # Calendar tools
     {
-        "type": "function",
-        "function": {
-            "name": "create_event",
-            "description": "Create a calendar event",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "title": {"type": "string", "description": "Event title"},
-                    "start_time": {"type": "string", "description": "Start time in ISO format"},
-                    "end_time": {"type": "string", "description": "End time in ISO format"},
-                    "description": {"type": "string", "description": "Event description"},
-                },
-                "required": ["title", "start_time", "end_time"],
+        "name": "create_event",
+        "category": "Calendar Management",
+        "description": "Create a calendar event",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "title": {"type": "string", "description": "Event title"},
+                "start_time": {"type": "string", "description": "Start time in ISO format"},
+                "end_time": {"type": "string", "description": "End time in ISO format"},
+                "description": {"type": "string", "description": "Event description"},
             },
+            "required": ["title", "start_time", "end_time"],
         },
+        "examples": [
+            ("Schedule meeting tomorrow 3pm to 4pm", 'create_event(title="meeting", start_time="2024-01-15T15:00:00", end_time="2024-01-15T16:00:00")'),
+        ],
     },
     {
-        "type": "function",
-        "function": {
-            "name": "list_events",
-            "description": "List calendar events",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "start_date": {"type": "string", "description": "Filter from date (ISO format)"},
-                    "end_date": {"type": "string", "description": "Filter to date (ISO format)"},
-                },
-                "required": [],
+        "name": "list_events",
+        "category": "Calendar Management",
+        "description": "List calendar events",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "start_date": {"type": "string", "description": "Filter from date (ISO format)"},
+                "end_date": {"type": "string", "description": "Filter to date (ISO format)"},
             },
+            "required": [],
         },
+        "examples": [
+            ("What's on my calendar?", "list_events()"),
+        ],
     },
     {
-        "type": "function",
-        "function": {
-            "name": "delete_event",
-            "description": "Delete a calendar event by ID",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "event_id": {"type": "integer", "description": "Event ID"},
-                },
-                "required": ["event_id"],
+        "name": "delete_event",
+        "category": "Calendar Management",
+        "description": "Delete a calendar event by ID or by title",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "event_id": {"type": "integer", "description": "Event ID, if the user gives one"},
+                "title": {"type": "string", "description": "Event title or the words the user used for it, if no ID"},
             },
+            "required": [],
         },
+        "examples": [
+            ("Delete event 3", "delete_event(event_id=3)"),
+            ("Cancel the dentist appointment", 'delete_event(title="dentist appointment")'),
+        ],
     },
     # Note tools
     {
-        "type": "function",
-        "function": {
-            "name": "create_note",
-            "description": "Create a note",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "content": {"type": "string", "description": "Note content"},
-                    "tags": {"type": "string", "description": "Comma-separated tags"},
-                },
-                "required": ["content"],
+        "name": "create_note",
+        "category": "Note Management",
+        "description": "Create a note",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "content": {"type": "string", "description": "Note content"},
+                "tags": {"type": "string", "description": "Comma-separated tags"},
             },
+            "required": ["content"],
         },
+        "examples": [
+            ("Note: Python uses indentation", 'create_note(content="Python uses indentation")'),
+            ("Take a note about Python tips", 'create_note(content="Python tips", tags="programming,python")'),
+        ],
     },
     {
-        "type": "function",
-        "function": {
-            "name": "list_notes",
-            "description": "List all notes",
-            "parameters": {
-                "type": "object",
-                "properties": {},
-                "required": [],
-            },
+        "name": "list_notes",
+        "category": "Note Management",
+        "description": "List all notes",
+        "parameters": {
+            "type": "object",
+            "properties": {},
+            "required": [],
         },
+        "examples": [
+            ("Show my notes", "list_notes()"),
+        ],
     },
     {
-        "type": "function",
-        "function": {
-            "name": "search_notes",
-            "description": "Search notes by content or tags",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "query": {"type": "string", "description": "Search query"},
-                    "tags": {"type": "string", "description": "Filter by tags"},
-                },
-                "required": ["query"],
+        "name": "search_notes",
+        "category": "Note Management",
+        "description": "Search notes by content or tags",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "query": {"type": "string", "description": "Search query"},
+                "tags": {"type": "string", "description": "Filter by tags"},
             },
+            "required": ["query"],
         },
+        "examples": [
+            ("Search notes for Python", 'search_notes(query="Python")'),
+        ],
     },
     {
-        "type": "function",
-        "function": {
-            "name": "delete_note",
-            "description": "Delete a note by ID",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "note_id": {"type": "integer", "description": "Note ID"},
-                },
-                "required": ["note_id"],
+        "name": "delete_note",
+        "category": "Note Management",
+        "description": "Delete a note by ID or by its content",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "note_id": {"type": "integer", "description": "Note ID, if the user gives one"},
+                "content": {"type": "string", "description": "Words from the note, if no ID"},
             },
+            "required": [],
         },
+        "examples": [
+            ("Delete note 5", "delete_note(note_id=5)"),
+            ("Delete my note about Python tips", 'delete_note(content="Python tips")'),
+        ],
     },
     # Email tool
     {
-        "type": "function",
-        "function": {
-            "name": "send_email",
-            "description": "Send an email",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "recipient": {"type": "string", "description": "Email recipient"},
-                    "subject": {"type": "string", "description": "Email subject"},
-                    "body": {"type": "string", "description": "Email body"},
-                },
-                "required": ["recipient", "subject", "body"],
+        "name": "send_email",
+        "category": "Communication",
+        "description": "Send an email",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "recipient": {"type": "string", "description": "Email recipient"},
+                "subject": {"type": "string", "description": "Email subject"},
+                "body": {"type": "string", "description": "Email body"},
             },
+            "required": ["recipient", "subject", "body"],
         },
+        "examples": [
+            ("Email john@example.com about the meeting", 'send_email(recipient="john@example.com", subject="Meeting", body="...")'),
+        ],
     },
     # Search tool
     {
-        "type": "function",
-        "function": {
-            "name": "search_web",
-            "description": "Search the web for information. Keep queries simple and focused. Extract key search terms from user's question.",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string", 
-                        "description": "Simple search query with 2-5 keywords. Examples: 'Python tutorials', 'FastAPI authentication', 'asyncio vs threading'. Avoid full sentences or questions."
-                    },
+        "name": "search_web",
+        "category": "Utilities",
+        "description": "Search the web for information. Keep queries simple and focused. Extract key search terms from user's question.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Simple search query with 2-5 keywords. Examples: 'Python tutorials', 'FastAPI authentication', 'asyncio vs threading'. Avoid full sentences or questions."
                 },
-                "required": ["query"],
+                "max_results": {"type": "integer", "description": "Number of results to fetch (default 5)"},
             },
+            "required": ["query"],
         },
+        "examples": [
+            ("Search for Python tutorials", 'search_web(query="Python tutorials")'),
+            ("Find best practices for FastAPI microservices", 'search_web(query="FastAPI microservices best practices")'),
+        ],
+        "notes": [
+            "IMPORTANT: Extract keywords only - remove question words (what, how, why, when, where, who)",
+            "IMPORTANT: Remove filler words (the, a, an, is, are, for, about)",
+        ],
     },
     # Calculator tool
     {
-        "type": "function",
-        "function": {
-            "name": "calculate",
-            "description": "Perform mathematical calculation. Use standard Python math operators: +, -, *, /, **, %, abs(), round(), min(), max()",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "expression": {
-                        "type": "string", 
-                        "description": "Math expression as string. Examples: '25 * 48 + 100', '0.15 * 2500', 'round(123.456, 2)'. Convert percentages to decimals."
-                    },
+        "name": "calculate",
+        "category": "Utilities",
+        "description": "Perform mathematical calculation. Use standard Python math operators: +, -, *, /, **, %, abs(), round(), min(), max()",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "expression": {
+                    "type": "string",
+                    "description": "Math expression as string. Examples: '25 * 48 + 100', '0.15 * 2500', 'round(123.456, 2)'. Convert percentages to decimals."
                 },
-                "required": ["expression"],
             },
+            "required": ["expression"],
         },
+        "examples": [
+            ("What's 25 * 48 + 100?", 'calculate(expression="25 * 48 + 100")'),
+            ("Calculate 15% of 2500", 'calculate(expression="0.15 * 2500")'),
+        ],
     },
     # Currency conversion tool
     {
-        "type": "function",
-        "function": {
-            "name": "convert_currency",
-            "description": "Convert currency using live exchange rates. Use 3-letter ISO currency codes.",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "amount": {"type": "number", "description": "Amount to convert (must be number)"},
-                    "from_currency": {
-                        "type": "string", 
-                        "description": "Source currency code (3 letters, uppercase). Common: USD, EUR, GBP, NGN, JPY, CAD, AUD"
-                    },
-                    "to_currency": {
-                        "type": "string", 
-                        "description": "Target currency code (3 letters, uppercase). Common: USD, EUR, GBP, NGN, JPY, CAD, AUD"
-                    },
+        "name": "convert_currency",
+        "category": "Utilities",
+        "description": "Convert currency using live exchange rates. Use 3-letter ISO currency codes.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "amount": {"type": "number", "description": "Amount to convert (must be number)"},
+                "from_currency": {
+                    "type": "string",
+                    "description": "Source currency code (3 letters, uppercase). Common: USD, EUR, GBP, NGN, JPY, CAD, AUD"
+                },
+                "to_currency": {
+                    "type": "string",
+                    "description": "Target currency code (3 letters, uppercase). Common: USD, EUR, GBP, NGN, JPY, CAD, AUD"
                 },
-                "required": ["amount", "from_currency", "to_currency"],
             },
+            "required": ["amount", "from_currency", "to_currency"],
         },
+        "examples": [
+            ("Convert 100 USD to EUR", 'convert_currency(amount=100, from_currency="USD", to_currency="EUR")'),
+            ("How much is 50 pounds in dollars?", 'convert_currency(amount=50, from_currency="GBP", to_currency="USD")'),
+        ],
     },
     # Timer tools
     {
-        "type": "function",
-        "function": {
-            "name": "set_timer",
-            "description": "Set a countdown timer for a specific duration. Timer will trigger after the specified time.",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "duration_seconds": {"type": "integer", "description": "Duration in seconds. Examples: 60 (1 min), 600 (10 min), 3600 (1 hour)"},
-                    "label": {"type": "string", "description": "Optional label for the timer"},
-                },
-                "required": ["duration_seconds"],
+        "name": "set_timer",
+        "category": "Timer & Alarm Management",
+        "description": "Set a countdown timer for a specific duration. Timer will trigger after the specified time.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "duration_seconds": {"type": "integer", "description": "Duration in seconds. Examples: 60 (1 min), 600 (10 min), 3600 (1 hour)"},
+                "label": {"type": "string", "description": "Optional label for the timer"},
             },
+            "required": ["duration_seconds"],
         },
+        "examples": [
+            ("Set a timer for 5 minutes", 'set_timer(duration_seconds=300, label="timer")'),
+            ("Remind me in 30 seconds", "set_timer(duration_seconds=30)"),
+        ],
     },
     {
-        "type": "function",
-        "function": {
-            "name": "set_alarm",
-            "description": "Set an alarm for a specific time. Alarm will trigger at the exact time specified.",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "trigger_time": {"type": "string", "description": "Time when alarm should trigger in ISO format (YYYY-MM-DDTHH:MM:SS)"},
-                    "label": {"type": "string", "description": "Optional label for the alarm"},
-                },
-                "required": ["trigger_time"],
+        "name": "set_alarm",
+        "category": "Timer & Alarm Management",
+        "description": "Set an alarm for a specific time. Alarm will trigger at the exact time specified.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "trigger_time": {"type": "string", "description": "Time when alarm should trigger in ISO format (YYYY-MM-DDTHH:MM:SS)"},
+                "label": {"type": "string", "description": "Optional label for the alarm"},
             },
+            "required": ["trigger_time"],
         },
+        "examples": [
+            ("Set alarm for 7am tomorrow", 'set_alarm(trigger_time="2024-01-15T07:00:00", label="wake up")'),
+        ],
     },
     {
-        "type": "function",
-        "function": {
-            "name": "list_timers",
-            "description": "List all active timers and alarms",
-            "parameters": {
-                "type": "object",
-                "properties": {},
-                "required": [],
+        "name": "list_timers",
+        "category": "Timer & Alarm Management",
+        "description": "List all active timers and alarms",
+        "parameters": {
+            "type": "object",
+            "properties": {},
+            "required": [],
+        },
+        "examples": [
+            ("Show my timers", "list_timers()"),
+        ],
+    },
+    {
+        "name": "cancel_timer",
+        "category": "Timer & Alarm Management",
+        "description": "Cancel a timer or alarm by ID",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "timer_id": {"type": "integer", "description": "Timer ID"},
             },
+            "required": ["timer_id"],
         },
+        "examples": [
+            ("Cancel timer 1", "cancel_timer(timer_id=1)"),
+        ],
     },
+]
+
+TOOL_SPECS_BY_NAME = {spec["name"]: spec for spec in TOOL_SPECS}
+
+TOOLS = [
     {
         "type": "function",
         "function": {
-            "name": "cancel_timer",
-            "description": "Cancel a timer or alarm by ID",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "timer_id": {"type": "integer", "description": "Timer ID"},
-                },
-                "required": ["timer_id"],
-            },
+            "name": spec["name"],
+            "description": spec["description"],
+            "parameters": spec["parameters"],
         },
-    },
+    }
+    for spec in TOOL_SPECS
 ]
+
+
+def _describe_parameter(name: str, schema: dict) -> str:
+    """Describe a parameter for the prompt, e.g. 'priority (low/medium/high)'."""
+    if "enum" in schema:
+        return f"{name} ({'/'.join(schema['enum'])})"
+    if schema.get("type") in ("integer", "number"):
+        return f"{name} ({schema['type']})"
+    return name
+
+
+def build_tools_prompt(specs: list[dict] | None = None) -> str:
+    """Build the AVAILABLE TOOLS section of the system prompt from the tool registry."""
+    specs = TOOL_SPECS if specs is None else specs
+    sections = []
+    for category in TOOL_CATEGORIES:
+        entries = []
+        for spec in specs:
+            if spec["category"] != category:
+                continue
+            properties = spec["parameters"]["properties"]
+            required = spec["parameters"]["required"]
+            optional = [name for name in properties if name not in required]
+            lines = [f"- **{spec['name']}**: {spec['description']}"]
+            if required:
+                lines.append(f"  - Required: {', '.join(_describe_parameter(n, properties[n]) for n in required)}")
+            if optional:
+                lines.append(f"  - Optional: {', '.join(_describe_parameter(n, properties[n]) for n in optional)}")
+            for utterance, call in spec.get("examples", []):
+                lines.append(f'  - Example: "{utterance}" → {call}')
+            for note in spec.get("notes", []):
+                lines.append(f"  - {note}")
+            entries.append("\n".join(lines))
+        if entries:
+            sections.append(f"### {category}\n" + "\n\n".join(entries))
+    return "\n\n".join(sections)
+
+
+def _first_sentence(text: str) -> str:
+    return text.split(". ")[0].rstrip(".")
+
+
+def build_compact_tools_prompt(specs: list[dict] | None = None) -> str:
+    """Build a one-line-per-tool signature list, e.g. 'create_task(title, priority?: low|medium|high)'."""
+    specs = TOOL_SPECS if specs is None else specs
+    lines = []
+    for spec in specs:
+        properties = spec["parameters"]["properties"]
+        required = spec["parameters"]["required"]
+        arguments = []
+        for name, schema in properties.items():
+            argument = name if name in required else f"{name}?"
+            if "enum" in schema:
+                argument += f": {'|'.join(schema['enum'])}"
+            elif schema.get("type") in ("integer", "number"):
+                argument += f": {schema['type']}"
+            arguments.append(argument)
+        lines.append(f"- {spec['name']}({', '.join(arguments)}): {_first_sentence(spec['description'])}")
+    return "\n".join(lines)
+
+
+def build_compact_tools(specs: list[dict] | None = None) -> list[dict]:
+    """Build function schemas without parameter descriptions, for the compact prompt variant."""
+    specs = TOOL_SPECS if specs is None else specs
+    return [
+        {
+            "type": "function",
+            "function": {
+                "name": spec["name"],
+                "description": _first_sentence(spec["description"]),
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        name: {key: value for key, value in schema.items() if key != "description"}
+                        for name, schema in spec["parameters"]["properties"].items()
+                    },
+                    "required": spec["parameters"]["required"],
+                },
+            },
+        }
+        for spec in specs
+    ]
@@ -0,0 +1,90 @@
+"""Two-tier string cache: an in-process LRU with a TTL, and an optional shared Redis tier."""
+
+import logging
+import time
+from collections import OrderedDict
+from app.utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class TTLCache:
+    """In-process LRU of string values with a TTL, backed by an optional Redis tier.
+
+    Redis hits are copied into the in-process tier. Counters are recorded under `name`
+    (`<name>.hit.memory`, `.hit.redis`, `.miss`, `.evicted`). Redis errors are logged
+    and treated as misses, so the cache never fails a request.
+    """
+
+    def __init__(self, name: str, max_size: int, ttl_seconds: int, redis_url: str = ""):
+        self.name = name
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.redis_url = redis_url
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._redis = None
+
+    def _get_redis(self):
+        """Get the Redis client, connecting lazily."""
+        if self._redis is None:
+            import redis.asyncio as redis
+
+            self._redis = redis.from_url(self.redis_url, decode_responses=True)
+        return self._redis
+
+    async def get(self, key: str) -> str | None:
+        """Get a value, from this process if it has an unexpired copy, else from Redis."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                metrics.increment(f"{self.name}.hit.memory")
+                return value
+            del self._entries[key]
+
+        if self.redis_url:
+            try:
+                value = await self._get_redis().get(key)
+            except Exception as e:
+                logger.warning(f"{self.name} Redis get failed: {e}")
+                value = None
+            if value is not None:
+                self._store_local(key, value)
+                metrics.increment(f"{self.name}.hit.redis")
+                return value
+
+        metrics.increment(f"{self.name}.miss")
+        return None
+
+    async def set(self, key: str, value: str):
+        """Store a value in both tiers."""
+        self._store_local(key, value)
+
+        if self.redis_url:
+            try:
+                await self._get_redis().set(key, value, ex=self.ttl_seconds)
+            except Exception as e:
+                logger.warning(f"{self.name} Redis set failed: {e}")
+
+    async def delete(self, key: str):
+        """Drop a value from this process and Redis; other processes' copies expire within the TTL."""
+        self._entries.pop(key, None)
+
+        if self.redis_url:
+            try:
+                await self._get_redis().delete(key)
+            except Exception as e:
+                logger.warning(f"{self.name} Redis delete failed: {e}")
+
+    def _store_local(self, key: str, value: str):
+        """Store in the LRU tier, evicting the least recently used entry when full."""
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            metrics.increment(f"{self.name}.evicted")
+
+    def clear(self):
+        """Clear the in-process tier."""
+        self._entries.clear()
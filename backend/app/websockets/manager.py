@@ -1,41 +1,182 @@
 """WebSocket connection manager."""
 
+import asyncio
 import logging
-from typing import Dict
+import time
+from collections import deque
 from fastapi import WebSocket
+from app.core.config import get_settings
+from app.utils.metrics import metrics
 
 logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+class Connection:
+    """One client socket, with a bounded outbound queue drained by its own writer task.
+
+    Sending never waits on the client. When the queue is full the oldest message is
+    dropped, and the client is told how many it missed before the next one; queued
+    pings coalesce into one.
+    """
+
+    def __init__(self, user_id: int, websocket: WebSocket, manager: "ConnectionManager", queue_size: int):
+        self.user_id = user_id
+        self.websocket = websocket
+        self.manager = manager
+        self.last_seen = time.monotonic()
+        self.dropped = 0
+        self._outbox: deque[dict] = deque(maxlen=queue_size)
+        self._ready = asyncio.Event()
+        self._ping_queued = False
+        self._writer = asyncio.create_task(self._write())
+
+    def send(self, data: dict):
+        """Queue a message without waiting."""
+        if len(self._outbox) == self._outbox.maxlen:
+            dropped = self._outbox[0]
+            if dropped["type"] == "ping":
+                self._ping_queued = False
+            else:
+                self.dropped += 1
+                metrics.increment("ws.dropped")
+        self._outbox.append(data)
+        self._ready.set()
+
+    def ping(self):
+        """Queue a heartbeat ping, unless one is already waiting."""
+        if not self._ping_queued:
+            self._ping_queued = True
+            self.send({"type": "ping"})
+
+    def touch(self):
+        """Record that the client is alive."""
+        self.last_seen = time.monotonic()
+
+    def stop(self):
+        """Stop the writer; queued messages are discarded."""
+        self._writer.cancel()
+
+    async def _write(self):
+        while True:
+            if not self._outbox:
+                self._ready.clear()
+                await self._ready.wait()
+                continue
+            if self.dropped:
+                data, self.dropped = {"type": "dropped", "count": self.dropped}, 0
+            else:
+                data = self._outbox.popleft()
+                if data["type"] == "ping":
+                    self._ping_queued = False
+            try:
+                async with asyncio.timeout(settings.WS_SEND_TIMEOUT_SECONDS):
+                    await self.websocket.send_json(data)
+            except Exception as e:
+                logger.error(f"Error sending to user {self.user_id}: {e!r}")
+                metrics.increment("ws.evicted.error")
+                # Evicting cancels this writer, so it has to run as a task of its own
+                self.manager.spawn(self.manager.evict(self))
+                return
 
 
 class ConnectionManager:
-    """Manage WebSocket connections."""
+    """Manage WebSocket connections: any number per user, one per tab or device.
+
+    A heartbeat pings every connection each WS_HEARTBEAT_SECONDS and evicts those the
+    client hasn't sent anything on (a pong or otherwise) for WS_IDLE_TIMEOUT_SECONDS.
+    """
 
-    def __init__(self):
-        self.active_connections: Dict[int, WebSocket] = {}
+    def __init__(self, queue_size: int = settings.WS_SEND_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self.active_connections: dict[int, set[Connection]] = {}
+        self._heartbeat: asyncio.Task | None = None
+        self._tasks: set[asyncio.Task] = set()
 
-    async def connect(self, user_id: int, websocket: WebSocket):
-        """Connect a user's websocket."""
+    async def connect(self, user_id: int, websocket: WebSocket) -> Connection:
+        """Accept a websocket and register it as one of the user's connections."""
         await websocket.accept()
-        self.active_connections[user_id] = websocket
+        connection = Connection(user_id, websocket, self, self.queue_size)
+        self.active_connections.setdefault(user_id, set()).add(connection)
+        if self._heartbeat is None:
+            self._heartbeat = asyncio.create_task(self._beat())
         logger.info(f"User {user_id} connected to WebSocket")
+        return connection
+
+    def disconnect(self, connection: Connection):
+        """Unregister a connection and stop its writer."""
+        connections = self.active_connections.get(connection.user_id)
+        if connections is None or connection not in connections:
+            return
+        connections.discard(connection)
+        if not connections:
+            del self.active_connections[connection.user_id]
+        connection.stop()
+        logger.info(f"User {connection.user_id} disconnected from WebSocket")
+
+    async def evict(self, connection: Connection, code: int = 1011):
+        """Disconnect a connection and close its socket."""
+        self.disconnect(connection)
+        try:
+            await connection.websocket.close(code=code)
+        except Exception:
+            pass
+
+    def spawn(self, coroutine):
+        """Run a coroutine as a task, keeping a reference until it is done."""
+        task = asyncio.create_task(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._task_done)
 
-    def disconnect(self, user_id: int):
-        """Disconnect a user's websocket."""
-        if user_id in self.active_connections:
-            del self.active_connections[user_id]
-            logger.info(f"User {user_id} disconnected from WebSocket")
+    def _task_done(self, task: asyncio.Task):
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"WebSocket task failed: {task.exception()!r}")
+
+    def connection_count(self) -> int:
+        """Number of open connections in this process."""
+        return sum(len(connections) for connections in self.active_connections.values())
 
     async def send_notification(self, user_id: int, message: str):
-        """Send notification to specific user."""
-        if user_id in self.active_connections:
+        """Queue a notification on each of the user's connections."""
+        for connection in self.active_connections.get(user_id, ()):
+            connection.send({"type": "notification", "message": message})
+
+    async def send_notifications(self, notifications: list[tuple[int, str]]):
+        """Queue many (user_id, message) notifications."""
+        for user_id, message in notifications:
+            await self.send_notification(user_id, message)
+
+    async def heartbeat(self):
+        """Evict idle connections and ping the rest."""
+        idle_since = time.monotonic() - settings.WS_IDLE_TIMEOUT_SECONDS
+        for connections in list(self.active_connections.values()):
+            for connection in list(connections):
+                if connection.last_seen < idle_since:
+                    metrics.increment("ws.evicted.idle")
+                    await self.evict(connection, code=1001)
+                else:
+                    connection.ping()
+
+    async def close(self):
+        """Stop the heartbeat and close every connection."""
+        if self._heartbeat is not None:
+            self._heartbeat.cancel()
+            self._heartbeat = None
+        for connections in list(self.active_connections.values()):
+            for connection in list(connections):
+                await self.evict(connection, code=1001)
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def _beat(self):
+        while True:
+            await asyncio.sleep(settings.WS_HEARTBEAT_SECONDS)
             try:
-                await self.active_connections[user_id].send_json({
-                    "type": "notification",
-                    "message": message
-                })
+                await self.heartbeat()
             except Exception as e:
-                logger.error(f"Error sending notification to user {user_id}: {e}")
-                self.disconnect(user_id)
+                logger.error(f"WebSocket heartbeat failed: {e}")
 
 
 manager = ConnectionManager()
+metrics.gauge("ws.connections", manager.connection_count)
@@ -20,15 +20,18 @@ async def websocket_notifications(websocket: WebSocket, token: str = Query(...))
             await websocket.close(code=1008)
             return
         
-        # Connect user
-        await manager.connect(user_id, websocket)
+        # Connect this tab or device; the user may have others open
+        connection = await manager.connect(user_id, websocket)
         
         try:
-            # Keep connection alive
+            # Anything the client sends (pongs included) shows it is still there
             while True:
                 await websocket.receive_text()
+                connection.touch()
         except WebSocketDisconnect:
-            manager.disconnect(user_id)
+            pass
+        finally:
+            manager.disconnect(connection)
     
     except Exception as e:
         logger.error(f"WebSocket error: {e}")
@@ -0,0 +1,184 @@
+"""Cross-process pub/sub carrying WebSocket notifications to the workers holding the sockets."""
+
+import asyncio
+import json
+import logging
+from collections.abc import Awaitable, Callable
+from app.core.config import get_settings
+from app.utils.metrics import metrics
+from app.websockets.manager import manager
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+NOTIFICATION_CHANNEL = "ws:notifications"
+
+# Pause before resubscribing after Redis fails
+RECONNECT_SECONDS = 1.0
+
+# Give up connecting to Redis after this long, rather than hanging a publisher
+CONNECT_TIMEOUT_SECONDS = 2.0
+
+Handler = Callable[[dict], Awaitable[None]]
+
+
+class InMemoryPubSub:
+    """Pub/sub within this process, for tests and single-process deployments."""
+
+    def __init__(self):
+        self._handlers: list[Handler] = []
+
+    async def publish(self, message: dict):
+        """Hand a message to every subscriber."""
+        for handler in list(self._handlers):
+            await handler(message)
+
+    def publish_sync(self, message: dict):
+        """Publish from synchronous code with no running event loop."""
+        asyncio.run(self.publish(message))
+
+    async def subscribe(self, handler: Handler):
+        """Call `handler` with every message published from now on."""
+        self._handlers.append(handler)
+
+    async def close(self):
+        """Drop all subscribers."""
+        self._handlers.clear()
+
+
+class RedisPubSub:
+    """Redis pub/sub: any process publishes, and every subscribed process receives each message."""
+
+    def __init__(self, redis_url: str, channel: str = NOTIFICATION_CHANNEL):
+        self.redis_url = redis_url
+        self.channel = channel
+        self._redis = None
+        self._sync_redis = None
+        self._listener: asyncio.Task | None = None
+
+    def _get_redis(self):
+        """Get the async Redis client, connecting lazily."""
+        if self._redis is None:
+            import redis.asyncio as redis
+
+            self._redis = redis.from_url(
+                self.redis_url, decode_responses=True, socket_connect_timeout=CONNECT_TIMEOUT_SECONDS
+            )
+        return self._redis
+
+    def _get_sync_redis(self):
+        """Get the blocking Redis client, for publishers without an event loop (Celery)."""
+        if self._sync_redis is None:
+            import redis
+
+            self._sync_redis = redis.from_url(
+                self.redis_url, decode_responses=True, socket_connect_timeout=CONNECT_TIMEOUT_SECONDS
+            )
+        return self._sync_redis
+
+    async def publish(self, message: dict):
+        """Publish a message to the channel."""
+        await self._get_redis().publish(self.channel, json.dumps(message))
+
+    def publish_sync(self, message: dict):
+        """Publish from synchronous code with no running event loop."""
+        self._get_sync_redis().publish(self.channel, json.dumps(message))
+
+    async def subscribe(self, handler: Handler):
+        """Call `handler` with every message on the channel, resubscribing after failures."""
+        if self._listener is None:
+            self._listener = asyncio.create_task(self._listen(handler))
+
+    async def close(self):
+        """Stop listening and close the clients."""
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+        if self._sync_redis is not None:
+            self._sync_redis.close()
+            self._sync_redis = None
+
+    async def _listen(self, handler: Handler):
+        while True:
+            pubsub = self._get_redis().pubsub()
+            try:
+                await pubsub.subscribe(self.channel)
+                async for item in pubsub.listen():
+                    if item["type"] != "message":
+                        continue
+                    try:
+                        await handler(json.loads(item["data"]))
+                    except Exception as e:
+                        logger.error(f"Notification handler failed: {e}")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Notification subscription failed, retrying: {e}")
+                await asyncio.sleep(RECONNECT_SECONDS)
+            finally:
+                await pubsub.aclose()
+
+
+def _build_bus() -> InMemoryPubSub | RedisPubSub:
+    """Redis when configured, else in-process only."""
+    if settings.NOTIFICATION_REDIS_URL:
+        return RedisPubSub(settings.NOTIFICATION_REDIS_URL)
+    return InMemoryPubSub()
+
+
+notification_bus = _build_bus()
+
+
+def _message(notifications: list[tuple[int, str]]) -> dict:
+    return {"notifications": [[user_id, text] for user_id, text in notifications]}
+
+
+async def publish_notifications(notifications: list[tuple[int, str]]):
+    """Send (user_id, message) notifications to every API worker, which deliver to their own sockets.
+
+    If the bus is down, they are still delivered to this process's sockets.
+    """
+    if not notifications:
+        return
+    try:
+        await notification_bus.publish(_message(notifications))
+        metrics.increment("notifications.published", len(notifications))
+    except Exception as e:
+        logger.error(f"Failed to publish notifications, delivering locally: {e}")
+        metrics.increment("notifications.publish_failed", len(notifications))
+        await manager.send_notifications(notifications)
+
+
+def publish_notifications_sync(notifications: list[tuple[int, str]]):
+    """publish_notifications for synchronous code (Celery tasks)."""
+    if not notifications:
+        return
+    try:
+        notification_bus.publish_sync(_message(notifications))
+        metrics.increment("notifications.published", len(notifications))
+    except Exception as e:
+        logger.error(f"Failed to publish notifications: {e}")
+
+
+async def deliver(message: dict):
+    """Send a published message's notifications to the sockets this process holds."""
+    await manager.send_notifications([(user_id, text) for user_id, text in message["notifications"]])
+
+
+async def start_notification_relay():
+    """Subscribe this process's sockets to published notifications."""
+    await notification_bus.subscribe(deliver)
+    logger.info("Notification relay started")
+
+
+async def stop_notification_relay():
+    """Unsubscribe and close the pub/sub connection."""
+    await notification_bus.close()
+    logger.info("Notification relay stopped")
@@ -0,0 +1,79 @@
+"""Benchmark: per-call httpx clients vs the shared pooled client for Workers AI calls.
+
+Runs a local stand-in for the Workers AI endpoint that counts TCP connections and
+adds a configurable handshake delay (to approximate TLS setup), then issues the same
+number of chat-shaped calls through both approaches.
+
+Usage (from backend/):
+    python benchmarks/bench_http_client.py --calls 200 --handshake-ms 20
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+os.environ.setdefault("CLOUDFLARE_API_TOKEN", "bench-token")
+
+import httpx
+from app.services import workersai
+from app.services.workersai import WorkersAIService
+from app.utils.http_client import start_http_client, stop_http_client
+from standin_server import StandInServer
+
+RESPONSE_BODY = json.dumps({"result": {"response": "Hello!", "tool_calls": []}}).encode()
+
+
+async def per_call_client(url: str) -> None:
+    """Previous behaviour: a fresh client (and connection) for every call."""
+    async with httpx.AsyncClient() as client:
+        response = await client.post(url, json={"messages": []}, timeout=30.0)
+        response.json()
+
+
+async def run(calls: int, handshake_ms: float) -> None:
+    server = StandInServer(lambda _: RESPONSE_BODY, handshake_delay=handshake_ms / 1000)
+    url = f"{await server.start()}/ai/run"
+
+    # Baseline: new client per call
+    latencies = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        await per_call_client(url)
+        latencies.append(time.perf_counter() - start)
+    baseline_connections = server.connections
+    report("per-call client", latencies, baseline_connections, calls)
+
+    # Shared pooled client through the real service code
+    server.connections = 0
+    workersai.WORKERSAI_URL = url
+    start_http_client()
+    latencies = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        await WorkersAIService.process_message("hello")
+        latencies.append(time.perf_counter() - start)
+    await stop_http_client()
+    report("shared client", latencies, server.connections, calls)
+
+    await server.stop()
+
+
+def report(name: str, latencies: list[float], connections: int, calls: int) -> None:
+    latencies_ms = sorted(latency * 1000 for latency in latencies)
+    p50 = statistics.median(latencies_ms)
+    p95 = latencies_ms[int(len(latencies_ms) * 0.95) - 1]
+    print(f"{name:<16} calls={calls:<5} connections={connections:<5} p50={p50:7.2f}ms p95={p95:7.2f}ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--handshake-ms", type=float, default=20.0)
+    args = parser.parse_args()
+    asyncio.run(run(args.calls, args.handshake_ms))
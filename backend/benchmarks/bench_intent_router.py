@@ -0,0 +1,81 @@
+"""Benchmark: intent router fast-path hit rate and per-path latency.
+
+Replays a sample of chat phrasings through IntentRouter.match. Messages it can't
+resolve would go to the LLM; `--llm-ms` is the assumed extraction round-trip used
+to estimate the blended latency.
+
+Usage (from backend/):
+    python benchmarks/bench_intent_router.py --llm-ms 900
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.intent_router import IntentRouter
+
+SAMPLE_MESSAGES = [
+    "list my tasks",
+    "Show my pending tasks",
+    "what are my tasks?",
+    "show my notes",
+    "What's on my calendar?",
+    "show my timers",
+    "Set a timer for 5 minutes",
+    "set a timer for 10 minutes",
+    "remind me in 30 seconds",
+    "calculate 2+2*3",
+    "What is 25 * 48 + 100?",
+    "Mark task 1 as done",
+    "delete task 4",
+    "delete note 5",
+    "cancel timer 2",
+    "Convert 100 USD to EUR",
+    "Add buy groceries to my todo",
+    "Schedule dentist appointment tomorrow at 2pm for 1 hour",
+    "Take a note: Python is awesome",
+    "What's 20% tip on $85?",
+    "What are the best Python frameworks for web development?",
+    "Convert 100 dollars to euros",
+    "Email john@example.com about the meeting",
+    "Complete buy groceries",
+]
+
+
+def run(rounds: int, llm_ms: float):
+    hits = 0
+    fast_latencies = []
+    miss_latencies = []
+    for _ in range(rounds):
+        for message in SAMPLE_MESSAGES:
+            start = time.perf_counter()
+            result = IntentRouter.match(message)
+            elapsed = time.perf_counter() - start
+            if result is not None:
+                hits += 1
+                fast_latencies.append(elapsed)
+            else:
+                miss_latencies.append(elapsed)
+
+    total = rounds * len(SAMPLE_MESSAGES)
+    hit_rate = hits / total
+    fast_us = statistics.median(fast_latencies) * 1e6
+    miss_us = statistics.median(miss_latencies) * 1e6
+    blended_ms = (1 - hit_rate) * llm_ms + fast_us / 1000
+
+    print(f"messages={len(SAMPLE_MESSAGES)} rounds={rounds} fast-path hit rate={hit_rate:.1%}")
+    print(f"fast path   p50={fast_us:8.1f}us")
+    print(f"router miss p50={miss_us:8.1f}us (then LLM, assumed {llm_ms:.0f}ms)")
+    print(f"extraction latency: all-LLM={llm_ms:.0f}ms  with router (mean)={blended_ms:.0f}ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=1000)
+    parser.add_argument("--llm-ms", type=float, default=900.0)
+    args = parser.parse_args()
+    run(args.rounds, args.llm_ms)
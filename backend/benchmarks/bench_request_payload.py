@@ -0,0 +1,84 @@
+"""Benchmark: per-request CPU and allocations for building the Workers AI request body.
+
+Compares rebuilding the tools list and JSON-encoding the whole body per request (the
+previous behaviour) with splicing the user message into the pre-serialized template.
+
+Usage (from backend/):
+    python benchmarks/bench_request_payload.py --number 20000
+"""
+
+import argparse
+import json
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.workersai import extract_request
+from app.utils.prompts import SYSTEM_PROMPT
+from app.utils.tools import TOOLS
+
+EXTRACT_REQUEST = extract_request("full", tuple(tool["function"]["name"] for tool in TOOLS))
+
+USER_MESSAGE = "Add buy groceries to my todo and set a timer for 10 minutes"
+
+
+def rebuild_body() -> bytes:
+    """Previous behaviour: rebuild tools_formatted and encode the body like httpx's json=."""
+    tools_formatted = []
+    for tool in TOOLS:
+        tools_formatted.append({
+            "type": "function",
+            "function": {
+                "name": tool["function"]["name"],
+                "description": tool["function"]["description"],
+                "parameters": tool["function"]["parameters"],
+            }
+        })
+    body = {
+        "messages": [
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": USER_MESSAGE},
+        ],
+        "tools": tools_formatted,
+        "temperature": 0.3,
+        "max_tokens": 500,
+    }
+    return json.dumps(body, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode()
+
+
+def template_body() -> bytes:
+    """Current behaviour: splice the message into the pre-serialized template."""
+    return EXTRACT_REQUEST.render(USER_MESSAGE)
+
+
+def allocated_bytes(fn, number: int) -> float:
+    """Mean bytes allocated per call (peak traced memory, including the returned body)."""
+    tracemalloc.start()
+    total = 0
+    for _ in range(number):
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        fn()
+        total += tracemalloc.get_traced_memory()[1] - before
+    tracemalloc.stop()
+    return total / number
+
+
+def run(number: int):
+    assert json.loads(rebuild_body()) == json.loads(template_body())
+    print(f"body size: {len(template_body())} bytes")
+
+    for name, fn in [("rebuild per request", rebuild_body), ("pre-serialized", template_body)]:
+        seconds = min(timeit.repeat(fn, number=number, repeat=5)) / number
+        allocated = allocated_bytes(fn, min(number, 2000))
+        print(f"{name:20s} {seconds * 1e6:8.2f}us/request  {allocated / 1024:8.1f} KiB peak allocated/request")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=20000)
+    args = parser.parse_args()
+    run(args.number)
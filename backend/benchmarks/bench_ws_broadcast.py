@@ -0,0 +1,128 @@
+"""Benchmark: broadcasting notifications to many simulated WebSockets, inline sends vs per-connection queues.
+
+Connects --sockets fake sockets (one user each) that take --latency to accept a
+message; --slow-fraction of them take --slow-latency instead, like clients on a
+bad network. Then --messages notifications are broadcast to everyone, one
+published batch after another, as the pub/sub relay delivers them. "before" replays
+the previous manager, which awaited every send inline, so each batch waits on the
+slowest socket; "after" queues on each connection and returns at once.
+
+Reports how long the broadcaster was busy, how long until every healthy socket had
+every message, and the p50/p99 lag from publish to send on healthy sockets.
+
+Usage (from backend/):
+    python benchmarks/bench_ws_broadcast.py --sockets 10000 --messages 20
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.websockets.manager import ConnectionManager
+
+
+class SimulatedSocket:
+    """A socket that takes `latency` seconds to send each message."""
+
+    def __init__(self, latency: float, slow: bool):
+        self.latency = latency
+        self.slow = slow
+        self.lags: list[float] = []
+        self.received = 0
+
+    async def accept(self):
+        pass
+
+    async def send_json(self, data):
+        await asyncio.sleep(self.latency)
+        if data["type"] == "notification":
+            self.received += 1
+            self.lags.append(time.perf_counter() - data["message"])
+
+    async def close(self, code=1000):
+        pass
+
+
+class InlineManager:
+    """The previous manager: one socket per user, each send awaited by the broadcaster."""
+
+    def __init__(self):
+        self.active_connections = {}
+
+    async def connect(self, user_id, websocket):
+        await websocket.accept()
+        self.active_connections[user_id] = websocket
+
+    async def send_notification(self, user_id, message):
+        if user_id in self.active_connections:
+            try:
+                await self.active_connections[user_id].send_json({"type": "notification", "message": message})
+            except Exception:
+                del self.active_connections[user_id]
+
+    async def send_notifications(self, notifications):
+        await asyncio.gather(*(self.send_notification(user_id, message) for user_id, message in notifications))
+
+
+async def broadcast(manager, args) -> tuple[float, float, list[SimulatedSocket]]:
+    rng = random.Random(0)
+    sockets = []
+    for user_id in range(args.sockets):
+        slow = rng.random() < args.slow_fraction
+        websocket = SimulatedSocket(args.slow_latency if slow else args.latency, slow)
+        await manager.connect(user_id, websocket)
+        sockets.append(websocket)
+
+    start = time.perf_counter()
+    for _ in range(args.messages):
+        # The message is its publish time, so sockets can measure delivery lag
+        await manager.send_notifications([(user_id, time.perf_counter()) for user_id in range(args.sockets)])
+        await asyncio.sleep(args.interval)
+    busy = time.perf_counter() - start - args.messages * args.interval
+
+    healthy = [websocket for websocket in sockets if not websocket.slow]
+    deadline = time.perf_counter() + 60
+    while any(websocket.received < args.messages for websocket in healthy) and time.perf_counter() < deadline:
+        await asyncio.sleep(0.01)
+    delivered = time.perf_counter() - start
+    return busy, delivered, sockets
+
+
+def report(name: str, busy: float, delivered: float, sockets: list[SimulatedSocket], messages: int):
+    healthy = [websocket for websocket in sockets if not websocket.slow]
+    slow = [websocket for websocket in sockets if websocket.slow]
+    lags = sorted(lag for websocket in healthy for lag in websocket.lags)
+    p99 = lags[int(len(lags) * 0.99)] * 1000
+    slow_received = statistics.mean(websocket.received for websocket in slow) if slow else 0
+    print(
+        f"{name:7s} broadcaster busy {busy:6.2f}s  all healthy delivered {delivered:6.2f}s  lag p50 {statistics.median(lags) * 1000:8.1f}ms"
+        f"  p99 {p99:8.1f}ms  slow sockets got {slow_received:.1f}/{messages}"
+    )
+
+
+async def run(args):
+    print(f"{args.sockets} sockets, {args.slow_fraction:.0%} slow ({args.slow_latency}s per send), {args.messages} broadcasts")
+    for name, manager in (("before", InlineManager()), ("after", ConnectionManager(queue_size=args.queue_size))):
+        busy, delivered, sockets = await broadcast(manager, args)
+        report(name, busy, delivered, sockets, args.messages)
+        if isinstance(manager, ConnectionManager):
+            await manager.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sockets", type=int, default=10000)
+    parser.add_argument("--messages", type=int, default=20)
+    parser.add_argument("--interval", type=float, default=0.05, help="seconds between broadcasts")
+    parser.add_argument("--latency", type=float, default=0.001)
+    parser.add_argument("--slow-fraction", type=float, default=0.01)
+    parser.add_argument("--slow-latency", type=float, default=2.0)
+    parser.add_argument("--queue-size", type=int, default=8)
+    args = parser.parse_args()
+    asyncio.run(run(args))
@@ -0,0 +1,120 @@
+"""Load test: concurrent POST /chat throughput with LLM_PROVIDER=groq against a local mock.
+
+The mock answers Groq's chat-completions endpoint after `--latency-ms`. Chats are
+driven through the real FastAPI app (auth and DB dependencies are overridden, and
+the mock returns a direct answer so no tool touches the database).
+
+`sync-sdk` replays the previous behaviour, calling the blocking Groq client from
+the event loop, so both numbers come from the same run.
+
+Usage (from backend/):
+    python benchmarks/load_chat_groq.py --chats 200 --concurrency 50 --latency-ms 200
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from standin_server import StandInServer
+
+COMPLETION = json.dumps({
+    "id": "chatcmpl-mock",
+    "object": "chat.completion",
+    "created": 0,
+    "model": "llama-3.3-70b-versatile",
+    "choices": [{"index": 0, "message": {"role": "assistant", "content": "Hello!"}, "finish_reason": "stop"}],
+    "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+}).encode()
+
+
+async def loop_lag_probe(stop: asyncio.Event, samples: list[float]):
+    """Measure how late a 10ms sleep wakes up; a blocked loop shows up here."""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(0.01)
+        samples.append(time.perf_counter() - start - 0.01)
+
+
+async def drive(app, chats: int, concurrency: int) -> tuple[float, float]:
+    """Send `chats` requests with at most `concurrency` in flight; return (seconds, max loop lag)."""
+    from httpx import AsyncClient, ASGITransport
+
+    semaphore = asyncio.Semaphore(concurrency)
+    stop = asyncio.Event()
+    lag: list[float] = []
+    probe = asyncio.create_task(loop_lag_probe(stop, lag))
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test", timeout=120) as client:
+        async def one():
+            async with semaphore:
+                response = await client.post("/chat", json={"message": "hello"})
+                response.raise_for_status()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(chats)))
+        elapsed = time.perf_counter() - start
+
+    stop.set()
+    await probe
+    return elapsed, max(lag, default=0.0)
+
+
+async def run(chats: int, concurrency: int, latency_ms: float):
+    server = StandInServer(lambda _: COMPLETION, response_delay=latency_ms / 1000)
+    base_url = server.start_in_thread()
+
+    os.environ["LLM_PROVIDER"] = "groq"
+    os.environ["GROQ_API_KEY"] = "mock-key"
+    os.environ["GROQ_BASE_URL"] = base_url
+    # Every chat must reach the LLM, not the tool-call cache or the local intent router
+    os.environ["LLM_CACHE_ENABLED"] = "false"
+    os.environ["INTENT_ROUTER_ENABLED"] = "false"
+
+    from groq import Groq
+    from main import app
+    from app.core.database import get_db
+    from app.core.deps import get_current_user_id
+    from app.services.groq import GroqService
+
+    async def no_db():
+        yield None
+
+    app.dependency_overrides[get_db] = no_db
+    app.dependency_overrides[get_current_user_id] = lambda: 1
+
+    elapsed, max_lag = await drive(app, chats, concurrency)
+    report("async client", chats, elapsed, max_lag)
+
+    # Previous behaviour: blocking SDK call inside the async handler
+    sync_client = Groq(api_key="mock-key", base_url=base_url)
+
+    async def blocking_process_message(user_message, tool_result=None):
+        response = sync_client.chat.completions.create(
+            model="llama-3.3-70b-versatile",
+            messages=[{"role": "user", "content": user_message}],
+        )
+        return {"tool_name": None, "response": response.choices[0].message.content}
+
+    GroqService.process_message = staticmethod(blocking_process_message)
+    elapsed, max_lag = await drive(app, chats, concurrency)
+    report("sync-sdk", chats, elapsed, max_lag)
+
+
+def report(name: str, chats: int, elapsed: float, max_lag: float):
+    print(f"{name:<13} chats={chats:<5} time={elapsed:7.2f}s throughput={chats / elapsed:8.1f} chats/s max_loop_lag={max_lag * 1000:8.1f}ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--chats", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--latency-ms", type=float, default=200.0)
+    args = parser.parse_args()
+    asyncio.run(run(args.chats, args.concurrency, args.latency_ms))
@@ -0,0 +1,72 @@
+"""Local stand-in HTTP server for LLM provider benchmarks."""
+
+import asyncio
+import threading
+from typing import Callable
+
+
+class StandInServer:
+    """Minimal HTTP/1.1 keep-alive server that counts connections and requests.
+
+    `handshake_delay` is paid once per TCP connection (approximating TLS setup) and
+    `response_delay` once per request (approximating model latency).
+    """
+
+    def __init__(self, body: Callable[[bytes], bytes], handshake_delay: float = 0.0, response_delay: float = 0.0):
+        self.body = body
+        self.handshake_delay = handshake_delay
+        self.response_delay = response_delay
+        self.connections = 0
+        self.requests = 0
+        self._server: asyncio.Server | None = None
+
+    async def start(self) -> str:
+        """Start listening on a random local port and return the base URL."""
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        port = self._server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}"
+
+    async def stop(self):
+        """Stop the server."""
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+
+    def start_in_thread(self) -> str:
+        """Run the server on its own event loop thread, so blocking clients can reach it."""
+        ready = threading.Event()
+        result = {}
+
+        def serve():
+            loop = asyncio.new_event_loop()
+            result["url"] = loop.run_until_complete(self.start())
+            ready.set()
+            loop.run_forever()
+
+        threading.Thread(target=serve, daemon=True).start()
+        ready.wait()
+        return result["url"]
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.connections += 1
+        await asyncio.sleep(self.handshake_delay)
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = 0
+                for line in head.split(b"\r\n"):
+                    if line.lower().startswith(b"content-length:"):
+                        length = int(line.split(b":", 1)[1])
+                request_body = await reader.readexactly(length) if length else b""
+                self.requests += 1
+                await asyncio.sleep(self.response_delay)
+                body = self.body(request_body)
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    b"Content-Length: " + str(len(body)).encode() + b"\r\n\r\n" + body
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            writer.close()
@@ -0,0 +1,184 @@
+"""Offline evaluation of tool-call extraction for each prompt variant.
+
+Replays the cases in extraction_cases.json against recorded LLM results in
+recordings/<config>.json and reports, per prompt configuration:
+- mean prompt tokens
+- tool-subset recall (the expected tools were offered to the LLM)
+- extraction accuracy (tool names in order, plus every expected parameter)
+
+Recordings are keyed by a hash of the exact prompt sent, so results recorded for an
+older prompt are reported as stale instead of being scored. Use `--record` to call the
+configured LLM provider (LLM_PROVIDER and its API keys from .env) and refresh them.
+
+The committed recordings come from the "reference" provider: the correct extraction
+for each case, limited to the tools each prompt offers. They keep the harness and
+subset recall checked offline; record against a live provider to score a model.
+
+Usage (from backend/):
+    python evals/run_extraction_eval.py
+    python evals/run_extraction_eval.py --record --config compact-subset
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.config import get_settings
+from app.services.prompt_builder import PromptBuilder
+
+EVALS_DIR = Path(__file__).parent
+CASES_PATH = EVALS_DIR / "extraction_cases.json"
+RECORDINGS_DIR = EVALS_DIR / "recordings"
+
+# Config name -> (prompt variant, relevant-tools-only)
+CONFIGS = {
+    "full": ("full", False),
+    "full-subset": ("full", True),
+    "compact": ("compact", False),
+    "compact-subset": ("compact", True),
+}
+
+
+def load_cases() -> list[dict]:
+    """Load the evaluation cases."""
+    return json.loads(CASES_PATH.read_text())
+
+
+def prompt_hash(prompt: dict) -> str:
+    """Hash the exact system prompt and tool schemas sent for a case."""
+    payload = prompt["system_prompt"] + json.dumps(prompt["tools"], sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+def build_prompt(message: str, config: str) -> dict:
+    """Build the prompt a message gets under a config, ignoring the token budget."""
+    variant, tool_subset = CONFIGS[config]
+    return PromptBuilder.build(message, variant=variant, tool_subset=tool_subset, token_budget=0)
+
+
+def matches(value, expected) -> bool:
+    """Compare a parameter loosely: numbers by value, strings ignoring case and padding."""
+    if isinstance(expected, (int, float)) and not isinstance(expected, bool):
+        try:
+            return float(value) == float(expected)
+        except (TypeError, ValueError):
+            return False
+    return str(value).strip().lower() == str(expected).strip().lower()
+
+
+def is_correct(result: dict, expected: list[dict]) -> bool:
+    """Check an extraction result against the expected tool calls."""
+    calls = result.get("tool_calls") or (
+        [{"tool_name": result["tool_name"], "parameters": result.get("parameters")}] if result.get("tool_name") else []
+    )
+    if [call["tool_name"] for call in calls] != [call["tool_name"] for call in expected]:
+        return False
+    for call, expected_call in zip(calls, expected):
+        parameters = call.get("parameters") or {}
+        for name, value in expected_call["parameters"].items():
+            if name not in parameters or not matches(parameters[name], value):
+                return False
+    return True
+
+
+def recording_path(config: str) -> Path:
+    return RECORDINGS_DIR / f"{config}.json"
+
+
+def load_recordings(config: str) -> dict:
+    path = recording_path(config)
+    return json.loads(path.read_text()) if path.exists() else {}
+
+
+async def record(config: str, cases: list[dict]):
+    """Call the configured provider for every case and save the results."""
+    from app.routes.chat import process_message
+
+    settings = get_settings()
+    settings.PROMPT_VARIANT, settings.PROMPT_TOOL_SUBSET = CONFIGS[config]
+    settings.PROMPT_TOKEN_BUDGET = 0
+
+    recordings = {}
+    for case in cases:
+        result = await process_message(case["message"])
+        result.pop("prompt_tokens", None)
+        recordings[case["message"]] = {
+            "prompt_hash": prompt_hash(build_prompt(case["message"], config)),
+            "provider": settings.LLM_PROVIDER,
+            "result": result,
+        }
+        print(f"recorded {config}: {case['message']!r}")
+
+    RECORDINGS_DIR.mkdir(exist_ok=True)
+    recording_path(config).write_text(json.dumps(recordings, indent=2, sort_keys=True) + "\n")
+
+
+def evaluate(config: str, cases: list[dict]) -> dict:
+    """Score one config against its recordings."""
+    recordings = load_recordings(config)
+    tokens, recalled, correct, scored, stale = [], 0, 0, 0, 0
+    providers = set()
+
+    for case in cases:
+        prompt = build_prompt(case["message"], config)
+        tokens.append(prompt["prompt_tokens"])
+        if {call["tool_name"] for call in case["expected"]} <= set(prompt["tool_names"]):
+            recalled += 1
+
+        recording = recordings.get(case["message"])
+        if recording is None:
+            continue
+        if recording["prompt_hash"] != prompt_hash(prompt):
+            stale += 1
+            continue
+        scored += 1
+        providers.add(recording["provider"])
+        correct += is_correct(recording["result"], case["expected"])
+
+    return {
+        "config": config,
+        "mean_prompt_tokens": sum(tokens) / len(tokens),
+        "subset_recall": recalled / len(cases),
+        "scored": scored,
+        "stale": stale,
+        "accuracy": correct / scored if scored else None,
+        "providers": sorted(providers),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--config", choices=list(CONFIGS), action="append", help="Config(s) to run (default: all)")
+    parser.add_argument("--record", action="store_true", help="Call the LLM provider and refresh recordings")
+    parser.add_argument("--min-accuracy", type=float, default=0.9, help="Fail if a scored config falls below this")
+    args = parser.parse_args()
+
+    configs = args.config or list(CONFIGS)
+    cases = load_cases()
+
+    if args.record:
+        for config in configs:
+            asyncio.run(record(config, cases))
+
+    failed = False
+    print(f"{'config':16s} {'tokens':>8s} {'recall':>8s} {'accuracy':>9s}  scored/stale of {len(cases)}  provider")
+    for config in configs:
+        report = evaluate(config, cases)
+        accuracy = "-" if report["accuracy"] is None else f"{report['accuracy']:.1%}"
+        print(
+            f"{config:16s} {report['mean_prompt_tokens']:8.0f} {report['subset_recall']:8.1%} {accuracy:>9s}"
+            f"  {report['scored']}/{report['stale']}  {', '.join(report['providers']) or '-'}"
+        )
+        if report["accuracy"] is not None and report["accuracy"] < args.min_accuracy:
+            failed = True
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,11 +4,15 @@ import logging
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from app.backgroundjobs.timer_scheduler import start_timer_scheduler, stop_timer_scheduler
 from app.core.config import get_settings
 from app.middleware import setup_logging
 from app.utils.celery_starter import start_celery, stop_celery
+from app.utils.http_client import start_http_client, stop_http_client
 from app.routes import health_router, calendar_router, note_router, email_router, search_router, calculator_router, task_router, timer_router, chat_router, auth_router
+from app.websockets.manager import manager
 from app.websockets.notifications import router as ws_router
+from app.websockets.pubsub import start_notification_relay, stop_notification_relay
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
@@ -20,7 +24,15 @@ async def lifespan(app: FastAPI):
     setup_logging()
     logger.info(f"Starting {settings.APP_NAME} v{settings.APP_VERSION}")
     start_celery()
+    start_http_client()
+    await start_notification_relay()
+    if settings.TIMER_SCHEDULER_ENABLED:
+        await start_timer_scheduler()
     yield
+    await stop_timer_scheduler()
+    await stop_notification_relay()
+    await manager.close()
+    await stop_http_client()
     stop_celery()
     logger.info("Shutting down application")
 
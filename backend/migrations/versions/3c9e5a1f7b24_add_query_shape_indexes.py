@@ -0,0 +1,51 @@
+"""add_query_shape_indexes
+
+Revision ID: 3c9e5a1f7b24
+Revises: fafc2d2e40cd
+Create Date: 2026-10-18 17:41:52.906114
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3c9e5a1f7b24'
+down_revision = 'fafc2d2e40cd'
+branch_labels = None
+depends_on = None
+
+USER_ID_INDEXED_TABLES = ('tasks', 'notes', 'timers', 'calendar_events', 'email_logs')
+
+
+def upgrade() -> None:
+    # Task list filtered by status, newest first
+    op.create_index(
+        'ix_tasks_user_id_status_created_at_id', 'tasks', ['user_id', 'status', 'created_at', 'id'], unique=False
+    )
+    # Timer poller: only timers still waiting to fire, which stays small as history grows
+    op.create_index(
+        'ix_timers_pending_trigger_time',
+        'timers',
+        ['trigger_time'],
+        unique=False,
+        postgresql_where=sa.text("status = 'ACTIVE' AND NOT is_notified"),
+    )
+    # Calendar range queries per user
+    op.create_index(
+        'ix_calendar_events_user_id_start_time_end_time',
+        'calendar_events',
+        ['user_id', 'start_time', 'end_time'],
+        unique=False,
+    )
+    # Single-column user_id indexes are now prefixes of the composites above and in fafc2d2e40cd
+    for table in USER_ID_INDEXED_TABLES:
+        op.drop_index(f'ix_{table}_user_id', table_name=table)
+
+
+def downgrade() -> None:
+    for table in USER_ID_INDEXED_TABLES:
+        op.create_index(f'ix_{table}_user_id', table, ['user_id'], unique=False)
+    op.drop_index('ix_calendar_events_user_id_start_time_end_time', table_name='calendar_events')
+    op.drop_index('ix_timers_pending_trigger_time', table_name='timers')
+    op.drop_index('ix_tasks_user_id_status_created_at_id', table_name='tasks')
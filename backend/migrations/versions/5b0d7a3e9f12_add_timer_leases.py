@@ -0,0 +1,51 @@
+"""add_timer_leases
+
+Revision ID: 5b0d7a3e9f12
+Revises: c83f1e6d2b45
+Create Date: 2026-10-18 22:31:05.917342
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5b0d7a3e9f12'
+down_revision = 'c83f1e6d2b45'
+branch_labels = None
+depends_on = None
+
+
+def notify_timer_change(fields: str) -> str:
+    return f"""
+        CREATE OR REPLACE FUNCTION notify_timer_change() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('timer_changes', json_build_object({fields})::text);
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+    """
+
+
+def upgrade() -> None:
+    op.add_column('timers', sa.Column('leased_by', sa.String(), nullable=True))
+    op.add_column('timers', sa.Column('lease_expires_at', sa.DateTime(), nullable=True))
+    op.add_column('notifications', sa.Column('timer_id', sa.Integer(), nullable=True))
+    op.create_foreign_key('notifications_timer_id_fkey', 'notifications', 'timers', ['timer_id'], ['id'], ondelete='SET NULL')
+    op.create_unique_constraint('notifications_timer_id_key', 'notifications', ['timer_id'])
+    op.execute(notify_timer_change(
+        "'id', NEW.id, 'user_id', NEW.user_id, 'trigger_time', NEW.trigger_time, "
+        "'pending', NEW.status = 'ACTIVE' AND NOT NEW.is_notified"
+    ))
+
+
+def downgrade() -> None:
+    op.execute(notify_timer_change(
+        "'id', NEW.id, 'trigger_time', NEW.trigger_time, "
+        "'pending', NEW.status = 'ACTIVE' AND NOT NEW.is_notified"
+    ))
+    op.drop_constraint('notifications_timer_id_key', 'notifications', type_='unique')
+    op.drop_constraint('notifications_timer_id_fkey', 'notifications', type_='foreignkey')
+    op.drop_column('notifications', 'timer_id')
+    op.drop_column('timers', 'lease_expires_at')
+    op.drop_column('timers', 'leased_by')
@@ -0,0 +1,45 @@
+"""add_note_search_columns
+
+Revision ID: 7d41c0b9e6a3
+Revises: 3c9e5a1f7b24
+Create Date: 2026-10-18 18:02:37.215480
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '7d41c0b9e6a3'
+down_revision = '3c9e5a1f7b24'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('notes', sa.Column(
+        'search_vector',
+        postgresql.TSVECTOR(),
+        sa.Computed(
+            "setweight(to_tsvector('english', content), 'A') || "
+            "setweight(to_tsvector('english', coalesce(tags, '')), 'B')",
+            persisted=True,
+        ),
+        nullable=True,
+    ))
+    op.add_column('notes', sa.Column(
+        'tag_array',
+        postgresql.ARRAY(sa.Text()),
+        sa.Computed(r"regexp_split_to_array(lower(btrim(tags, ' ,')), '\s*,\s*')", persisted=True),
+        nullable=True,
+    ))
+    op.create_index('ix_notes_search_vector', 'notes', ['search_vector'], unique=False, postgresql_using='gin')
+    op.create_index('ix_notes_tag_array', 'notes', ['tag_array'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_notes_tag_array', table_name='notes', postgresql_using='gin')
+    op.drop_index('ix_notes_search_vector', table_name='notes', postgresql_using='gin')
+    op.drop_column('notes', 'tag_array')
+    op.drop_column('notes', 'search_vector')
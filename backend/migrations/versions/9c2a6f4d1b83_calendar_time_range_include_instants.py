@@ -0,0 +1,41 @@
+"""calendar_time_range_include_instants
+
+Revision ID: 9c2a6f4d1b83
+Revises: 5b0d7a3e9f12
+Create Date: 2026-10-19 10:02:41.218734
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '9c2a6f4d1b83'
+down_revision = '5b0d7a3e9f12'
+branch_labels = None
+depends_on = None
+
+
+def replace_time_range(expression: str) -> None:
+    # A generated column's expression can't be altered in place, so rebuild it and its index
+    op.drop_index('ix_calendar_events_time_range', table_name='calendar_events', postgresql_using='gist')
+    op.drop_column('calendar_events', 'time_range')
+    op.add_column('calendar_events', sa.Column(
+        'time_range',
+        postgresql.TSRANGE(),
+        sa.Computed(expression, persisted=True),
+        nullable=True,
+    ))
+    op.create_index('ix_calendar_events_time_range', 'calendar_events', ['time_range'], unique=False, postgresql_using='gist')
+
+
+def upgrade() -> None:
+    replace_time_range(
+        "tsrange(start_time, greatest(start_time, end_time), "
+        "CASE WHEN end_time > start_time THEN '[)' ELSE '[]' END)"
+    )
+
+
+def downgrade() -> None:
+    replace_time_range("tsrange(start_time, greatest(start_time, end_time), '[)')")
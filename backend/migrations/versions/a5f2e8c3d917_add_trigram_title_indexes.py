@@ -0,0 +1,36 @@
+"""add_trigram_title_indexes
+
+Revision ID: a5f2e8c3d917
+Revises: 7d41c0b9e6a3
+Create Date: 2026-10-18 18:31:08.640257
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'a5f2e8c3d917'
+down_revision = '7d41c0b9e6a3'
+branch_labels = None
+depends_on = None
+
+# Table -> column matched when tools reference an item by name
+TRIGRAM_COLUMNS = {'tasks': 'title', 'calendar_events': 'title', 'notes': 'content'}
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for table, column in TRIGRAM_COLUMNS.items():
+        op.create_index(
+            f'ix_{table}_{column}_trgm',
+            table,
+            [column],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={column: 'gin_trgm_ops'},
+        )
+
+
+def downgrade() -> None:
+    for table, column in TRIGRAM_COLUMNS.items():
+        op.drop_index(f'ix_{table}_{column}_trgm', table_name=table, postgresql_using='gin')
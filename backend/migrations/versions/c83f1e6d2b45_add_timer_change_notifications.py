@@ -0,0 +1,40 @@
+"""add_timer_change_notifications
+
+Revision ID: c83f1e6d2b45
+Revises: e4b7d2a9c6f1
+Create Date: 2026-10-18 21:06:19.448201
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'c83f1e6d2b45'
+down_revision = 'e4b7d2a9c6f1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE OR REPLACE FUNCTION notify_timer_change() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('timer_changes', json_build_object(
+                'id', NEW.id,
+                'trigger_time', NEW.trigger_time,
+                'pending', NEW.status = 'ACTIVE' AND NOT NEW.is_notified
+            )::text);
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER timers_notify_change
+        AFTER INSERT OR UPDATE OF trigger_time, status, is_notified ON timers
+        FOR EACH ROW EXECUTE FUNCTION notify_timer_change()
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS timers_notify_change ON timers")
+    op.execute("DROP FUNCTION IF EXISTS notify_timer_change()")
@@ -0,0 +1,32 @@
+"""add_calendar_event_time_range
+
+Revision ID: e4b7d2a9c6f1
+Revises: a5f2e8c3d917
+Create Date: 2026-10-18 20:14:52.603118
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'e4b7d2a9c6f1'
+down_revision = 'a5f2e8c3d917'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('calendar_events', sa.Column(
+        'time_range',
+        postgresql.TSRANGE(),
+        sa.Computed("tsrange(start_time, greatest(start_time, end_time), '[)')", persisted=True),
+        nullable=True,
+    ))
+    op.create_index('ix_calendar_events_time_range', 'calendar_events', ['time_range'], unique=False, postgresql_using='gist')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_calendar_events_time_range', table_name='calendar_events', postgresql_using='gist')
+    op.drop_column('calendar_events', 'time_range')
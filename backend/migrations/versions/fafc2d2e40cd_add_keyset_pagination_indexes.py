@@ -0,0 +1,29 @@
+"""add_keyset_pagination_indexes
+
+Revision ID: fafc2d2e40cd
+Revises: b791f3badeb4
+Create Date: 2026-10-18 17:20:11.482913
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'fafc2d2e40cd'
+down_revision = 'b791f3badeb4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_tasks_user_id_created_at_id', 'tasks', ['user_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_notes_user_id_created_at_id', 'notes', ['user_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_timers_user_id_trigger_time_id', 'timers', ['user_id', 'trigger_time', 'id'], unique=False)
+    op.create_index('ix_email_logs_user_id_sent_at_id', 'email_logs', ['user_id', 'sent_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_email_logs_user_id_sent_at_id', table_name='email_logs')
+    op.drop_index('ix_timers_user_id_trigger_time_id', table_name='timers')
+    op.drop_index('ix_notes_user_id_created_at_id', table_name='notes')
+    op.drop_index('ix_tasks_user_id_created_at_id', table_name='tasks')
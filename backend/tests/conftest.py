@@ -1,14 +1,19 @@
 """Pytest configuration."""
 
+import os
 import pytest
 import pytest_asyncio
 import asyncio
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
+# Deliver WebSocket notifications in-process rather than through Redis
+os.environ["NOTIFICATION_REDIS_URL"] = ""
 
 from app.core.database import Base, get_db
+from app.services.principal_cache import principal_cache
 from main import app
 
 pytest_plugins = ('pytest_asyncio',)
@@ -47,10 +52,38 @@ async def setup_database():
                 await session.close()
     
     app.dependency_overrides[get_db] = override_get_db
+    # User ids are reused once tables are recreated
+    principal_cache.clear()
     
-    yield
+    yield engine
     
     await engine.dispose()
 
 
+class QueryCounter:
+    """Record the SQL statements sent to the test database."""
 
+    def __init__(self):
+        self.statements: list[str] = []
+        self.parameters: list = []
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+        self.parameters.append(parameters)
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def reset(self):
+        self.statements.clear()
+        self.parameters.clear()
+
+
+@pytest.fixture
+def query_counter(setup_database):
+    """Count statements sent to the test database while the test runs."""
+    counter = QueryCounter()
+    event.listen(setup_database.sync_engine, "before_cursor_execute", counter)
+    yield counter
+    event.remove(setup_database.sync_engine, "before_cursor_execute", counter)
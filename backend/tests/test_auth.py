@@ -3,6 +3,10 @@
 import pytest
 from httpx import AsyncClient, ASGITransport
 from main import app
+from app.core import deps
+from app.services.principal_cache import principal_cache
+from app.utils.auth import create_access_token
+from app.utils.metrics import metrics
 
 
 @pytest.mark.asyncio
@@ -116,3 +120,54 @@ async def test_protected_route_without_token():
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
         response = await client.get("/tasks")
         assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_current_user_served_from_cache():
+    """Test that repeated requests reuse the verified user instead of querying it again."""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        signup_response = await client.post(
+            "/auth/signup",
+            json={"email": "cached@example.com", "password": "password123", "name": "Cached User"}
+        )
+        headers = {"Authorization": f"Bearer {signup_response.json()['access_token']}"}
+
+        await client.get("/auth/me", headers=headers)
+        hits = metrics.counter("principal_cache.hit.memory")
+        response = await client.get("/auth/me", headers=headers)
+        assert response.status_code == 200
+        assert response.json()["email"] == "cached@example.com"
+        assert metrics.counter("principal_cache.hit.memory") == hits + 1
+
+
+@pytest.mark.asyncio
+async def test_logout_invalidates_cached_user():
+    """Test that logout drops the user's cached principal."""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        signup_response = await client.post(
+            "/auth/signup",
+            json={"email": "logout@example.com", "password": "password123", "name": "Logout User"}
+        )
+        tokens = signup_response.json()
+        headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+        user_id = (await client.get("/auth/me", headers=headers)).json()["id"]
+        assert await principal_cache.get(user_id) is not None
+
+        response = await client.post("/auth/logout", json={"refresh_token": tokens["refresh_token"]}, headers=headers)
+        assert response.status_code == 200
+        assert await principal_cache.get(user_id) is None
+
+
+@pytest.mark.asyncio
+async def test_stateless_auth_skips_user_lookup(monkeypatch):
+    """Test that stateless mode trusts the token for id-only routes, and the default mode doesn't."""
+    headers = {"Authorization": f"Bearer {create_access_token(999999)}"}
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/tasks", headers=headers)
+        assert response.status_code == 401
+
+        monkeypatch.setattr(deps.settings, "AUTH_STATELESS", True)
+        response = await client.get("/tasks", headers=headers)
+        assert response.status_code == 200
+        assert response.json()["data"] == []
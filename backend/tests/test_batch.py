@@ -0,0 +1,132 @@
+"""Tests for batch create, update and delete routes."""
+
+import pytest
+from datetime import datetime
+from httpx import AsyncClient, ASGITransport
+from main import app
+
+
+async def get_auth_headers():
+    """Helper to get auth headers."""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post(
+            "/auth/signup",
+            json={"email": f"batch{datetime.utcnow().timestamp()}@example.com", "password": "password123", "name": "Batch User"}
+        )
+        return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+@pytest.mark.asyncio
+async def test_batch_tasks():
+    """Test creating, updating and deleting tasks in batches."""
+    headers = await get_auth_headers()
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post(
+            "/tasks/batch",
+            headers=headers,
+            json={"items": [{"title": "First"}, {"title": "Second", "priority": "high"}, {"title": "Third"}]},
+        )
+        assert response.status_code == 200
+        results = response.json()["data"]
+        assert [result["data"]["title"] for result in results] == ["First", "Second", "Third"]
+        assert results[1]["data"]["priority"] == "high"
+        ids = [result["id"] for result in results]
+
+        response = await client.put(
+            "/tasks/batch",
+            headers=headers,
+            json={"items": [
+                {"id": ids[0], "title": "First, renamed"},
+                {"id": ids[1], "status": "completed", "priority": "low"},
+                {"id": 999999, "title": "Missing"},
+                {"id": ids[2]},
+            ]},
+        )
+        assert response.status_code == 200
+        body = response.json()
+        assert body["message"] == "3 of 4 tasks updated"
+        results = body["data"]
+        assert results[0]["data"]["title"] == "First, renamed"
+        assert results[1]["data"]["status"] == "completed"
+        assert results[1]["data"]["priority"] == "low"
+        assert results[1]["data"]["title"] == "Second"
+        assert results[2] == {"id": 999999, "success": False, "data": None, "error": "Task not found"}
+        assert results[3]["data"]["title"] == "Third"
+
+        response = await client.request("DELETE", "/tasks/batch", headers=headers, json={"ids": [ids[0], 999999, ids[2]]})
+        assert response.status_code == 200
+        assert [result["success"] for result in response.json()["data"]] == [True, False, True]
+
+        response = await client.get("/tasks", headers=headers)
+        assert [task["id"] for task in response.json()["data"]] == [ids[1]]
+
+
+@pytest.mark.asyncio
+async def test_batch_notes_and_events():
+    """Test batch routes for notes and calendar events."""
+    headers = await get_auth_headers()
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post(
+            "/notes/batch", headers=headers, json={"items": [{"content": "One", "tags": "a"}, {"content": "Two"}]}
+        )
+        assert response.status_code == 200
+        note_ids = [result["id"] for result in response.json()["data"]]
+
+        response = await client.put(
+            "/notes/batch", headers=headers, json={"items": [{"id": note_ids[1], "content": "Two, edited", "tags": "b"}]}
+        )
+        assert response.json()["data"][0]["data"]["content"] == "Two, edited"
+        assert response.json()["data"][0]["data"]["tags"] == "b"
+
+        response = await client.request("DELETE", "/notes/batch", headers=headers, json={"ids": note_ids})
+        assert all(result["success"] for result in response.json()["data"])
+
+        event = {"title": "Standup", "start_time": "2026-01-05T09:00:00", "end_time": "2026-01-05T09:15:00"}
+        response = await client.post("/calendar/events/batch", headers=headers, json={"items": [event, {**event, "title": "Review"}]})
+        assert response.status_code == 200
+        event_ids = [result["id"] for result in response.json()["data"]]
+
+        response = await client.put(
+            "/calendar/events/batch",
+            headers=headers,
+            json={"items": [{"id": event_ids[0], "start_time": "2026-01-05T10:00:00", "end_time": "2026-01-05T10:15:00"}]},
+        )
+        assert response.json()["data"][0]["data"]["start_time"] == "2026-01-05T10:00:00"
+
+        response = await client.request("DELETE", "/calendar/events/batch", headers=headers, json={"ids": event_ids})
+        assert response.json()["message"] == "2 of 2 events deleted"
+
+
+@pytest.mark.asyncio
+async def test_batch_rows_are_scoped_to_owner():
+    """Test that batch updates and deletes can't touch another user's rows."""
+    owner = await get_auth_headers()
+    other = await get_auth_headers()
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post("/tasks/batch", headers=owner, json={"items": [{"title": "Mine"}]})
+        task_id = response.json()["data"][0]["id"]
+
+        response = await client.put("/tasks/batch", headers=other, json={"items": [{"id": task_id, "title": "Theirs"}]})
+        assert response.json()["data"][0]["success"] is False
+
+        response = await client.request("DELETE", "/tasks/batch", headers=other, json={"ids": [task_id]})
+        assert response.json()["data"][0]["success"] is False
+
+        response = await client.get(f"/tasks/{task_id}", headers=owner)
+        assert response.json()["data"]["title"] == "Mine"
+
+
+@pytest.mark.asyncio
+async def test_batch_size_is_validated():
+    """Test that empty batches are rejected."""
+    headers = await get_auth_headers()
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post("/tasks/batch", headers=headers, json={"items": []})
+        assert response.status_code == 422
+
+        response = await client.request("DELETE", "/notes/batch", headers=headers, json={"ids": []})
+        assert response.status_code == 422
@@ -0,0 +1,160 @@
+"""Tests for chat routes."""
+
+import pytest
+from datetime import datetime
+from httpx import AsyncClient, ASGITransport
+from main import app
+from app.services.workersai import WorkersAIService
+from app.services.llm_cache import tool_call_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_tool_call_cache():
+    """Keep cached extractions from leaking between tests."""
+    tool_call_cache.clear()
+
+
+async def get_auth_token():
+    """Helper to get auth token."""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post(
+            "/auth/signup",
+            json={"email": f"chat{datetime.utcnow().timestamp()}@example.com", "password": "password123", "name": "Chat User"}
+        )
+        return response.json()["access_token"]
+
+
+def parse_events(body: str) -> list[tuple[str, str]]:
+    """Split a server-sent event stream into (event, data) pairs."""
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.split("\n"))
+        events.append((lines["event"], lines["data"]))
+    return events
+
+
+@pytest.mark.asyncio
+async def test_chat_stream_tool_call(monkeypatch):
+    """Test streaming chat sends tool call, tool result and response tokens."""
+    async def fake_process_message(user_message, tool_result=None):
+        return {"tool_name": "list_notes", "parameters": {}}
+
+    async def fake_stream_response(user_message, tool_result):
+        for token in ["You don't have ", "any notes yet"]:
+            yield token
+
+    monkeypatch.setattr(WorkersAIService, "process_message", staticmethod(fake_process_message))
+    monkeypatch.setattr(WorkersAIService, "stream_response", staticmethod(fake_stream_response))
+    token = await get_auth_token()
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post(
+            "/chat/stream",
+            headers={"Authorization": f"Bearer {token}"},
+            json={"message": "show my notes"}
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = parse_events(response.text)
+        assert [e for e, _ in events] == ["tool_call", "tool_result", "token", "token", "done"]
+        assert '"notes": []' in events[1][1]
+
+
+@pytest.mark.asyncio
+async def test_chat_stream_without_tool(monkeypatch):
+    """Test streaming chat when the LLM answers directly."""
+    async def fake_process_message(user_message, tool_result=None):
+        return {"tool_name": None, "response": "Hello there!"}
+
+    monkeypatch.setattr(WorkersAIService, "process_message", staticmethod(fake_process_message))
+    token = await get_auth_token()
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post(
+            "/chat/stream",
+            headers={"Authorization": f"Bearer {token}"},
+            json={"message": "hi"}
+        )
+        events = parse_events(response.text)
+        assert [e for e, _ in events] == ["token", "done"]
+        assert "Hello there!" in events[0][1]
+
+
+@pytest.mark.asyncio
+async def test_chat_templated_response_skips_llm(monkeypatch):
+    """Test that templated tools are phrased without a second LLM call."""
+    calls = []
+
+    async def fake_process_message(user_message, tool_result=None):
+        calls.append(tool_result)
+        return {"tool_name": "calculate", "parameters": {"expression": "2 + 2 * 3"}}
+
+    monkeypatch.setattr(WorkersAIService, "process_message", staticmethod(fake_process_message))
+    token = await get_auth_token()
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post(
+            "/chat",
+            headers={"Authorization": f"Bearer {token}"},
+            json={"message": "add two to two times three"}
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["response"] == "The result is 8"
+        assert data["tool_used"] == "calculate"
+        assert calls == [None]
+
+
+@pytest.mark.asyncio
+async def test_chat_fast_path_skips_llm(monkeypatch):
+    """Test that unambiguous commands are routed without calling the LLM."""
+    async def fail_process_message(user_message, tool_result=None):
+        raise AssertionError("LLM should not be called")
+
+    monkeypatch.setattr(WorkersAIService, "process_message", staticmethod(fail_process_message))
+    token = await get_auth_token()
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post(
+            "/chat",
+            headers={"Authorization": f"Bearer {token}"},
+            json={"message": "5 minutes", "template": "set_timer"}
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["tool_used"] == "set_timer"
+        assert data["tool_result"]["data"]["duration_seconds"] == 300
+
+
+@pytest.mark.asyncio
+async def test_chat_multiple_tool_calls(monkeypatch):
+    """Test that several tool calls run in one turn and are answered together."""
+    async def fake_process_message(user_message, tool_result=None):
+        return {
+            "tool_name": "create_task",
+            "parameters": {"title": "Buy milk"},
+            "tool_calls": [
+                {"tool_name": "create_task", "parameters": {"title": "Buy milk"}},
+                {"tool_name": "set_timer", "parameters": {"duration_seconds": 600}},
+                {"tool_name": "calculate", "parameters": {"expression": "6 * 7"}},
+            ],
+        }
+
+    monkeypatch.setattr(WorkersAIService, "process_message", staticmethod(fake_process_message))
+    token = await get_auth_token()
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post(
+            "/chat",
+            headers={"Authorization": f"Bearer {token}"},
+            json={"message": "add task buy milk, set a 10 minute timer and work out six times seven"}
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert [call["tool_name"] for call in data["tool_calls"]] == ["create_task", "set_timer", "calculate"]
+        assert all(call["result"]["success"] for call in data["tool_calls"])
+        assert data["response"].splitlines() == [
+            "I've added 'Buy milk' to your todo list!",
+            "Timer set for 10 minutes.",
+            "The result is 42",
+        ]
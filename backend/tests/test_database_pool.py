@@ -0,0 +1,58 @@
+"""Tests for database pool metrics and PgBouncer-compatible connections."""
+
+import pytest
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from app.core.database import InstrumentedAsyncPool, InstrumentedNullPool, asyncpg_connect_args, register_pool_gauges
+from app.utils.metrics import metrics
+from tests.conftest import TEST_DATABASE_URL
+
+
+class ProbePool(InstrumentedAsyncPool):
+    """Pool reporting under its own name, leaving the application's gauges alone."""
+
+    metrics_name = "test.pool"
+
+
+@pytest.mark.asyncio
+async def test_pool_exports_checkouts_and_timeouts():
+    """Test that checked-out connections, checkout time and timeouts are exported."""
+    engine = create_async_engine(TEST_DATABASE_URL, poolclass=ProbePool, pool_size=1, max_overflow=0, pool_timeout=0.1)
+    register_pool_gauges(engine)
+    timeouts = metrics.counter("test.pool.timeout")
+
+    try:
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+            assert metrics.snapshot()["gauges"]["test.pool.checked_out"] == 1
+
+            with pytest.raises(exc.TimeoutError):
+                async with engine.connect():
+                    pass
+
+        snapshot = metrics.snapshot()
+        assert snapshot["gauges"]["test.pool.checked_out"] == 0
+        assert snapshot["gauges"]["test.pool.idle"] == 1
+        assert snapshot["gauges"]["test.pool.overflow"] == 0
+        assert snapshot["timings"]["test.pool.checkout"]["count"] >= 2
+        assert metrics.counter("test.pool.timeout") == timeouts + 1
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_pgbouncer_mode_runs_repeated_statements():
+    """Test that uncached, uniquely named statements can be run repeatedly."""
+    engine = create_async_engine(
+        TEST_DATABASE_URL,
+        poolclass=InstrumentedNullPool,
+        connect_args=asyncpg_connect_args(100, pgbouncer=True),
+    )
+
+    try:
+        async with engine.connect() as connection:
+            for value in range(3):
+                result = await connection.execute(text("SELECT :value + 1"), {"value": value})
+                assert result.scalar() == value + 1
+    finally:
+        await engine.dispose()
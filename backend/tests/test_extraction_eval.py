@@ -0,0 +1,59 @@
+"""Tests for the offline extraction evaluation harness."""
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "evals"))
+
+import run_extraction_eval as harness
+
+CASES = [
+    {"message": "Delete task 2", "expected": [{"tool_name": "delete_task", "parameters": {"task_id": 2}}]},
+    {"message": "Show my notes", "expected": [{"tool_name": "list_notes", "parameters": {}}]},
+    {"message": "Cancel timer 1", "expected": [{"tool_name": "cancel_timer", "parameters": {"timer_id": 1}}]},
+    {"message": "Hello, how are you?", "expected": []},
+]
+
+
+def test_is_correct():
+    """Test that tool names must match in order and expected parameters compare loosely."""
+    expected = [
+        {"tool_name": "create_task", "parameters": {"title": "buy milk"}},
+        {"tool_name": "set_timer", "parameters": {"duration_seconds": 600}},
+    ]
+    calls = [
+        {"tool_name": "create_task", "parameters": {"title": " Buy Milk", "priority": "low"}},
+        {"tool_name": "set_timer", "parameters": {"duration_seconds": "600"}},
+    ]
+    assert harness.is_correct({"tool_calls": calls}, expected)
+    assert not harness.is_correct({"tool_calls": calls[::-1]}, expected)
+    assert not harness.is_correct({"tool_calls": calls[:1]}, expected)
+    assert harness.is_correct({"tool_name": "delete_task", "parameters": {"task_id": 2}}, CASES[0]["expected"])
+    assert not harness.is_correct({"tool_name": "delete_task", "parameters": {}}, CASES[0]["expected"])
+    assert harness.is_correct({"tool_name": None, "response": "Hi!"}, [])
+
+
+def test_evaluate_scores_fixture_recording(tmp_path, monkeypatch):
+    """Test that evaluate scores current recordings, skips stale ones and ignores missing ones."""
+    monkeypatch.setattr(harness, "RECORDINGS_DIR", tmp_path)
+
+    def recording(message: str, result: dict, prompt_hash: str | None = None) -> dict:
+        prompt = harness.build_prompt(message, "compact")
+        return {"prompt_hash": prompt_hash or harness.prompt_hash(prompt), "provider": "fixture", "result": result}
+
+    recordings = {
+        "Delete task 2": recording("Delete task 2", {"tool_name": "delete_task", "parameters": {"task_id": 2}}),
+        "Show my notes": recording("Show my notes", {"tool_name": "list_tasks", "parameters": {}}),
+        "Cancel timer 1": recording("Cancel timer 1", {"tool_name": "cancel_timer", "parameters": {"timer_id": 1}}, "0" * 16),
+    }
+    (tmp_path / "compact.json").write_text(json.dumps(recordings))
+
+    report = harness.evaluate("compact", CASES)
+    assert report["scored"] == 2
+    assert report["stale"] == 1
+    assert report["accuracy"] == 0.5
+    assert report["providers"] == ["fixture"]
+    assert report["subset_recall"] == 1.0
+    assert report["mean_prompt_tokens"] > 0
+
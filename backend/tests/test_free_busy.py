@@ -0,0 +1,126 @@
+"""Tests for overlapping calendar range queries and free/busy."""
+
+import pytest
+from datetime import datetime, timedelta
+from httpx import AsyncClient, ASGITransport
+from app.utils.intervals import gaps, merge_busy
+from main import app
+
+DAY = datetime(2026, 3, 2)
+
+
+def at(hour: int, minute: int = 0) -> datetime:
+    return DAY.replace(hour=hour, minute=minute)
+
+
+async def get_auth_headers():
+    """Helper to get auth headers."""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post(
+            "/auth/signup",
+            json={"email": f"busy{datetime.utcnow().timestamp()}@example.com", "password": "password123", "name": "Busy User"}
+        )
+        return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+EVENTS = [
+    {"title": "Overnight", "start_time": (at(0) - timedelta(hours=2)).isoformat(), "end_time": at(9).isoformat()},
+    {"title": "Standup", "start_time": at(9, 30).isoformat(), "end_time": at(9, 40).isoformat()},
+    {"title": "Planning", "start_time": at(9, 35).isoformat(), "end_time": at(10, 50).isoformat()},
+    {"title": "Lunch", "start_time": at(12).isoformat(), "end_time": at(13).isoformat()},
+    {"title": "Tomorrow", "start_time": (at(9) + timedelta(days=1)).isoformat(), "end_time": (at(10) + timedelta(days=1)).isoformat()},
+]
+
+
+def test_merge_busy_snaps_and_merges_in_order():
+    """Test that busy intervals are clipped, rounded outward to the grid and merged."""
+    intervals = [(at(7), at(9, 10)), (at(9, 20), at(9, 40)), (at(9, 35), at(10)), (at(11), at(11)), (at(17, 50), at(19))]
+
+    busy = merge_busy(intervals, at(8), at(18), timedelta(minutes=30))
+
+    # The zero-length 11:00 entry still takes its slot
+    assert busy == [(at(8), at(10)), (at(11), at(11, 30)), (at(17, 30), at(18))]
+    assert gaps(busy, at(8), at(18)) == [(at(10), at(11)), (at(11, 30), at(17, 30))]
+    assert gaps([], at(8), at(18)) == [(at(8), at(18))]
+
+
+@pytest.mark.asyncio
+async def test_events_in_range_include_overlaps():
+    """Test that a date range returns every event overlapping it, not only ones inside it."""
+    headers = await get_auth_headers()
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        await client.post("/calendar/events/batch", headers=headers, json={"items": EVENTS})
+
+        response = await client.get(
+            "/calendar/events",
+            headers=headers,
+            params={"start_date": at(8).isoformat(), "end_date": at(12).isoformat()},
+        )
+        assert [event["title"] for event in response.json()["data"]] == ["Overnight", "Standup", "Planning"]
+
+        response = await client.get("/calendar/events", headers=headers, params={"start_date": at(13).isoformat()})
+        assert [event["title"] for event in response.json()["data"]] == ["Tomorrow"]
+
+
+@pytest.mark.asyncio
+async def test_free_busy():
+    """Test that free/busy merges overlapping events and reports the whole-slot gaps."""
+    headers = await get_auth_headers()
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        await client.post("/calendar/events/batch", headers=headers, json={"items": EVENTS})
+
+        response = await client.get(
+            "/calendar/free-busy",
+            headers=headers,
+            params={"start": at(8).isoformat(), "end": at(18).isoformat(), "granularity_minutes": 30},
+        )
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert [(slot["start"], slot["end"]) for slot in data["busy"]] == [
+            (at(8).isoformat(), at(9).isoformat()),
+            (at(9, 30).isoformat(), at(11).isoformat()),
+            (at(12).isoformat(), at(13).isoformat()),
+        ]
+        assert [(slot["start"], slot["end"]) for slot in data["free"]] == [
+            (at(9).isoformat(), at(9, 30).isoformat()),
+            (at(11).isoformat(), at(12).isoformat()),
+            (at(13).isoformat(), at(18).isoformat()),
+        ]
+
+        response = await client.get(
+            "/calendar/free-busy", headers=headers, params={"start": at(18).isoformat(), "end": at(8).isoformat()}
+        )
+        assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_zero_length_events_and_inverted_ranges():
+    """Test that point-in-time events are found by range queries and free/busy, and an inverted range is empty."""
+    headers = await get_auth_headers()
+    deadline = {"title": "Deadline", "start_time": at(15).isoformat(), "end_time": at(15).isoformat()}
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        await client.post("/calendar/events/batch", headers=headers, json={"items": [*EVENTS, deadline]})
+
+        for start, end in ((at(14), at(16)), (at(15), at(16)), (at(15), at(15))):
+            response = await client.get(
+                "/calendar/events", headers=headers, params={"start_date": start.isoformat(), "end_date": end.isoformat()}
+            )
+            assert [event["title"] for event in response.json()["data"]] == ["Deadline"]
+
+        response = await client.get(
+            "/calendar/free-busy",
+            headers=headers,
+            params={"start": at(14).isoformat(), "end": at(16).isoformat(), "granularity_minutes": 30},
+        )
+        assert [(slot["start"], slot["end"]) for slot in response.json()["data"]["busy"]] == [
+            (at(15).isoformat(), at(15, 30).isoformat()),
+        ]
+
+        response = await client.get(
+            "/calendar/events", headers=headers, params={"start_date": at(18).isoformat(), "end_date": at(8).isoformat()}
+        )
+        assert response.status_code == 200
+        assert response.json()["data"] == []
@@ -0,0 +1,18 @@
+"""Tests for the shared HTTP client."""
+
+import sys
+import pytest
+from app.utils import http_client
+
+
+@pytest.mark.asyncio
+async def test_client_falls_back_to_http1_without_h2(monkeypatch):
+    """Test that the client still starts, on HTTP/1.1, when h2 can't be imported."""
+    monkeypatch.setattr(http_client.settings, "HTTP2_ENABLED", True)
+    monkeypatch.setitem(sys.modules, "h2", None)
+
+    client = http_client._build_client()
+    try:
+        assert client._transport._pool._http2 is False
+    finally:
+        await client.aclose()
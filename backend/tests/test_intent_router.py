@@ -0,0 +1,36 @@
+"""Tests for the rule-based intent router."""
+
+import pytest
+from app.services.intent_router import IntentRouter
+
+
+@pytest.mark.parametrize("message, tool_name, parameters", [
+    ("calculate 2+2*3", "calculate", {"expression": "2+2*3"}),
+    ("What is (10 + 5) * 2?", "calculate", {"expression": "(10 + 5) * 2"}),
+    ("Set a timer for 5 minutes", "set_timer", {"duration_seconds": 300}),
+    ("Set a timer for: 1 hour and 30 minutes", "set_timer", {"duration_seconds": 5400}),
+    ("remind me in 30 seconds", "set_timer", {"duration_seconds": 30}),
+    ("list my tasks", "list_tasks", {}),
+    ("Show my pending tasks", "list_tasks", {"status": "pending"}),
+    ("What's on my calendar?", "list_events", {}),
+    ("Mark task 1 as done", "complete_task", {"task_id": 1}),
+    ("Delete note 5", "delete_note", {"note_id": 5}),
+    ("Cancel timer 2", "cancel_timer", {"timer_id": 2}),
+    ("Convert 100 USD to EUR", "convert_currency", {"amount": 100.0, "from_currency": "USD", "to_currency": "EUR"}),
+])
+def test_match(message, tool_name, parameters):
+    """Test that unambiguous commands resolve to tool calls."""
+    assert IntentRouter.match(message) == {"tool_name": tool_name, "parameters": parameters}
+
+
+@pytest.mark.parametrize("message", [
+    "Add buy groceries to my todo",
+    "Calculate 15% of 2500",
+    "What is the capital of France?",
+    "Complete buy groceries",
+    "Convert 50 pounds to dollars",
+    "Set a timer for 0 minutes",
+])
+def test_no_match_falls_back(message):
+    """Test that ambiguous or free-form messages fall back to the LLM."""
+    assert IntentRouter.match(message) is None
@@ -0,0 +1,80 @@
+"""Tests for the LLM tool-call extraction cache."""
+
+import pytest
+from app.services.llm_cache import ToolCallCache, normalize_message
+from app.utils.metrics import metrics
+
+
+def test_normalize_message():
+    """Test that case, whitespace and trailing punctuation don't change the key."""
+    assert normalize_message("  Show   my TASKS?! ") == "show my tasks"
+
+
+@pytest.mark.asyncio
+async def test_cache_hit_after_set():
+    """Test that equivalent phrasings hit the cache."""
+    cache = ToolCallCache(max_size=10, ttl_seconds=60)
+    await cache.set("workersai", "Show my tasks", {"tool_name": "list_tasks", "parameters": {}})
+
+    hits = metrics.counter("llm_cache.hit.memory")
+    assert await cache.get("workersai", "show my tasks.") == {"tool_name": "list_tasks", "parameters": {}}
+    assert metrics.counter("llm_cache.hit.memory") == hits + 1
+    assert await cache.get("groq", "show my tasks") is None
+
+
+@pytest.mark.asyncio
+async def test_cache_lru_eviction():
+    """Test that the least recently used entry is evicted when full."""
+    cache = ToolCallCache(max_size=2, ttl_seconds=60)
+    await cache.set("workersai", "list my notes", {"tool_name": "list_notes", "parameters": {}})
+    await cache.set("workersai", "list my tasks", {"tool_name": "list_tasks", "parameters": {}})
+    await cache.get("workersai", "list my notes")
+    await cache.set("workersai", "list my timers", {"tool_name": "list_timers", "parameters": {}})
+
+    assert await cache.get("workersai", "list my tasks") is None
+    assert await cache.get("workersai", "list my notes") is not None
+
+
+@pytest.mark.asyncio
+async def test_cache_ttl_expiry():
+    """Test that expired entries are not served."""
+    cache = ToolCallCache(max_size=10, ttl_seconds=0)
+    await cache.set("workersai", "list my tasks", {"tool_name": "list_tasks", "parameters": {}})
+    assert await cache.get("workersai", "list my tasks") is None
+
+
+@pytest.mark.asyncio
+async def test_time_sensitive_messages_bypass_cache():
+    """Test that relative dates and clock times are never cached."""
+    cache = ToolCallCache(max_size=10, ttl_seconds=60)
+    for message in ["What's on my calendar tomorrow?", "Set alarm for 7am", "meeting next friday at 3"]:
+        assert not cache.is_cacheable(message)
+        await cache.set("workersai", message, {"tool_name": "list_events", "parameters": {}})
+        assert await cache.get("workersai", message) is None
+
+    assert cache.is_cacheable("set a timer for 5 minutes")
+
+
+@pytest.mark.asyncio
+async def test_relative_offsets_bypass_cache():
+    """Test that offsets from now ("in 2 hours", "due in two weeks") are never cached."""
+    cache = ToolCallCache(max_size=10, ttl_seconds=60)
+    for message in [
+        "Set an alarm in 2 hours",
+        "Schedule a meeting in 3 days",
+        "remind me in an hour",
+        "Add a task due in two weeks",
+        "ping me in half an hour",
+    ]:
+        assert not cache.is_cacheable(message)
+
+    assert cache.is_cacheable("show my notes in the work folder")
+
+
+@pytest.mark.asyncio
+async def test_results_with_absolute_dates_not_cached():
+    """Test that an extraction the LLM resolved to a date is not cached, whatever the phrasing."""
+    cache = ToolCallCache(max_size=10, ttl_seconds=60)
+    result = {"tool_name": "create_reminder", "parameters": {"message": "stretch", "trigger_time": "2026-10-18T15:00:00"}}
+    await cache.set("workersai", "remind me to stretch after the standup", result)
+    assert await cache.get("workersai", "remind me to stretch after the standup") is None
@@ -0,0 +1,82 @@
+"""Tests for full-text note search."""
+
+import pytest
+from datetime import datetime
+from httpx import AsyncClient, ASGITransport
+from app.services.note import prefix_tsquery
+from main import app
+
+
+async def get_auth_headers():
+    """Helper to get auth headers."""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post(
+            "/auth/signup",
+            json={"email": f"search{datetime.utcnow().timestamp()}@example.com", "password": "password123", "name": "Search User"}
+        )
+        return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+NOTES = [
+    {"content": "Python tips: use list comprehensions", "tags": "Programming, python"},
+    {"content": "Grocery list: milk, eggs, bread", "tags": "shopping"},
+    {"content": "Meeting notes about the Python migration and Python 3.12 upgrade", "tags": "work"},
+    {"content": "Ideas for the garden", "tags": None},
+]
+
+
+async def search(client, headers, **params):
+    response = await client.get("/notes/search", headers=headers, params=params)
+    assert response.status_code == 200
+    return [note["content"] for note in response.json()["data"]]
+
+
+@pytest.mark.asyncio
+async def test_search_ranks_prefix_matches():
+    """Test that search matches word prefixes and ranks denser matches first."""
+    headers = await get_auth_headers()
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        await client.post("/notes/batch", headers=headers, json={"items": NOTES})
+
+        assert await search(client, headers, q="pyth") == [NOTES[2]["content"], NOTES[0]["content"]]
+        assert await search(client, headers, q="grocer milk") == [NOTES[1]["content"]]
+        assert await search(client, headers, q="gardening") == [NOTES[3]["content"]]
+        assert await search(client, headers, q="%") == []
+
+
+@pytest.mark.asyncio
+async def test_search_filters_tags_exactly():
+    """Test that tag filters match whole tags, ignoring case and spacing."""
+    headers = await get_auth_headers()
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        await client.post("/notes/batch", headers=headers, json={"items": NOTES})
+
+        assert await search(client, headers, tags="PYTHON") == [NOTES[0]["content"]]
+        assert await search(client, headers, tags="shop") == []
+        assert await search(client, headers, tags=" work , shopping") == [NOTES[2]["content"], NOTES[1]["content"]]
+        assert await search(client, headers, q="python", tags="work") == [NOTES[2]["content"]]
+
+
+@pytest.mark.asyncio
+async def test_search_sees_edits_and_other_users_notes_stay_hidden():
+    """Test that the search index follows updates and stays scoped to the owner."""
+    headers = await get_auth_headers()
+    other = await get_auth_headers()
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post("/notes", headers=headers, json={"content": "Call the plumber", "tags": "home"})
+        note_id = response.json()["data"]["id"]
+        await client.put(f"/notes/{note_id}", headers=headers, json={"content": "Call the electrician", "tags": "house"})
+
+        assert await search(client, headers, q="plumber") == []
+        assert await search(client, headers, q="electric", tags="house") == ["Call the electrician"]
+        assert await search(client, other, q="electric") == []
+
+
+def test_prefix_tsquery():
+    """Test that user input becomes a prefix query with no tsquery operators left in it."""
+    assert prefix_tsquery("Pyth tips!") == "pyth:* & tips:*"
+    assert prefix_tsquery("a | b & !c") == "a:* & b:* & c:*"
+    assert prefix_tsquery("':*") == ""
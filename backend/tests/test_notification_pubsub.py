@@ -0,0 +1,115 @@
+"""Tests for cross-process notification pub/sub."""
+
+import asyncio
+import socket
+import threading
+import pytest
+import pytest_asyncio
+from urllib.parse import urlparse
+from app.core.config import get_settings
+from app.websockets.manager import manager
+from app.websockets.pubsub import (
+    InMemoryPubSub,
+    RedisPubSub,
+    notification_bus,
+    publish_notifications,
+    publish_notifications_sync,
+    start_notification_relay,
+    stop_notification_relay,
+)
+
+REDIS_URL = get_settings().CELERY_BROKER_URL
+
+
+class FakeSocket:
+    """Records what the manager sends."""
+
+    def __init__(self):
+        self.sent = []
+
+    async def accept(self):
+        pass
+
+    async def send_json(self, data):
+        self.sent.append(data)
+
+    async def close(self, code=1000):
+        pass
+
+
+def redis_available() -> bool:
+    url = urlparse(REDIS_URL)
+    try:
+        with socket.create_connection((url.hostname, url.port or 6379), timeout=0.5):
+            return True
+    except OSError:
+        return False
+
+
+@pytest_asyncio.fixture
+async def sockets():
+    """Connect fake sockets for users 1 and 2 to the process's manager."""
+    connected = {1: FakeSocket(), 2: FakeSocket()}
+    for user_id, websocket in connected.items():
+        await manager.connect(user_id, websocket)
+    yield connected
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_relay_delivers_published_notifications(sockets):
+    """Test that notifications published anywhere reach the subscribed process's sockets."""
+    assert isinstance(notification_bus, InMemoryPubSub)
+    await start_notification_relay()
+    try:
+        await publish_notifications([(1, "Tea is ready"), (2, "Wake up"), (3, "Not connected here")])
+        # Celery tasks publish from a thread with no event loop
+        thread = threading.Thread(target=publish_notifications_sync, args=([(1, "From a worker")],))
+        thread.start()
+        thread.join()
+        # Let the connections' writers drain their queues
+        await asyncio.sleep(0.01)
+    finally:
+        await stop_notification_relay()
+
+    assert [data["message"] for data in sockets[1].sent] == ["Tea is ready", "From a worker"]
+    assert [data["message"] for data in sockets[2].sent] == ["Wake up"]
+
+
+@pytest.mark.asyncio
+async def test_failed_publish_delivers_locally(sockets, monkeypatch):
+    """Test that notifications still reach this process's sockets when the bus is unreachable."""
+    async def unreachable(message):
+        raise ConnectionError("Redis is down")
+
+    monkeypatch.setattr(notification_bus, "publish", unreachable)
+    await publish_notifications([(1, "Tea is ready")])
+    await asyncio.sleep(0.01)
+
+    assert [data["message"] for data in sockets[1].sent] == ["Tea is ready"]
+    assert sockets[2].sent == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(not redis_available(), reason="Redis is not running")
+async def test_redis_pubsub_fans_out_to_every_subscriber():
+    """Test that each subscribed process receives every message published through Redis."""
+    channel = f"test:notifications:{id(object())}"
+    subscribers = [RedisPubSub(REDIS_URL, channel) for _ in range(2)]
+    publisher = RedisPubSub(REDIS_URL, channel)
+    received = [[], []]
+    for bus, inbox in zip(subscribers, received):
+        async def handler(message, inbox=inbox):
+            inbox.append(message)
+        await bus.subscribe(handler)
+
+    try:
+        await asyncio.sleep(0.2)
+        await publisher.publish({"notifications": [[1, "Hello"]]})
+        await asyncio.to_thread(publisher.publish_sync, {"notifications": [[2, "Again"]]})
+        await asyncio.sleep(0.2)
+    finally:
+        for bus in (*subscribers, publisher):
+            await bus.close()
+
+    assert received[0] == received[1] == [{"notifications": [[1, "Hello"]]}, {"notifications": [[2, "Again"]]}]
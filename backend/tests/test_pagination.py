@@ -0,0 +1,102 @@
+"""Tests for keyset (cursor) pagination of list routes."""
+
+import pytest
+from datetime import datetime
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.services.auth import AuthService
+from app.services.task import TaskService, task_order, tasks
+from app.utils.pagination import InvalidCursorError
+from main import app
+
+
+async def get_auth_headers():
+    """Helper to get auth headers."""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post(
+            "/auth/signup",
+            json={"email": f"page{datetime.utcnow().timestamp()}@example.com", "password": "password123", "name": "Page User"}
+        )
+        return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+async def walk(client, url, headers, limit):
+    """Follow next_cursor from the first page to the last, returning ids in order."""
+    ids, cursor = [], None
+    while True:
+        params = {"limit": limit, **({"cursor": cursor} if cursor else {})}
+        response = await client.get(url, headers=headers, params=params)
+        assert response.status_code == 200
+        body = response.json()
+        ids += [row["id"] for row in body["data"]]
+        cursor = body["next_cursor"]
+        if cursor is None:
+            return ids
+
+
+@pytest.mark.asyncio
+async def test_cursor_pages_match_offset_order():
+    """Test that walking cursors visits every task once, in the same order as offset paging."""
+    headers = await get_auth_headers()
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        await client.post("/tasks/batch", headers=headers, json={"items": [{"title": f"Task {i}"} for i in range(7)]})
+
+        response = await client.get("/tasks", headers=headers, params={"skip": 0, "limit": 100})
+        expected = [task["id"] for task in response.json()["data"]]
+        assert response.json()["next_cursor"] is None
+
+        assert await walk(client, "/tasks", headers, limit=3) == expected
+        assert await walk(client, "/tasks", headers, limit=7) == expected
+
+
+@pytest.mark.asyncio
+async def test_timers_page_soonest_first():
+    """Test that timers page in trigger order."""
+    headers = await get_auth_headers()
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        for seconds in (300, 60, 180, 120):
+            await client.post("/timers/timer", headers=headers, json={"duration_seconds": seconds})
+
+        response = await client.get("/timers", headers=headers)
+        expected = [timer["id"] for timer in response.json()["data"]]
+        assert [timer["duration_seconds"] for timer in response.json()["data"]] == [60, 120, 180, 300]
+        assert await walk(client, "/timers", headers, limit=3) == expected
+
+
+@pytest.mark.asyncio
+async def test_invalid_cursor_is_rejected():
+    """Test that a malformed cursor is a 400, not a server error."""
+    headers = await get_auth_headers()
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        for url in ("/tasks", "/notes", "/timers", "/email/logs"):
+            response = await client.get(url, headers=headers, params={"cursor": "not-a-cursor"})
+            assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_cursor_breaks_ties_on_id(setup_database):
+    """Test that rows sharing a sort value are neither skipped nor repeated across pages."""
+    async with AsyncSession(setup_database, expire_on_commit=False) as db:
+        user = await AuthService.create_user(db, "Ties", "ties@example.com", "password123")
+        created_at = datetime(2026, 1, 1, 12, 0)
+        rows = await tasks.create_many(db, [{"user_id": user.id, "title": f"Tie {i}", "created_at": created_at} for i in range(5)])
+
+        ids, cursor = [], None
+        for _ in range(3):
+            page = await TaskService.get_tasks(db, user.id, limit=2, cursor=cursor)
+            ids += [task.id for task in page]
+            cursor = task_order.next_cursor(page, 2)
+        assert ids == sorted((row.id for row in rows), reverse=True)
+        assert cursor is None
+
+
+def test_cursor_round_trip():
+    """Test that cursors decode to the key they were issued for and reject tampering."""
+    row = type("Row", (), {"created_at": datetime(2026, 1, 1, 12, 0, 0, 500), "id": 42})()
+    assert task_order.decode(task_order.cursor(row)) == (row.created_at, 42)
+
+    with pytest.raises(InvalidCursorError):
+        task_order.decode("eyJhIjoxfQ")
@@ -0,0 +1,52 @@
+"""Tests for the extraction prompt builder."""
+
+import json
+from pathlib import Path
+import pytest
+from app.services.prompt_builder import PromptBuilder, estimate_tokens, select_tools
+from app.utils.prompts import SYSTEM_PROMPT
+from app.utils.tools import TOOLS
+
+CASES = json.loads((Path(__file__).parent.parent / "evals" / "extraction_cases.json").read_text())
+
+
+def test_full_prompt_matches_system_prompt():
+    """Test that the default full prompt is the complete system prompt and tool list."""
+    prompt = PromptBuilder.build("hello", variant="full", tool_subset=False, token_budget=0)
+    assert prompt["system_prompt"] == SYSTEM_PROMPT
+    assert prompt["tools"] == TOOLS
+    assert prompt["prompt_tokens"] == prompt["base_tokens"] + estimate_tokens("hello")
+
+
+def test_compact_prompt_is_smaller():
+    """Test that the compact variant costs less than the full one."""
+    full = PromptBuilder.build("Show my notes", variant="full", tool_subset=False, token_budget=0)
+    compact = PromptBuilder.build("Show my notes", variant="compact", tool_subset=False, token_budget=0)
+    assert compact["prompt_tokens"] < full["prompt_tokens"] / 2
+    assert [tool["function"]["name"] for tool in compact["tools"]] == [tool["function"]["name"] for tool in TOOLS]
+
+
+@pytest.mark.parametrize("case", CASES, ids=[case["message"] for case in CASES])
+def test_tool_subset_keeps_expected_tools(case):
+    """Test that the keyword classifier never drops a tool an eval case needs."""
+    assert {call["tool_name"] for call in case["expected"]} <= set(select_tools(case["message"]))
+
+
+def test_unmatched_message_gets_all_tools():
+    """Test that messages the classifier can't place are offered every tool."""
+    assert len(select_tools("Creat a not about Python tips")) == len(TOOLS)
+
+
+def test_token_budget_falls_back_to_smaller_prompt():
+    """Test that an over-budget prompt falls back to compact, then to the tool subset."""
+    message = "Set a timer for 10 minutes"
+    compact = PromptBuilder.build(message, variant="compact", tool_subset=False, token_budget=0)
+
+    prompt = PromptBuilder.build(message, variant="full", tool_subset=False, token_budget=compact["prompt_tokens"])
+    assert prompt["variant"] == "compact"
+    assert len(prompt["tools"]) == len(TOOLS)
+
+    prompt = PromptBuilder.build(message, variant="full", tool_subset=False, token_budget=compact["prompt_tokens"] - 1)
+    assert prompt["variant"] == "compact"
+    assert "set_timer" in prompt["tool_names"]
+    assert len(prompt["tools"]) < len(TOOLS)
@@ -0,0 +1,68 @@
+"""Tests for the number of statements each service write sends."""
+
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.schemas import CalendarEventCreate, EmailSend, NoteCreate, TaskBatchUpdate, TaskCreate
+from app.services.auth import AuthService
+from app.services.calendar import CalendarService
+from app.services.email import EmailService
+from app.services.note import NoteService
+from app.services.task import TaskService
+from app.services.timer import TimerService
+
+NOW = datetime.utcnow()
+
+CREATES = {
+    "create_task": lambda db, user_id: TaskService.create_task(db, TaskCreate(title="Buy milk"), user_id),
+    "create_note": lambda db, user_id: NoteService.create_note(db, NoteCreate(content="Remember the milk"), user_id),
+    "add_event": lambda db, user_id: CalendarService.add_event(
+        db, CalendarEventCreate(title="Standup", start_time=NOW, end_time=NOW + timedelta(minutes=15)), user_id
+    ),
+    "create_timer": lambda db, user_id: TimerService.create_timer(db, 60, user_id, "tea"),
+    "create_alarm": lambda db, user_id: TimerService.create_alarm(db, NOW + timedelta(hours=8), user_id, "wake up"),
+    "send_email": lambda db, user_id: EmailService.send_email(
+        db, EmailSend(recipient="someone@example.com", subject="Hi", body="Hello"), user_id
+    ),
+    "create_user": lambda db, user_id: AuthService.create_user(db, "Second", "second@example.com", "password123"),
+}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("operation", list(CREATES))
+async def test_create_is_one_statement(operation, setup_database, query_counter):
+    """Test that creates return generated columns from the INSERT itself, without a refresh."""
+    async with AsyncSession(setup_database, expire_on_commit=False) as db:
+        user = await AuthService.create_user(db, "Counter", "counter@example.com", "password123")
+        query_counter.reset()
+
+        row = await CREATES[operation](db, user.id)
+
+        assert query_counter.count == 1
+        assert query_counter.statements[0].lstrip().upper().startswith("INSERT")
+        assert row.id is not None
+        assert getattr(row, "created_at", None) or getattr(row, "sent_at", None)
+        await db.commit()
+
+
+@pytest.mark.asyncio
+async def test_batches_are_one_statement_each(setup_database, query_counter):
+    """Test that batch create, update and delete each send a single statement."""
+    async with AsyncSession(setup_database, expire_on_commit=False) as db:
+        user = await AuthService.create_user(db, "Counter", "counter@example.com", "password123")
+        query_counter.reset()
+
+        rows = await TaskService.create_tasks(db, [TaskCreate(title=f"Task {i}") for i in range(20)], user.id)
+        assert [row.title for row in rows] == [f"Task {i}" for i in range(20)]
+
+        updates = [TaskBatchUpdate(id=row.id, title=f"Renamed {i}") for i, row in enumerate(rows)]
+        updated = await TaskService.update_tasks(db, updates, user.id)
+        assert [row.title for row in updated] == [f"Renamed {i}" for i in range(20)]
+
+        deleted = await TaskService.delete_tasks(db, [row.id for row in rows], user.id)
+        assert deleted == {row.id for row in rows}
+
+        assert [statement.lstrip().split()[0].upper() for statement in query_counter.statements] == [
+            "INSERT", "UPDATE", "DELETE"
+        ]
+        await db.commit()
@@ -0,0 +1,120 @@
+"""EXPLAIN-based checks that hot queries use their indexes on a seeded dataset."""
+
+import pytest
+import random
+from datetime import datetime, timedelta
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models import CalendarEvent, Task, TaskStatus, Timer, TimerStatus, TimerType, User
+from app.services.calendar import CalendarService
+from app.services.task import TaskService
+from app.services.timer import WORKER_ID, in_shard, lease_timers
+
+USERS = 20
+ROWS_PER_USER = 500
+NOW = datetime.utcnow()
+
+
+async def seed(db: AsyncSession) -> list[int]:
+    """Insert a few users with a deep, mostly finished history each."""
+    rng = random.Random(0)
+    result = await db.execute(
+        insert(User).returning(User.id),
+        [{"name": f"User {i}", "email": f"plan{i}@example.com", "password_hash": "x"} for i in range(USERS)],
+    )
+    user_ids = list(result.scalars())
+
+    tasks, timers, events = [], [], []
+    for user_id in user_ids:
+        for i in range(ROWS_PER_USER):
+            created_at = NOW - timedelta(hours=i)
+            tasks.append({
+                "user_id": user_id,
+                "title": f"Task {i}",
+                "status": TaskStatus.PENDING if rng.random() < 0.1 else TaskStatus.COMPLETED,
+                "created_at": created_at,
+            })
+            pending = rng.random() < 0.02
+            timers.append({
+                "user_id": user_id,
+                "type": TimerType.TIMER,
+                "duration_seconds": 60,
+                "trigger_time": NOW + timedelta(minutes=rng.randint(-5, 60)) if pending else created_at,
+                "status": TimerStatus.ACTIVE if pending else TimerStatus.COMPLETED,
+                "is_notified": not pending,
+            })
+            start_time = NOW - timedelta(days=ROWS_PER_USER // 2) + timedelta(days=i)
+            events.append({
+                "user_id": user_id,
+                "title": f"Event {i}",
+                "start_time": start_time,
+                "end_time": start_time + timedelta(hours=1),
+            })
+    for model, rows in ((Task, tasks), (Timer, timers), (CalendarEvent, events)):
+        await db.execute(insert(model), rows)
+    await db.commit()
+
+    connection = await db.connection()
+    await connection.exec_driver_sql("ANALYZE tasks, timers, calendar_events")
+    return user_ids
+
+
+def scans(plan: dict) -> list[dict]:
+    """Flatten a JSON plan into its nodes."""
+    nodes = [plan]
+    for child in plan.get("Plans", []):
+        nodes += scans(child)
+    return nodes
+
+
+async def explain(db: AsyncSession, query_counter, call) -> list[dict]:
+    """Run a service call, then EXPLAIN the statement it sent with the same parameters.
+
+    Plans are forced generic, as they become once asyncpg reuses a prepared statement.
+    """
+    query_counter.reset()
+    await call()
+    statement, parameters = query_counter.statements[-1], query_counter.parameters[-1]
+
+    connection = await db.connection()
+    await connection.exec_driver_sql("SET plan_cache_mode = force_generic_plan")
+    result = await connection.exec_driver_sql("EXPLAIN (FORMAT JSON) " + statement, parameters)
+    return scans(result.scalar()[0]["Plan"])
+
+
+CASES = {
+    "tasks_by_status": (
+        lambda db, user_id: TaskService.get_tasks(db, user_id, status=TaskStatus.PENDING),
+        "tasks",
+        "ix_tasks_user_id_status_created_at_id",
+    ),
+    "tasks_newest_first": (
+        lambda db, user_id: TaskService.get_tasks(db, user_id),
+        "tasks",
+        "ix_tasks_user_id_created_at_id",
+    ),
+    "timer_claim": (
+        lambda db, user_id: db.execute(lease_timers(WORKER_ID, NOW, Timer.trigger_time <= NOW, in_shard(0, 1))),
+        "timers",
+        "ix_timers_pending_trigger_time",
+    ),
+    "calendar_range": (
+        lambda db, user_id: CalendarService.get_events(db, user_id, NOW, NOW + timedelta(days=7)),
+        "calendar_events",
+        "ix_calendar_events_time_range",
+    ),
+}
+
+
+@pytest.mark.asyncio
+async def test_hot_queries_use_indexes(setup_database, query_counter):
+    """Test that no hot query falls back to a sequential scan on a seeded dataset."""
+    async with AsyncSession(setup_database, expire_on_commit=False) as db:
+        user_ids = await seed(db)
+
+        for name, (call, table, index) in CASES.items():
+            nodes = await explain(db, query_counter, lambda: call(db, user_ids[0]))
+            table_scans = [node for node in nodes if node.get("Relation Name") == table or node.get("Index Name") == index]
+            assert table_scans, name
+            assert all(node["Node Type"] != "Seq Scan" for node in table_scans), (name, nodes)
+            assert index in {node.get("Index Name") for node in table_scans}, (name, nodes)
@@ -0,0 +1,108 @@
+"""Tests for resolving items referenced by name in tool calls."""
+
+import pytest
+import pytest_asyncio
+from datetime import datetime, timedelta
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models import Task
+from app.repositories import OwnedRepository
+from app.schemas import CalendarEventCreate, NoteCreate, TaskCreate
+from app.services.auth import AuthService
+from app.services.calendar import CalendarService
+from app.services.note import NoteService
+from app.services.reference_resolver import choose
+from app.services.task import TaskService
+from app.services.tool_executor import ToolExecutor
+
+
+def test_choose_prefers_unique_exact_match():
+    """Test that an exact title wins even when a longer title scores the same."""
+    matches = [("long", "Buy groceries for the party", 1.0), ("exact", "buy  Groceries", 1.0)]
+    assert choose("Buy groceries", matches) == "exact"
+
+
+def test_choose_needs_a_clear_winner():
+    """Test that close scores are ambiguous and a clear lead is not."""
+    assert choose("report", [("a", "Write report", 0.8), ("b", "Send report", 0.75)]) is None
+    assert choose("write report", [("a", "Write report draft", 0.9), ("b", "Send report", 0.5)]) == "a"
+    assert choose("anything", []) is None
+
+
+@pytest.mark.asyncio
+async def test_missing_id_and_name_is_an_error():
+    """Test that a call with neither an ID nor a name asks for one, without a query."""
+    result = await ToolExecutor.execute(None, "complete_task", {}, user_id=1)
+    assert result == {"success": False, "error": "Missing required parameter: task_id or title"}
+
+
+@pytest_asyncio.fixture
+async def trigram_db(setup_database):
+    """A session on a database with pg_trgm, skipping where the extension isn't installed."""
+    async with AsyncSession(setup_database, expire_on_commit=False) as db:
+        try:
+            await db.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+            await db.commit()
+        except DBAPIError:
+            pytest.skip("pg_trgm extension is not available")
+        yield db
+
+
+@pytest.mark.asyncio
+async def test_tools_resolve_names(trigram_db):
+    """Test completing and deleting items by name, and reporting ambiguity."""
+    db = trigram_db
+    user = await AuthService.create_user(db, "Names", "names@example.com", "password123")
+    for title in ("Buy groceries", "Write report", "Send report", "Call mom"):
+        await TaskService.create_task(db, TaskCreate(title=title), user.id)
+    now = datetime.utcnow()
+    await CalendarService.add_event(db, CalendarEventCreate(title="Dentist appointment", start_time=now, end_time=now + timedelta(hours=1)), user.id)
+    await NoteService.create_note(db, NoteCreate(content="Python tips: use list comprehensions"), user.id)
+
+    result = await ToolExecutor.execute(db, "complete_task", {"title": "buy grocerie"}, user.id)
+    assert result["success"] and result["data"]["title"] == "Buy groceries"
+
+    # Already completed, so it no longer matches
+    result = await ToolExecutor.execute(db, "complete_task", {"title": "buy groceries"}, user.id)
+    assert result == {"success": False, "error": "No task matches 'buy groceries'"}
+
+    result = await ToolExecutor.execute(db, "delete_task", {"title": "report"}, user.id)
+    assert not result["success"]
+    assert {candidate["title"] for candidate in result["data"]["candidates"]} == {"Write report", "Send report"}
+
+    result = await ToolExecutor.execute(db, "delete_event", {"title": "dentist"}, user.id)
+    assert result["success"]
+    result = await ToolExecutor.execute(db, "delete_note", {"content": "python tips"}, user.id)
+    assert result["success"]
+
+    other = await AuthService.create_user(db, "Other", "other@example.com", "password123")
+    result = await ToolExecutor.execute(db, "delete_task", {"title": "call mom"}, other.id)
+    assert result == {"success": False, "error": "No task matches 'call mom'"}
+    await db.commit()
+
+
+@pytest.mark.asyncio
+async def test_match_filter_agrees_with_score(trigram_db):
+    """Test that `%>` keeps exactly the rows whose word similarity reaches the threshold, best first."""
+    db = trigram_db
+    user = await AuthService.create_user(db, "Scores", "scores@example.com", "password123")
+    for title in ("Buy groceries", "Groceries for the party", "Grocery store receipt", "Call mom"):
+        await TaskService.create_task(db, TaskCreate(title=title), user.id)
+
+    matches = await OwnedRepository(Task).match(db, user.id, Task.title, "buy grocerie", limit=10)
+    # Only defined once pg_trgm is loaded into the session
+    threshold = float((await db.execute(text("SHOW pg_trgm.word_similarity_threshold"))).scalar())
+    scores = {
+        title: score
+        for title, score in (await db.execute(
+            text("SELECT title, word_similarity('buy grocerie', title) FROM tasks WHERE user_id = :user_id"),
+            {"user_id": user.id},
+        )).all()
+    }
+
+    assert [task.title for task, _ in matches][0] == "Buy groceries"
+    assert [score for _, score in matches] == sorted((score for _, score in matches), reverse=True)
+    assert {task.title for task, _ in matches} == {title for title, score in scores.items() if score >= threshold}
+    assert "Call mom" not in {task.title for task, _ in matches}
+    await db.rollback()
@@ -0,0 +1,18 @@
+"""Tests for pre-serialized LLM request bodies."""
+
+import json
+import pytest
+from app.utils.request_template import PLACEHOLDER, RequestTemplate
+
+
+def test_render_splices_value():
+    """Test that the rendered body matches serializing the full request."""
+    template = RequestTemplate({"messages": [{"role": "user", "content": PLACEHOLDER}], "max_tokens": 500})
+    message = 'Say "hi" to José\nthen stop'
+    assert json.loads(template.render(message)) == {"messages": [{"role": "user", "content": message}], "max_tokens": 500}
+
+
+def test_template_requires_single_placeholder():
+    """Test that a template without exactly one placeholder is rejected."""
+    with pytest.raises(ValueError):
+        RequestTemplate({"content": "no placeholder"})
@@ -0,0 +1,61 @@
+"""Tests for task routes."""
+
+import pytest
+from datetime import datetime
+from httpx import AsyncClient, ASGITransport
+from main import app
+
+
+async def get_auth_token():
+    """Helper to get auth token."""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post(
+            "/auth/signup",
+            json={"email": f"task{datetime.utcnow().timestamp()}@example.com", "password": "password123", "name": "Task User"}
+        )
+        return response.json()["access_token"]
+
+
+@pytest.mark.asyncio
+async def test_update_complete_and_delete_task():
+    """Test updating, completing and deleting a task."""
+    token = await get_auth_token()
+    headers = {"Authorization": f"Bearer {token}"}
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        create_response = await client.post("/tasks", headers=headers, json={"title": "Write report"})
+        task_id = create_response.json()["data"]["id"]
+
+        response = await client.put(f"/tasks/{task_id}", headers=headers, json={"title": "Write final report", "priority": "high"})
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert data["title"] == "Write final report"
+        assert data["priority"] == "high"
+        assert data["status"] == "pending"
+
+        response = await client.post(f"/tasks/{task_id}/complete", headers=headers)
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert data["status"] == "completed"
+        assert data["completed_at"] is not None
+        assert data["title"] == "Write final report"
+
+        response = await client.delete(f"/tasks/{task_id}", headers=headers)
+        assert response.status_code == 200
+
+        response = await client.delete(f"/tasks/{task_id}", headers=headers)
+        assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_update_missing_task():
+    """Test updating or completing a task that doesn't exist."""
+    token = await get_auth_token()
+    headers = {"Authorization": f"Bearer {token}"}
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.put("/tasks/999999", headers=headers, json={"title": "Nope"})
+        assert response.status_code == 404
+
+        response = await client.post("/tasks/999999/complete", headers=headers)
+        assert response.status_code == 404
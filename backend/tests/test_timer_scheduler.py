@@ -0,0 +1,73 @@
+"""Tests for the in-process timer scheduler."""
+
+import asyncio
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from app.backgroundjobs.timer_scheduler import TimerScheduler
+from app.models import Notification, Timer, TimerStatus
+from app.services.auth import AuthService
+from app.services.timer import TimerService
+from app.utils.metrics import metrics
+from tests.conftest import TEST_DATABASE_URL
+
+
+def test_heap_skips_moved_and_cancelled_timers():
+    """Test that only a timer's latest schedule fires, and cancelled ones don't."""
+    scheduler = TimerScheduler(horizon=timedelta(minutes=5))
+    now = datetime.utcnow()
+    scheduler._loaded_until = now + timedelta(minutes=5)
+
+    scheduler.schedule(1, now + timedelta(seconds=1))
+    scheduler.schedule(2, now + timedelta(seconds=2))
+    scheduler.schedule(1, now + timedelta(seconds=3))
+    scheduler.schedule(3, now + timedelta(seconds=2))
+    scheduler.unschedule(3)
+    scheduler.schedule(4, now + timedelta(hours=1))
+
+    assert scheduler.next_due() == now + timedelta(seconds=2)
+    assert scheduler.pop_due(now + timedelta(seconds=10)) == [
+        (now + timedelta(seconds=2), 2),
+        (now + timedelta(seconds=3), 1),
+    ]
+    assert scheduler.next_due() is None
+
+
+@pytest.mark.asyncio
+async def test_scheduler_fires_timers_at_trigger_time(setup_database):
+    """Test that overdue timers are recovered, new ones fire on time and cancelled ones don't."""
+    session_factory = async_sessionmaker(setup_database, class_=AsyncSession, expire_on_commit=False)
+    async with session_factory() as db:
+        user = await AuthService.create_user(db, "Sleeper", "sleeper@example.com", "password123")
+        overdue = await TimerService.create_alarm(db, datetime.utcnow() - timedelta(minutes=1), user.id, "missed")
+        await db.commit()
+
+    scheduler = TimerScheduler(session_factory, listen_url=TEST_DATABASE_URL, horizon=timedelta(minutes=5))
+    fired_before = metrics.snapshot()["timings"].get("timer.fire_lag", {}).get("count", 0)
+    await scheduler.start()
+    try:
+        await asyncio.sleep(0.3)
+        async with session_factory() as db:
+            soon = await TimerService.create_timer(db, 1, user.id, "tea")
+            cancelled = await TimerService.create_timer(db, 1, user.id, "cancelled")
+            later = await TimerService.create_alarm(db, datetime.utcnow() + timedelta(hours=1), user.id, "later")
+            await db.commit()
+            await TimerService.cancel_timer(db, cancelled.id, user.id)
+            await db.commit()
+
+        await asyncio.sleep(1.5)
+    finally:
+        await scheduler.stop()
+
+    async with session_factory() as db:
+        rows = {timer.id: timer for timer in (await db.execute(select(Timer))).scalars()}
+        notifications = (await db.execute(select(func.count()).select_from(Notification))).scalar()
+
+    assert rows[overdue.id].status == TimerStatus.COMPLETED
+    assert rows[soon.id].status == TimerStatus.COMPLETED
+    assert rows[soon.id].completed_at - rows[soon.id].trigger_time < timedelta(milliseconds=500)
+    assert rows[cancelled.id].status == TimerStatus.CANCELLED
+    assert rows[later.id].status == TimerStatus.ACTIVE
+    assert notifications == 2
+    assert metrics.snapshot()["timings"]["timer.fire_lag"]["count"] == fired_before + 2
@@ -0,0 +1,120 @@
+"""Tests for the Celery timer sweep."""
+
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine, event, func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from app.backgroundjobs.timer_tasks import fire_due_timers
+from app.models import Notification, Timer, TimerStatus, TimerType
+from app.services.auth import AuthService
+from tests.conftest import TEST_DATABASE_URL
+
+
+async def seed_due_timers(engine, users: int, per_user: int, now: datetime, **values) -> list[int]:
+    """Insert timers due by `now` for several users, returning the user ids."""
+    async with AsyncSession(engine, expire_on_commit=False) as db:
+        user_ids = [
+            (await AuthService.create_user(db, f"User {i}", f"user{i}@example.com", "password123")).id
+            for i in range(users)
+        ]
+        await db.execute(insert(Timer), [
+            {"user_id": user_id, "type": TimerType.ALARM, "trigger_time": now - timedelta(seconds=i), **values}
+            for user_id in user_ids
+            for i in range(per_user)
+        ])
+        await db.commit()
+    return user_ids
+
+
+def sync_engine():
+    return create_engine(TEST_DATABASE_URL.replace("+asyncpg", ""), client_encoding="utf8")
+
+
+@pytest.mark.asyncio
+async def test_due_timers_fire_in_batches(setup_database):
+    """Test that a burst of due timers is claimed and notified a batch per statement."""
+    now = datetime.utcnow()
+    async with AsyncSession(setup_database, expire_on_commit=False) as db:
+        user = await AuthService.create_user(db, "Burst", "burst@example.com", "password123")
+        rows = [
+            {"user_id": user.id, "type": TimerType.ALARM, "trigger_time": now - timedelta(seconds=i % 60), "label": f"Alarm {i}"}
+            for i in range(250)
+        ]
+        rows.append({"user_id": user.id, "type": TimerType.ALARM, "trigger_time": now + timedelta(hours=1)})
+        rows.append({"user_id": user.id, "type": TimerType.ALARM, "trigger_time": now, "status": TimerStatus.CANCELLED})
+        await db.execute(insert(Timer), rows)
+        await db.commit()
+
+    engine = sync_engine()
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda conn, cursor, statement, *args: statements.append(statement))
+    try:
+        with Session(engine, expire_on_commit=False) as db:
+            fired = fire_due_timers(db, now, batch_size=100)
+    finally:
+        engine.dispose()
+
+    assert len(fired) == len({timer.id for timer in fired}) == 250
+    assert [statement.lstrip().split()[0].upper() for statement in statements] == ["UPDATE", "UPDATE", "INSERT"] * 3
+    async with AsyncSession(setup_database) as db:
+        statuses = dict((await db.execute(select(Timer.status, func.count()).group_by(Timer.status))).all())
+        notifications = (await db.execute(select(func.count()).select_from(Notification))).scalar()
+    assert statuses == {TimerStatus.COMPLETED: 250, TimerStatus.ACTIVE: 1, TimerStatus.CANCELLED: 1}
+    assert notifications == 250
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("shards", [1, 2])
+async def test_parallel_workers_fire_each_timer_once(setup_database, shards):
+    """Test that workers sweeping at once, in one shard or split by user, fire every timer exactly once."""
+    now = datetime.utcnow()
+    await seed_due_timers(setup_database, users=8, per_user=150, now=now)
+    workers = [(f"worker-{i}", (i % shards, shards)) for i in range(4)]
+
+    engine = sync_engine()
+
+    def sweep(worker: str, shard: tuple[int, int]) -> list[int]:
+        with Session(engine, expire_on_commit=False) as db:
+            return [timer.id for timer in fire_due_timers(db, now, worker=worker, shard=shard, batch_size=40)]
+
+    try:
+        with ThreadPoolExecutor(len(workers)) as pool:
+            fired = list(pool.map(lambda args: sweep(*args), workers))
+    finally:
+        engine.dispose()
+
+    fired_ids = [timer_id for ids in fired for timer_id in ids]
+    assert len(fired_ids) == len(set(fired_ids)) == 8 * 150
+    async with AsyncSession(setup_database) as db:
+        notified = (await db.execute(select(Notification.timer_id))).scalars().all()
+        leases = dict((await db.execute(select(Timer.id, Timer.leased_by))).all())
+    assert sorted(notified) == sorted(fired_ids)
+    for (worker, _), ids in zip(workers, fired):
+        assert all(leases[timer_id] == worker for timer_id in ids)
+
+
+@pytest.mark.asyncio
+async def test_expired_leases_are_taken_over(setup_database):
+    """Test that timers leased by a worker that died are fired once the lease expires."""
+    now = datetime.utcnow()
+    await seed_due_timers(setup_database, 1, 5, now, leased_by="crashed", lease_expires_at=now - timedelta(seconds=1))
+    async with AsyncSession(setup_database) as db:
+        await db.execute(
+            update(Timer).where(Timer.id <= 2).values(leased_by="busy", lease_expires_at=now + timedelta(minutes=1))
+        )
+        await db.commit()
+
+    engine = sync_engine()
+    try:
+        with Session(engine, expire_on_commit=False) as db:
+            fired = fire_due_timers(db, now, worker="rescuer")
+            fired_again = fire_due_timers(db, now, worker="rescuer")
+    finally:
+        engine.dispose()
+
+    assert len(fired) == 3
+    assert fired_again == []
+    assert {timer.leased_by for timer in fired} == {"rescuer"}
+    assert all(timer.id > 2 for timer in fired)
@@ -0,0 +1,88 @@
+"""Tests for the tool registry and argument validation."""
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models import Task
+from app.services.auth import AuthService
+from app.services.tool_executor import TOOL_HANDLERS, VALIDATORS, ToolExecutor
+from app.utils.metrics import metrics
+from app.utils.prompts import SYSTEM_PROMPT
+from app.utils.tool_validation import ToolArgumentError
+from app.utils.tools import TOOLS
+
+
+def test_registry_covers_every_tool():
+    """Test that every tool sent to the LLM has a handler and appears in the prompt."""
+    names = {tool["function"]["name"] for tool in TOOLS}
+    assert names == TOOL_HANDLERS.keys()
+    for name in names:
+        assert f"**{name}**" in SYSTEM_PROMPT
+
+
+def test_validator_coerces_arguments():
+    """Test that LLM-style string numbers and enum casing are normalized."""
+    assert VALIDATORS["complete_task"]({"task_id": "3"}) == {"task_id": 3}
+    assert VALIDATORS["convert_currency"]({"amount": "12.5", "from_currency": "USD", "to_currency": "EUR"})["amount"] == 12.5
+    assert VALIDATORS["create_task"]({"title": "Buy milk", "priority": "High", "extra": 1, "due_date": None}) == {
+        "title": "Buy milk",
+        "priority": "high",
+    }
+
+
+@pytest.mark.parametrize("tool_name, arguments, error", [
+    ("create_task", {}, "Missing required parameter: title"),
+    ("complete_task", {"task_id": "abc"}, "task_id must be an integer"),
+    ("list_tasks", {"status": "someday"}, "status must be one of: pending, completed, cancelled"),
+])
+def test_validator_rejects_invalid_arguments(tool_name, arguments, error):
+    """Test that invalid arguments raise a descriptive error."""
+    with pytest.raises(ToolArgumentError, match=error):
+        VALIDATORS[tool_name](arguments)
+
+
+@pytest.mark.asyncio
+async def test_execute_invalid_arguments_returns_error():
+    """Test that invalid arguments are reported without calling the handler."""
+    before = metrics.counter("tool.delete_note.invalid")
+    result = await ToolExecutor.execute(None, "delete_note", {"note_id": "five"}, user_id=1)
+    assert result == {"success": False, "error": "note_id must be an integer"}
+    assert metrics.counter("tool.delete_note.invalid") == before + 1
+
+
+@pytest.mark.asyncio
+async def test_execute_records_timing():
+    """Test that each tool call is timed under its own name."""
+    result = await ToolExecutor.execute(None, "calculate", {"expression": "2 + 3"}, user_id=1)
+    assert result["data"]["result"] == 5
+    assert metrics.snapshot()["timings"]["tool.calculate"]["count"] >= 1
+
+
+@pytest.mark.asyncio
+async def test_execute_unknown_tool():
+    """Test that unknown tools return an error."""
+    result = await ToolExecutor.execute(None, "add_reminder", {}, user_id=1)
+    assert result == {"success": False, "error": "Unknown tool: add_reminder"}
+
+
+@pytest.mark.asyncio
+async def test_execute_many_isolates_a_failing_call(setup_database):
+    """Test that a call raising mid-batch becomes its own error, and the other calls still run and commit."""
+    async with AsyncSession(setup_database, expire_on_commit=False) as db:
+        user = await AuthService.create_user(db, "Batch", "batch-tools@example.com", "password123")
+        await db.commit()
+
+        results = await ToolExecutor.execute_many(db, [
+            {"tool_name": "create_task", "parameters": {"title": "Before"}},
+            # Longer than the title column, so the INSERT fails in the database
+            {"tool_name": "create_task", "parameters": {"title": "x" * 600}},
+            {"tool_name": "calculate", "parameters": {"expression": "6 * 7"}},
+            {"tool_name": "create_task", "parameters": {"title": "After"}},
+        ], user.id)
+        await db.commit()
+
+        assert [result["success"] for result in results] == [True, False, True, True]
+        assert "too long" in results[1]["error"]
+        assert results[2]["data"]["result"] == 42
+        titles = (await db.execute(select(Task.title).where(Task.user_id == user.id))).scalars().all()
+        assert sorted(titles) == ["After", "Before"]
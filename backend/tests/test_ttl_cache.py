@@ -0,0 +1,30 @@
+"""Tests for the shared two-tier TTL cache."""
+
+import pytest
+from app.utils.metrics import metrics
+from app.utils.ttl_cache import TTLCache
+
+
+@pytest.mark.asyncio
+async def test_delete_drops_value():
+    """Test that a deleted key is a miss."""
+    cache = TTLCache("test_cache", max_size=10, ttl_seconds=60)
+    await cache.set("a", "1")
+    assert await cache.get("a") == "1"
+
+    await cache.delete("a")
+    assert await cache.get("a") is None
+
+
+@pytest.mark.asyncio
+async def test_unreachable_redis_is_a_miss():
+    """Test that Redis errors fall back to the in-process tier instead of failing."""
+    cache = TTLCache("test_cache", max_size=10, ttl_seconds=60, redis_url="redis://localhost:1/0")
+    misses = metrics.counter("test_cache.miss")
+    assert await cache.get("a") is None
+    assert metrics.counter("test_cache.miss") == misses + 1
+
+    await cache.set("a", "1")
+    assert await cache.get("a") == "1"
+    await cache.delete("a")
+    assert await cache.get("a") is None
@@ -0,0 +1,122 @@
+"""Tests for the WebSocket connection manager."""
+
+import asyncio
+import pytest
+import pytest_asyncio
+from app.websockets.manager import ConnectionManager
+
+
+class FakeSocket:
+    """Records what it is sent; a blocked socket stalls every send until released."""
+
+    def __init__(self, blocked: bool = False, fail: bool = False):
+        self.sent = []
+        self.closed_with = None
+        self.fail = fail
+        self.unblocked = asyncio.Event()
+        if not blocked:
+            self.unblocked.set()
+
+    async def accept(self):
+        pass
+
+    async def send_json(self, data):
+        if self.fail:
+            raise ConnectionResetError("gone")
+        await self.unblocked.wait()
+        self.sent.append(data)
+
+    async def close(self, code=1000):
+        self.closed_with = code
+
+
+async def drain():
+    """Let the connections' writers run."""
+    await asyncio.sleep(0.01)
+
+
+@pytest_asyncio.fixture
+async def manager():
+    manager = ConnectionManager(queue_size=4)
+    yield manager
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_every_connection_of_a_user_receives_notifications(manager):
+    """Test that a user's tabs and devices each get the notification."""
+    laptop, phone, other = FakeSocket(), FakeSocket(), FakeSocket()
+    await manager.connect(1, laptop)
+    phone_connection = await manager.connect(1, phone)
+    await manager.connect(2, other)
+
+    await manager.send_notifications([(1, "Tea is ready")])
+    await drain()
+    assert laptop.sent == phone.sent == [{"type": "notification", "message": "Tea is ready"}]
+    assert other.sent == []
+
+    # Closing one tab leaves the others connected
+    manager.disconnect(phone_connection)
+    await manager.send_notification(1, "Again")
+    await drain()
+    assert [data["message"] for data in laptop.sent] == ["Tea is ready", "Again"]
+    assert len(phone.sent) == 1
+    assert manager.connection_count() == 2
+
+
+@pytest.mark.asyncio
+async def test_slow_client_drops_oldest_without_blocking_others(manager):
+    """Test that a stalled socket loses its oldest messages, is told how many, and doesn't delay anyone else."""
+    slow, fast = FakeSocket(blocked=True), FakeSocket()
+    await manager.connect(1, slow)
+    await manager.connect(2, fast)
+
+    for i in range(10):
+        await manager.send_notifications([(1, f"n{i}"), (2, f"n{i}")])
+        await drain()
+    assert [data["message"] for data in fast.sent] == [f"n{i}" for i in range(10)]
+
+    slow.unblocked.set()
+    await drain()
+    # n0 was already being sent; of the other nine only the last four fit the queue
+    assert slow.sent == [
+        {"type": "notification", "message": "n0"},
+        {"type": "dropped", "count": 5},
+        *({"type": "notification", "message": f"n{i}"} for i in range(6, 10)),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_heartbeat_pings_and_evicts_idle_connections(manager):
+    """Test that the heartbeat pings live connections once and closes ones idle too long."""
+    live, stalled, idle = FakeSocket(), FakeSocket(blocked=True), FakeSocket()
+    await manager.connect(1, live)
+    await manager.connect(1, stalled)
+    idle_connection = await manager.connect(2, idle)
+    await manager.send_notification(1, "busy")
+    idle_connection.last_seen -= 3600
+
+    for _ in range(2):
+        await manager.heartbeat()
+        await drain()
+    assert live.sent == [{"type": "notification", "message": "busy"}, {"type": "ping"}, {"type": "ping"}]
+    assert idle.closed_with == 1001
+    assert 2 not in manager.active_connections
+
+    # Pings queued behind a stalled send coalesce into one
+    stalled.unblocked.set()
+    await drain()
+    assert stalled.sent == [{"type": "notification", "message": "busy"}, {"type": "ping"}]
+
+
+@pytest.mark.asyncio
+async def test_failed_send_evicts_connection(manager):
+    """Test that a socket that errors on send is closed and removed."""
+    broken = FakeSocket(fail=True)
+    await manager.connect(1, broken)
+
+    await manager.send_notification(1, "Hello")
+    await drain()
+    assert broken.closed_with == 1011
+    assert manager.active_connections == {}
+    assert manager._tasks == set()
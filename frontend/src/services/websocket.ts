@@ -22,6 +22,11 @@ class WebSocketService {
     this.ws.onmessage = (event) => {
       try {
         const data = JSON.parse(event.data);
+        // The server evicts connections that stop answering its heartbeat
+        if (data.type === 'ping') {
+          this.ws?.send(JSON.stringify({ type: 'pong' }));
+          return;
+        }
         this.messageHandlers.forEach(handler => handler(data));
       } catch (error) {
         console.error('WebSocket message parse error:', error);